@@ -0,0 +1,105 @@
+"""
+Throughput benchmark of the read path under concurrency: the synchronous
+services on a thread pool (one worker, and one pooled connection, per in-flight
+request, like the Flask app) against the asyncio services on a single event loop.
+
+Each request pages through cocktail revisions and loads the recipes of the page,
+as GET /cocktails does. Run from the server directory against a populated
+database (the PG_* settings):
+    python -m benchmarks.bench_async_throughput --requests 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from src.database.async_engine_registry import dispose_async_engines
+from src.models.services.async_cocktail_service import AsyncCocktailService
+from src.models.services.cocktail_service import CocktailService
+
+
+def _get_page_starts(page_size: int) -> List[Optional[int]]:
+    """
+    Returns the after_id of every page of the catalog.
+    """
+    service = CocktailService()
+    starts, after_id = [None], None
+    while True:
+        page = service.fetch_cocktail_revisions_page(after_id, page_size)
+        if len(page) < page_size:
+            return starts
+        after_id = page[-1][0]
+        starts.append(after_id)
+
+
+def _sync_request(service: CocktailService, after_id, page_size: int) -> int:
+    with service.get_session() as session:
+        revisions = service.fetch_cocktail_revisions_page(
+            after_id, page_size, session=session
+        )
+        cocktails = service.load_recipes([id for id, _ in revisions], session=session)
+    return len(cocktails)
+
+
+async def _async_request(service: AsyncCocktailService, after_id, page_size) -> int:
+    async with service.get_session() as session:
+        revisions = await service.fetch_cocktail_revisions_page(
+            after_id, page_size, session=session
+        )
+        cocktails = await service.load_recipes(
+            [id for id, _ in revisions], session=session
+        )
+    return len(cocktails)
+
+
+def run_sync(starts: List[Optional[int]], concurrency: int, page_size: int) -> float:
+    service = CocktailService()
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(
+            executor.map(lambda start: _sync_request(service, start, page_size), starts)
+        )
+    return time.perf_counter() - began
+
+
+async def run_async(
+    starts: List[Optional[int]], concurrency: int, page_size: int
+) -> float:
+    service = AsyncCocktailService()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(start):
+        async with semaphore:
+            return await _async_request(service, start, page_size)
+
+    began = time.perf_counter()
+    await asyncio.gather(*(request(start) for start in starts))
+    elapsed = time.perf_counter() - began
+    await dispose_async_engines()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+
+    page_starts = _get_page_starts(args.page_size)
+    starts = random.Random(0).choices(page_starts, k=args.requests)
+
+    sync_seconds = run_sync(starts, args.concurrency, args.page_size)
+    async_seconds = asyncio.run(run_async(starts, args.concurrency, args.page_size))
+    print(f"{args.requests} requests, concurrency {args.concurrency}")
+    print(f"sync (threads): {args.requests / sync_seconds:10.1f} req/s")
+    print(f"asyncio:        {args.requests / async_seconds:10.1f} req/s")
+    print(f"speedup:        {sync_seconds / async_seconds:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark of rendering the instructions of a whole catalog: the per-object path
+(each cocktail loaded through the ORM, its steps lazy loaded and rendered by
+Cocktail.get_human_readable_instructions) against the batch path
+(CocktailService.render_instructions_for_cocktails: one query into a frame,
+rendered with grouped operations). Checks that both render the same text and
+reports the speedup against the 10x target.
+
+Run from the server directory, against the configured database (the PG_*
+settings, migrated) or an embedded SQLite stand-in. An empty catalog is
+generated first (see synthetic_catalog); an existing one is benchmarked as is:
+    python -m benchmarks.bench_batch_rendering --cocktails 10000
+    python -m benchmarks.bench_batch_rendering --database-url sqlite://
+"""
+
+import argparse
+import time
+import timeit
+
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import Engine, create_engine, select
+
+from benchmarks.synthetic_catalog import (
+    CatalogScale,
+    create_schema,
+    generate_catalog,
+    is_catalog_empty,
+)
+from src.database.constants import POSTGRESQL__PSYCOPG2__DB_URI as pg_uri
+from src.database.engine_registry import get_engine, register_engine
+from src.models.cocktail import Cocktail
+from src.models.services.cocktail_service import CocktailService
+
+TARGET_SPEEDUP = 10
+
+
+def _connect(database_url: Optional[str]) -> Engine:
+    if database_url is None:
+        return get_engine(pg_uri)
+    engine = create_engine(database_url)
+    register_engine(pg_uri, engine)
+    return engine
+
+
+def _get_cocktail_ids(service: CocktailService, count: int) -> List[int]:
+    with service.get_session() as session:
+        return list(
+            session.execute(select(Cocktail.id).order_by(Cocktail.id).limit(count))
+            .scalars()
+            .all()
+        )
+
+
+def _best_of(function: Callable, repeat: int) -> float:
+    return min(timeit.repeat(function, repeat=repeat, number=1))
+
+
+def render_per_object(
+    service: CocktailService, cocktail_ids: List[int]
+) -> Dict[int, str]:
+    with service.get_session() as session:
+        return {
+            cocktail_id: session.get(
+                Cocktail, cocktail_id
+            ).get_human_readable_instructions()
+            for cocktail_id in cocktail_ids
+        }
+
+
+def render_batch(service: CocktailService, cocktail_ids: List[int]) -> Dict[int, str]:
+    with service.get_session() as session:
+        return service.render_instructions_for_cocktails(cocktail_ids, session=session)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", help="e.g. sqlite:// for the stand-in")
+    parser.add_argument("--cocktails", type=int, default=CatalogScale.cocktails)
+    parser.add_argument("--steps", type=int, default=CatalogScale.steps)
+    parser.add_argument("--ingredients", type=int, default=CatalogScale.ingredients)
+    parser.add_argument("--seed", type=int, default=CatalogScale.seed)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    engine = _connect(args.database_url)
+    create_schema(engine)
+    if is_catalog_empty(engine):
+        started = time.perf_counter()
+        generate_catalog(
+            engine,
+            CatalogScale(
+                cocktails=args.cocktails,
+                steps=args.steps,
+                ingredients=args.ingredients,
+                seed=args.seed,
+            ),
+        )
+        print(f"Generated the catalog in {time.perf_counter() - started:.1f}s")
+
+    service = CocktailService()
+    cocktail_ids = _get_cocktail_ids(service, args.cocktails)
+    if not cocktail_ids:
+        raise SystemExit("No cocktails in the database")
+    per_object = render_per_object(service, cocktail_ids)
+    batch = render_batch(service, cocktail_ids)
+    assert per_object == batch, "Per-object and batch instructions differ"
+
+    per_object_seconds = _best_of(
+        lambda: render_per_object(service, cocktail_ids), args.repeat
+    )
+    batch_seconds = _best_of(lambda: render_batch(service, cocktail_ids), args.repeat)
+    speedup = per_object_seconds / batch_seconds
+    print(f"{len(cocktail_ids)} cocktails ({engine.dialect.name})")
+    print(f"per-object: {per_object_seconds * 1e3:10.1f} ms")
+    print(f"batch:      {batch_seconds * 1e3:10.1f} ms")
+    print(
+        f"speedup:    {speedup:10.1f}x "
+        f"({'meets' if speedup >= TARGET_SPEEDUP else 'misses'} the "
+        f"{TARGET_SPEEDUP}x target)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Micro-benchmark of step instruction rendering: the original per-call
+implementation (new inflect engine per plural, repeated Decimal formatting and
+str.replace/re.sub passes) against the cached, precompiled instruction renderer.
+
+Run from the server directory:
+    python -m benchmarks.bench_instruction_rendering
+"""
+
+import re
+import timeit
+
+from decimal import Decimal
+
+import inflect
+
+from src.helpers.instruction_renderer import (
+    get_rendering_cache_info,
+    render_instructions,
+)
+from src.models.constants import (
+    PLURALIZABLE_MEASURING_UNITS,
+    ActionToHumanReadableMapper,
+    CocktailGlassware,
+    MeasuringUnit,
+    MixologyTool,
+    StepAction,
+)
+
+RECIPE = [
+    (StepAction.ADD_INGREDIENT, "lime", MeasuringUnit.PIECE, 8, None),
+    (StepAction.MUDDLE, "lime", None, None, None),
+    (StepAction.ADD_INGREDIENT, "sugar", MeasuringUnit.GRAM, 20, None),
+    (StepAction.ADD_INGREDIENT, "ice", None, 5, None),
+    (StepAction.ADD_INGREDIENT, "cachaça", MeasuringUnit.ML, 80, None),
+    (StepAction.SHAKE, None, None, None, MixologyTool.COCKTAIL_SHAKER),
+    (StepAction.ADD_INGREDIENT, "angostura", MeasuringUnit.DASH, 2, None),
+    (StepAction.STIR, None, None, None, MixologyTool.STIRRING_SPOON),
+    (StepAction.POUR, None, None, None, None),
+    (StepAction.DECORATE, None, None, None, None),
+]
+GLASSWARE = CocktailGlassware.OLD_FASHIONED
+
+
+def _legacy_pluralize_word(word):
+    return inflect.engine().plural(word)
+
+
+def _legacy_quantity_to_normalized_string(quantity=None):
+    if quantity is None:
+        return None
+    normalized_quantity = Decimal(quantity).normalize()
+    return (
+        format(normalized_quantity, "f").rstrip("0").rstrip(".")
+        if "." in format(normalized_quantity, "f")
+        else format(normalized_quantity, "f")
+    )
+
+
+def _legacy_measured_ingredient(ingredient_name, measuring_unit, quantity):
+    if not measuring_unit and quantity is not None and quantity != 1:
+        ingredient_name = _legacy_pluralize_word(ingredient_name)
+    normalized_quantity = _legacy_quantity_to_normalized_string(quantity)
+    if not normalized_quantity:
+        return ingredient_name
+    if not measuring_unit:
+        measured = normalized_quantity
+    elif measuring_unit in PLURALIZABLE_MEASURING_UNITS and quantity != 1:
+        measured = f"{normalized_quantity} "
+        measured += _legacy_pluralize_word(measuring_unit.value)
+    else:
+        measured = f"{normalized_quantity} {measuring_unit.value}"
+    return "".join([measured, " of " if measuring_unit else " ", ingredient_name])
+
+
+def _legacy_render_step(action, ingredient_name, measuring_unit, quantity, tool):
+    explanation = ActionToHumanReadableMapper.get(action, action.value)
+    if ":ingredient" in explanation:
+        ingredient = (
+            _legacy_measured_ingredient(ingredient_name, measuring_unit, quantity)
+            if ingredient_name
+            else "ingredient"
+        )
+        explanation = explanation.replace(":ingredient", ingredient)
+    if ":object" in explanation:
+        explanation = explanation.replace(":object", tool.value if tool else "object")
+    if ":glassware" in explanation:
+        explanation = explanation.replace(":glassware", GLASSWARE.value)
+    explanation = re.sub(" +", " ", explanation.replace("_", " ").lower()).strip()
+    return explanation.capitalize()
+
+
+def _legacy_render_instructions(steps):
+    instructions = []
+    for i, step in enumerate(steps):
+        step_instruction = f"Step {i + 1}: " + _legacy_render_step(*step)
+        if ":glassware" in step_instruction:
+            step_instruction = step_instruction.replace(
+                ":glassware", GLASSWARE.value.replace("_", " ")
+            )
+        instructions.append(step_instruction)
+    return "\n".join(instructions)
+
+
+def main(repeat: int = 5, number: int = 200) -> None:
+    legacy = _legacy_render_instructions(RECIPE)
+    cached = render_instructions(RECIPE, GLASSWARE)
+    assert legacy == cached, f"Rendering mismatch:\n{legacy}\n---\n{cached}"
+
+    steps_per_run = len(RECIPE) * number
+    legacy_seconds = min(
+        timeit.repeat(
+            lambda: _legacy_render_instructions(RECIPE), repeat=repeat, number=number
+        )
+    )
+    cached_seconds = min(
+        timeit.repeat(
+            lambda: render_instructions(RECIPE, GLASSWARE),
+            repeat=repeat,
+            number=number,
+        )
+    )
+    legacy_per_step = legacy_seconds / steps_per_run * 1e6
+    cached_per_step = cached_seconds / steps_per_run * 1e6
+    print(f"legacy renderer: {legacy_per_step:8.2f} us/step")
+    print(f"cached renderer: {cached_per_step:8.2f} us/step")
+    print(f"speedup:         {legacy_per_step / cached_per_step:8.1f}x")
+    for name, info in get_rendering_cache_info().items():
+        print(f"{name}: {info}")
+
+
+if __name__ == "__main__":
+    main()
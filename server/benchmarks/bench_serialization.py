@@ -0,0 +1,102 @@
+"""
+Benchmark of cocktail serialization: the ORM path (load_recipes, ORM attribute
+access in serialize_cocktail, then a generic sorted-keys json.dumps like
+jsonify) against the slotted DTO path (load_recipe_dtos from plain rows, then
+the compact JSON or MessagePack encoders). Reports time per cocktail, split into
+loading and encoding, and the payload size of every format.
+
+Run from the server directory against a populated database (the PG_* settings):
+    python -m benchmarks.bench_serialization --cocktails 500
+"""
+
+import argparse
+import json
+import timeit
+
+from typing import Callable, Dict, List
+
+from sqlalchemy import select
+
+from src.api.serializers import serialize_cocktail
+from src.dtos.encoders import (
+    decode_cocktails_msgpack,
+    encode_cocktails_msgpack,
+    encode_json,
+)
+from src.models.cocktail import Cocktail
+from src.models.services.cocktail_service import CocktailService
+
+
+def _get_cocktail_ids(service: CocktailService, count: int) -> List[int]:
+    with service.get_session() as session:
+        return list(
+            session.execute(select(Cocktail.id).order_by(Cocktail.id).limit(count))
+            .scalars()
+            .all()
+        )
+
+
+def _best_of(function: Callable, repeat: int) -> float:
+    return min(timeit.repeat(function, repeat=repeat, number=1))
+
+
+def _run(service: CocktailService, cocktail_ids: List[int], repeat: int) -> Dict:
+    with service.get_session() as session:
+        orm_payloads = [
+            serialize_cocktail(cocktail)
+            for cocktail in service.load_recipes(cocktail_ids, session=session)
+        ]
+        dto_payloads = [
+            cocktail.to_payload()
+            for cocktail in service.load_recipe_dtos(cocktail_ids, session=session)
+        ]
+    assert orm_payloads == dto_payloads, "ORM and DTO payloads differ"
+    msgpack_body = encode_cocktails_msgpack(dto_payloads)
+    assert decode_cocktails_msgpack(msgpack_body)["items"] == dto_payloads
+
+    def load_orm():
+        with service.get_session() as session:
+            cocktails = service.load_recipes(cocktail_ids, session=session)
+            return [serialize_cocktail(cocktail) for cocktail in cocktails]
+
+    def load_dtos():
+        with service.get_session() as session:
+            cocktails = service.load_recipe_dtos(cocktail_ids, session=session)
+            return [cocktail.to_payload() for cocktail in cocktails]
+
+    return {
+        "orm load + serialize": _best_of(load_orm, repeat),
+        "dto load + to_payload": _best_of(load_dtos, repeat),
+        "json (jsonify-like)": _best_of(
+            lambda: json.dumps(orm_payloads, sort_keys=True).encode(), repeat
+        ),
+        "json (compact)": _best_of(lambda: encode_json(dto_payloads), repeat),
+        "msgpack": _best_of(lambda: encode_cocktails_msgpack(dto_payloads), repeat),
+    }, {
+        "json (jsonify-like)": len(json.dumps(orm_payloads, sort_keys=True).encode()),
+        "json (compact)": len(encode_json(dto_payloads)),
+        "msgpack": len(msgpack_body),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cocktails", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    service = CocktailService()
+    cocktail_ids = _get_cocktail_ids(service, args.cocktails)
+    if not cocktail_ids:
+        raise SystemExit("No cocktails in the database")
+    timings, sizes = _run(service, cocktail_ids, args.repeat)
+
+    print(f"{len(cocktail_ids)} cocktails")
+    for name, seconds in timings.items():
+        print(f"{name:24} {seconds / len(cocktail_ids) * 1e6:10.1f} us/cocktail")
+    for name, size in sizes.items():
+        print(f"{name:24} {size / len(cocktail_ids):10.1f} bytes/cocktail")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,827 @@
+"""
+Benchmark suite of the service layer on a synthetic catalog (see
+synthetic_catalog). Times every public method of CocktailService,
+IngredientService, TagService and NameSearchService, and the instruction
+rendering helpers, and counts the SQL statements each call issues. Results are
+written as JSON and can be compared with those of an earlier run.
+
+Every case runs in its own session, which is rolled back afterwards, so
+mutating methods leave the catalog as it was for the next repetition.
+
+Run from the server directory, against the configured database (the PG_*
+settings, migrated) or an embedded SQLite stand-in. An empty catalog is
+generated first; an existing one is benchmarked as it is:
+    python -m benchmarks.bench_services --output results.json
+    python -m benchmarks.bench_services --database-url sqlite:// --repeat 3
+    python -m benchmarks.bench_services --database-url sqlite:// --baseline results.json
+"""
+
+import argparse
+import inspect
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import sqlalchemy
+
+from sqlalchemy import Engine, create_engine, event, func, select, update
+from sqlalchemy.orm import Session
+
+from benchmarks.synthetic_catalog import (
+    CatalogScale,
+    create_schema,
+    generate_catalog,
+    is_catalog_empty,
+)
+from src.database.constants import POSTGRESQL__PSYCOPG2__DB_URI as pg_uri
+from src.database.engine_registry import get_engine, register_engine
+from src.helpers.batch_instruction_renderer import (
+    build_step_frame,
+    render_instructions_frame,
+)
+from src.helpers.instruction_renderer import render_instructions, render_step
+from src.helpers.number_helper import measured_ingredient_to_pluralized_string
+from src.models.cocktail import Cocktail
+from src.models.cocktail_tag_association import CocktailTagAssociation
+from src.models.constants import MatchMode, MeasuringUnit, StepAction
+from src.models.ingredient import Ingredient
+from src.models.services.cocktail_search import CocktailSearch
+from src.models.services.cocktail_service import CocktailService
+from src.models.services.ingredient_service import IngredientService
+from src.models.services.name_search_service import NameSearchService
+from src.models.services.tag_service import TagService
+from src.models.step import Step
+from src.models.tag import Tag
+
+BENCHMARKED_SERVICES = (CocktailService, IngredientService, TagService)
+SUITE_NAME = "services"
+RESULTS_FORMAT_VERSION = 1
+
+
+class StatementCounter:
+    """
+    Counts the statements an engine executes (an executemany counts as one).
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args: Any) -> None:
+        self.count += 1
+
+
+@dataclass
+class Fixtures:
+    """
+    Services and catalog samples shared by the cases. Entities are loaded again
+    by every case, in its own session.
+    """
+
+    dialect: str
+    cocktail_ids: List[int]
+    cocktail_id: int
+    ingredient_ids: List[int]
+    ingredient_name: str
+    tag_ids: List[int]
+    tag_name: str
+    name_prefix: str
+    cocktails: CocktailService = field(default_factory=CocktailService)
+    ingredients: IngredientService = field(default_factory=IngredientService)
+    tags: TagService = field(default_factory=TagService)
+    names: NameSearchService = field(default_factory=NameSearchService)
+    step_rows: List[Tuple] = field(default_factory=list)
+
+
+# A case prepares its inputs in the session it is given (untimed) and returns
+# the call to time, or (call, cleanup) if the result must be cleaned up
+CASES: Dict[str, Callable[[Session, Fixtures], Any]] = {}
+
+
+class SkipCase(Exception):
+    pass
+
+
+def case(name: str):
+    def register(function: Callable[[Session, Fixtures], Any]):
+        CASES[name] = function
+        return function
+
+    return register
+
+
+def _get_case_method(name: str) -> str:
+    return name.split("[")[0]
+
+
+def _new_steps(session: Session, fx: Fixtures, count: int = 8) -> List[Step]:
+    ingredients = [session.get(Ingredient, id) for id in fx.ingredient_ids]
+    steps = [
+        Step(
+            action=StepAction.ADD_INGREDIENT,
+            ingredient=ingredients[i % len(ingredients)],
+            measuring_unit=MeasuringUnit.ML,
+            quantity=30,
+        )
+        for i in range(count - 1)
+    ]
+    return steps + [Step(action=StepAction.SHAKE)]
+
+
+def _get_recipe_step_ids(session: Session, cocktail_id: int) -> List[int]:
+    return list(
+        session.execute(
+            select(Step.id)
+            .where(Step.cocktail_id == cocktail_id)
+            .order_by(Step.position)
+        ).scalars()
+    )
+
+
+def _new_step_for(session: Session, cocktail_id: int) -> Step:
+    step = Step(action=StepAction.STIR)
+    step.cocktail = session.get(Cocktail, cocktail_id)
+    return step
+
+
+# CocktailService reads
+
+
+@case("CocktailService.fetch_cocktails")
+def _fetch_cocktails_by_tags(session: Session, fx: Fixtures):
+    tags = [session.get(Tag, id) for id in fx.tag_ids]
+    return lambda: fx.cocktails.fetch_cocktails(None, None, tags, session=session)
+
+
+@case("CocktailService.fetch_cocktails[with_recipes]")
+def _fetch_cocktails_with_recipes(session: Session, fx: Fixtures):
+    ingredients = [session.get(Ingredient, fx.ingredient_ids[0])]
+    return lambda: fx.cocktails.fetch_cocktails(
+        None,
+        None,
+        with_ingredients=ingredients,
+        with_recipes=True,
+        ingredient_match_mode=MatchMode.ANY,
+        session=session,
+    )
+
+
+@case("CocktailService.search_cocktails")
+def _search_cocktails(session: Session, fx: Fixtures):
+    ingredients = [session.get(Ingredient, id) for id in fx.ingredient_ids[:2]]
+    search = CocktailSearch().with_ingredients(ingredients, mode=MatchMode.ALL)
+    return lambda: fx.cocktails.search_cocktails(search, session=session)
+
+
+@case("CocktailService.load_recipes")
+def _load_recipes(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.load_recipes(fx.cocktail_ids, session=session)
+
+
+@case("CocktailService.load_recipe_dtos")
+def _load_recipe_dtos(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.load_recipe_dtos(fx.cocktail_ids, session=session)
+
+
+@case("CocktailService.load_recipe_payloads[documents]")
+def _load_recipe_payloads_from_documents(session: Session, fx: Fixtures):
+    fx.cocktails.rebuild_recipe_documents(fx.cocktail_ids, session=session)
+    return lambda: fx.cocktails.load_recipe_payloads(fx.cocktail_ids, session=session)
+
+
+@case("CocktailService.load_recipe_payloads[fallback]")
+def _load_recipe_payloads_without_documents(session: Session, fx: Fixtures):
+    session.execute(
+        update(Cocktail)
+        .where(Cocktail.id.in_(fx.cocktail_ids))
+        .values(recipe_document=None)
+    )
+    return lambda: fx.cocktails.load_recipe_payloads(fx.cocktail_ids, session=session)
+
+
+@case("CocktailService.rebuild_recipe_documents")
+def _rebuild_recipe_documents(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.rebuild_recipe_documents(
+        fx.cocktail_ids, session=session
+    )
+
+
+@case("CocktailService.scale_recipes")
+def _scale_recipes(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.scale_recipes(
+        fx.cocktail_ids, servings=8, session=session
+    )
+
+
+@case("CocktailService.load_normalized_recipe_dtos")
+def _load_normalized_recipe_dtos(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.load_normalized_recipe_dtos(
+        fx.cocktail_ids, session=session
+    )
+
+
+@case("CocktailService.plan_shopping_list")
+def _plan_shopping_list(session: Session, fx: Fixtures):
+    servings = {id: 10 for id in fx.cocktail_ids}
+    return lambda: fx.cocktails.plan_shopping_list(servings, session=session)
+
+
+@case("CocktailService.iter_recipe_batches")
+def _iter_recipe_batches(session: Session, fx: Fixtures):
+    return lambda: sum(len(batch) for batch in fx.cocktails.iter_recipe_batches())
+
+
+@case("CocktailService.fetch_cocktail_revisions_page")
+def _fetch_cocktail_revisions_page(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.fetch_cocktail_revisions_page(
+        fx.cocktail_id, 50, session=session
+    )
+
+
+@case("CocktailService.fetch_cocktail_revision")
+def _fetch_cocktail_revision(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.fetch_cocktail_revision(fx.cocktail_id, session=session)
+
+
+@case("CocktailService.render_instructions_for_cocktails")
+def _render_instructions_for_cocktails(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.render_instructions_for_cocktails(
+        fx.cocktail_ids, session=session
+    )
+
+
+@case("CocktailService.find_makeable_cocktail_ids")
+def _find_makeable_cocktail_ids(session: Session, fx: Fixtures):
+    ingredients = [session.get(Ingredient, id) for id in fx.ingredient_ids]
+    return lambda: fx.cocktails.find_makeable_cocktail_ids(
+        ingredients, max_missing=2, session=session
+    )
+
+
+@case("CocktailService.find_cocktail_ids_with_all_ingredients")
+def _find_cocktail_ids_with_all_ingredients(session: Session, fx: Fixtures):
+    ingredients = [session.get(Ingredient, id) for id in fx.ingredient_ids[:2]]
+    return lambda: fx.cocktails.find_cocktail_ids_with_all_ingredients(
+        ingredients, session=session
+    )
+
+
+@case("CocktailService.get_step_at_position")
+def _get_step_at_position(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    return lambda: fx.cocktails.get_step_at_position(cocktail, 3, session=session)
+
+
+# CocktailService writes
+
+
+@case("CocktailService.update_or_create[create]")
+def _create_cocktail(session: Session, fx: Fixtures):
+    steps = _new_steps(session, fx)
+    return lambda: fx.cocktails.update_or_create(
+        "benchmark cocktail", "new", steps=steps, session=session
+    )
+
+
+@case("CocktailService.update_or_create[update]")
+def _update_cocktail(session: Session, fx: Fixtures):
+    name = session.get(Cocktail, fx.cocktail_id).name
+    steps = _new_steps(session, fx)
+    return lambda: fx.cocktails.update_or_create(
+        name, "updated", steps=steps, session=session
+    )
+
+
+@case("CocktailService.normalize_recipe_units")
+def _normalize_recipe_units(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.normalize_recipe_units(session=session)
+
+
+@case("CocktailService.delete_cocktail")
+def _delete_cocktail(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.delete_cocktail(fx.cocktail_id, session=session)
+
+
+@case("CocktailService.delete_cocktails")
+def _delete_cocktails(session: Session, fx: Fixtures):
+    return lambda: fx.cocktails.delete_cocktails(fx.cocktail_ids, session=session)
+
+
+@case("CocktailService.remove_step_from_recipe")
+def _remove_step_from_recipe(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    step_id = _get_recipe_step_ids(session, fx.cocktail_id)[1]
+    return lambda: fx.cocktails.remove_step_from_recipe(
+        cocktail, step_id, session=session
+    )
+
+
+@case("CocktailService.clear_all_recipe_steps")
+def _clear_all_recipe_steps(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    return lambda: fx.cocktails.clear_all_recipe_steps(cocktail, session=session)
+
+
+@case("CocktailService.create_step")
+def _create_step(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    return lambda: fx.cocktails.create_step(cocktail, StepAction.STIR, session=session)
+
+
+@case("CocktailService.create_step_linked_list")
+def _create_step_linked_list(session: Session, fx: Fixtures):
+    cocktail = Cocktail(name="benchmark linked list")
+    session.add(cocktail)
+    steps = _new_steps(session, fx)
+    return lambda: fx.cocktails.create_step_linked_list(
+        steps, cocktail, session=session
+    )
+
+
+@case("CocktailService.add_step_to_specific_recipe_position")
+def _add_step_to_specific_recipe_position(session: Session, fx: Fixtures):
+    step = _new_step_for(session, fx.cocktail_id)
+    return lambda: fx.cocktails.add_step_to_specific_recipe_position(
+        step, 3, session=session
+    )
+
+
+@case("CocktailService.append_step_to_end_of_recipe")
+def _append_step_to_end_of_recipe(session: Session, fx: Fixtures):
+    step = _new_step_for(session, fx.cocktail_id)
+    return lambda: fx.cocktails.append_step_to_end_of_recipe(step, session=session)
+
+
+@case("CocktailService.insert_step_to_recipe_head")
+def _insert_step_to_recipe_head(session: Session, fx: Fixtures):
+    step = _new_step_for(session, fx.cocktail_id)
+    return lambda: fx.cocktails.insert_step_to_recipe_head(step, session=session)
+
+
+@case("CocktailService.move_step_to_recipe_position")
+def _move_step_to_recipe_position(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    step_id = _get_recipe_step_ids(session, fx.cocktail_id)[-1]
+    return lambda: fx.cocktails.move_step_to_recipe_position(
+        cocktail, step_id, 1, session=session
+    )
+
+
+@case("CocktailService.reorder_recipe")
+def _reorder_recipe(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    step_ids = _get_recipe_step_ids(session, fx.cocktail_id)
+    return lambda: fx.cocktails.reorder_recipe(
+        cocktail, step_ids[::-1], session=session
+    )
+
+
+@case("CocktailService.swap_recipe_steps")
+def _swap_recipe_steps(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    step_ids = _get_recipe_step_ids(session, fx.cocktail_id)
+    return lambda: fx.cocktails.swap_recipe_steps(
+        cocktail, step_ids[0], step_ids[-1], session=session
+    )
+
+
+def _get_unassociated_tags(session: Session, fx: Fixtures, count: int) -> List[Tag]:
+    associated = select(CocktailTagAssociation.tag_id).where(
+        CocktailTagAssociation.cocktail_id == fx.cocktail_id
+    )
+    return list(
+        session.execute(
+            select(Tag).where(Tag.id.not_in(associated)).order_by(Tag.id).limit(count)
+        ).scalars()
+    )
+
+
+@case("CocktailService.associate_tag_with_cocktail")
+def _associate_tag_with_cocktail(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    tag = _get_unassociated_tags(session, fx, 1)[0]
+    return lambda: fx.cocktails.associate_tag_with_cocktail(
+        cocktail, tag, session=session
+    )
+
+
+@case("CocktailService.associate_tags_with_cocktail")
+def _associate_tags_with_cocktail(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    tags = _get_unassociated_tags(session, fx, 3)
+    return lambda: fx.cocktails.associate_tags_with_cocktail(
+        cocktail, tags, session=session
+    )
+
+
+@case("CocktailService.dissociate_tag_from_cocktail")
+def _dissociate_tag_from_cocktail(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    tag = session.get(Tag, fx.tag_ids[0])
+    return lambda: fx.cocktails.dissociate_tag_from_cocktail(
+        cocktail, tag, session=session
+    )
+
+
+@case("CocktailService.dissociate_tags_from_cocktail")
+def _dissociate_tags_from_cocktail(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    tags = [session.get(Tag, id) for id in fx.tag_ids]
+    return lambda: fx.cocktails.dissociate_tags_from_cocktail(
+        cocktail, tags, session=session
+    )
+
+
+@case("CocktailService.dissociate_all_tags_from_cocktail")
+def _dissociate_all_tags_from_cocktail(session: Session, fx: Fixtures):
+    cocktail = session.get(Cocktail, fx.cocktail_id)
+    return lambda: fx.cocktails.dissociate_all_tags_from_cocktail(
+        cocktail, session=session
+    )
+
+
+# IngredientService and TagService
+
+
+@case("IngredientService.fetch_ingredients")
+def _fetch_ingredients(session: Session, fx: Fixtures):
+    return lambda: fx.ingredients.fetch_ingredients(None, None, session=session)
+
+
+@case("IngredientService.fetch_ingredients_page")
+def _fetch_ingredients_page(session: Session, fx: Fixtures):
+    return lambda: fx.ingredients.fetch_ingredients_page(None, 50, session=session)
+
+
+@case("IngredientService.fetch_ingredient_by_id")
+def _fetch_ingredient_by_id(session: Session, fx: Fixtures):
+    return lambda: fx.ingredients.fetch_ingredient_by_id(
+        fx.ingredient_ids[0], session=session
+    )
+
+
+@case("IngredientService.fetch_ingredient_by_name")
+def _fetch_ingredient_by_name(session: Session, fx: Fixtures):
+    return lambda: fx.ingredients.fetch_ingredient_by_name(
+        fx.ingredient_name, session=session
+    )
+
+
+@case("IngredientService.get_or_create_ingredient")
+def _get_or_create_ingredient(session: Session, fx: Fixtures):
+    return lambda: fx.ingredients.get_or_create_ingredient(
+        "benchmark ingredient", session=session
+    )
+
+
+@case("IngredientService.get_or_create_ingredients")
+def _get_or_create_ingredients(session: Session, fx: Fixtures):
+    names = [fx.ingredient_name] + [f"benchmark ingredient {i}" for i in range(49)]
+    return lambda: fx.ingredients.get_or_create_ingredients(names, session=session)
+
+
+@case("TagService.fetch_tags")
+def _fetch_tags(session: Session, fx: Fixtures):
+    return lambda: fx.tags.fetch_tags(None, None, session=session)
+
+
+@case("TagService.fetch_tags_page")
+def _fetch_tags_page(session: Session, fx: Fixtures):
+    return lambda: fx.tags.fetch_tags_page(None, 50, session=session)
+
+
+@case("TagService.fetch_tag_by_id")
+def _fetch_tag_by_id(session: Session, fx: Fixtures):
+    return lambda: fx.tags.fetch_tag_by_id(fx.tag_ids[0], session=session)
+
+
+@case("TagService.fetch_tag_by_name")
+def _fetch_tag_by_name(session: Session, fx: Fixtures):
+    return lambda: fx.tags.fetch_tag_by_name(fx.tag_name, session=session)
+
+
+@case("TagService.get_or_create_tag")
+def _get_or_create_tag(session: Session, fx: Fixtures):
+    return lambda: fx.tags.get_or_create_tag("benchmark tag", session=session)
+
+
+@case("TagService.get_or_create_tags")
+def _get_or_create_tags(session: Session, fx: Fixtures):
+    names = [fx.tag_name] + [f"benchmark tag {i}" for i in range(9)]
+    return lambda: fx.tags.get_or_create_tags(names, session=session)
+
+
+# Name search
+
+
+@case("NameSearchService.suggest_names")
+def _suggest_names(session: Session, fx: Fixtures):
+    return lambda: fx.names.suggest_names(fx.name_prefix, session=session)
+
+
+@case("NameSearchService.search_names")
+def _search_names(session: Session, fx: Fixtures):
+    if fx.dialect != "postgresql":
+        raise SkipCase("needs the PostgreSQL trigram and unaccent extensions")
+    return lambda: fx.names.search_names(fx.name_prefix, session=session)
+
+
+# Rendering helpers, on the steps of the sampled cocktails
+
+
+@case("render_step")
+def _render_step(session: Session, fx: Fixtures):
+    steps = [(row[2], row[3], row[4], row[5], row[6], row[7]) for row in fx.step_rows]
+    return lambda: [render_step(*step) for step in steps]
+
+
+@case("render_instructions")
+def _render_instructions(session: Session, fx: Fixtures):
+    recipes: Dict[int, List[Tuple]] = {}
+    glassware = {}
+    for row in fx.step_rows:
+        recipes.setdefault(row[0], []).append(row[2:7])
+        glassware[row[0]] = row[7]
+    return lambda: [
+        render_instructions(steps, glassware[id]) for id, steps in recipes.items()
+    ]
+
+
+@case("render_instructions_frame")
+def _render_instructions_frame(session: Session, fx: Fixtures):
+    return lambda: render_instructions_frame(build_step_frame(fx.step_rows))
+
+
+@case("measured_ingredient_to_pluralized_string")
+def _measured_ingredient_to_pluralized_string(session: Session, fx: Fixtures):
+    measured = [
+        (row[3], row[4], row[5])
+        for row in fx.step_rows
+        if row[2] == StepAction.ADD_INGREDIENT and row[3]
+    ]
+    return lambda: [
+        measured_ingredient_to_pluralized_string(name, unit, quantity)
+        for name, unit, quantity in measured
+    ]
+
+
+def _load_step_rows(fx: Fixtures) -> List[Tuple]:
+    """
+    Returns the ordered step rows of the sampled cocktails, in the layout of
+    build_step_frame.
+    """
+    rows = []
+    for cocktail in fx.cocktails.load_recipe_dtos(fx.cocktail_ids):
+        for position, step in enumerate(cocktail.steps, start=1):
+            rows.append(
+                (
+                    cocktail.id,
+                    position,
+                    step.action,
+                    step.ingredient.name if step.ingredient else None,
+                    step.measuring_unit,
+                    step.quantity,
+                    step.mixology_tool,
+                    cocktail.glassware,
+                )
+            )
+    return rows
+
+
+def _get_most_used(session: Session, column, count: int) -> List[int]:
+    return list(
+        session.execute(
+            select(column)
+            .where(column.is_not(None))
+            .group_by(column)
+            .order_by(func.count().desc(), column)
+            .limit(count)
+        ).scalars()
+    )
+
+
+def build_fixtures(engine: Engine, sample_size: int, seed: int) -> Fixtures:
+    rng = random.Random(seed)
+    with Session(engine) as session:
+        cocktail_ids = list(session.execute(select(Cocktail.id)).scalars())
+        sample = sorted(rng.sample(cocktail_ids, min(sample_size, len(cocktail_ids))))
+        # The recipe edited by the step cases needs a few steps
+        cocktail_id = session.execute(
+            select(Step.cocktail_id)
+            .where(Step.cocktail_id.in_(sample))
+            .group_by(Step.cocktail_id)
+            .having(func.count() >= 4)
+            .order_by(Step.cocktail_id)
+            .limit(1)
+        ).scalar_one()
+        ingredient_ids = _get_most_used(session, Step.ingredient_id, 3)
+        tag_ids = _get_most_used(session, CocktailTagAssociation.tag_id, 3)
+        fx = Fixtures(
+            dialect=engine.dialect.name,
+            cocktail_ids=sample,
+            cocktail_id=cocktail_id,
+            ingredient_ids=ingredient_ids,
+            ingredient_name=session.get(Ingredient, ingredient_ids[0]).name,
+            tag_ids=tag_ids,
+            tag_name=session.get(Tag, tag_ids[0]).name,
+            name_prefix=session.get(Cocktail, rng.choice(sample)).name[:3].lower(),
+        )
+    fx.step_rows = _load_step_rows(fx)
+    return fx
+
+
+def run_case(
+    name: str, fx: Fixtures, engine: Engine, counter: StatementCounter, repeat: int
+) -> Dict[str, Any]:
+    """
+    Runs a case `repeat` times. The first run is reported apart as the cold run,
+    since it also fills the in-process caches and indexes.
+    """
+    timings, statements = [], []
+    for _ in range(repeat):
+        with Session(engine) as session:
+            prepared = CASES[name](session, fx)
+            call, cleanup = (
+                prepared if isinstance(prepared, tuple) else (prepared, None)
+            )
+            counter.count = 0
+            started = time.perf_counter()
+            result = call()
+            timings.append(time.perf_counter() - started)
+            statements.append(counter.count)
+            if cleanup is not None:
+                cleanup(result)
+            session.rollback()
+    warm = timings[1:] or timings
+    return {
+        "name": name,
+        "cold_seconds": timings[0],
+        "min_seconds": min(warm),
+        "median_seconds": statistics.median(warm),
+        "statements": statistics.median_high(statements),
+    }
+
+
+def get_uncovered_methods() -> List[str]:
+    """
+    Returns the public service methods without a case, so new methods are noticed.
+    """
+    covered = {_get_case_method(name) for name in CASES}
+    services = BENCHMARKED_SERVICES + (NameSearchService,)
+    return [
+        f"{service.__name__}.{name}"
+        for service in services
+        for name, method in inspect.getmembers(service, inspect.isfunction)
+        if not name.startswith("_")
+        and method.__qualname__.startswith(f"{service.__name__}.")
+        and f"{service.__name__}.{name}" not in covered
+    ]
+
+
+def count_catalog(engine: Engine) -> Dict[str, int]:
+    with Session(engine) as session:
+        return {
+            model.__tablename__: session.execute(
+                select(func.count()).select_from(model)
+            ).scalar()
+            for model in (Cocktail, Step, Ingredient, Tag)
+        }
+
+
+def _get_git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(results: Dict, baseline: Dict) -> None:
+    """
+    Prints the median time ratio and statement difference of every case against
+    a baseline run.
+    """
+    if baseline.get("catalog") != results["catalog"]:
+        print("Warning: the baseline ran on a different catalog")
+    if baseline["environment"]["dialect"] != results["environment"]["dialect"]:
+        print("Warning: the baseline ran on a different database")
+    baseline_cases = {result["name"]: result for result in baseline["results"]}
+    print(f"\n{'case':64} {'ratio':>7} {'statements':>12}")
+    for result in results["results"]:
+        before = baseline_cases.get(result["name"])
+        if before is None:
+            continue
+        ratio = result["median_seconds"] / max(before["median_seconds"], 1e-9)
+        delta = result["statements"] - before["statements"]
+        flag = "  <-- slower" if ratio > 1.2 or delta > 0 else ""
+        print(f"{result['name']:64} {ratio:7.2f} {delta:+12d}{flag}")
+
+
+def _connect(database_url: Optional[str]) -> Engine:
+    """
+    Returns the engine to benchmark, registered as the services' engine when a
+    database URL overrides the PG_* settings.
+    """
+    if database_url is None:
+        return get_engine(pg_uri)
+    engine = create_engine(database_url)
+    register_engine(pg_uri, engine)
+    return engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--database-url", help="e.g. sqlite:// for the stand-in")
+    parser.add_argument("--cocktails", type=int, default=CatalogScale.cocktails)
+    parser.add_argument("--steps", type=int, default=CatalogScale.steps)
+    parser.add_argument("--ingredients", type=int, default=CatalogScale.ingredients)
+    parser.add_argument("--tags", type=int, default=CatalogScale.tags)
+    parser.add_argument("--seed", type=int, default=CatalogScale.seed)
+    parser.add_argument("--sample", type=int, default=100, help="cocktails per batch")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--case", action="append", help="only run these cases")
+    parser.add_argument("--output", default="bench_services.json")
+    parser.add_argument("--baseline", help="results of an earlier run to compare")
+    args = parser.parse_args()
+
+    engine = _connect(args.database_url)
+    create_schema(engine)
+    scale = CatalogScale(
+        cocktails=args.cocktails,
+        steps=args.steps,
+        ingredients=args.ingredients,
+        tags=args.tags,
+        seed=args.seed,
+    )
+    if is_catalog_empty(engine):
+        started = time.perf_counter()
+        generate_catalog(engine, scale)
+        print(f"Generated the catalog in {time.perf_counter() - started:.1f}s")
+    else:
+        print("Benchmarking the existing catalog")
+    catalog = count_catalog(engine)
+    print(", ".join(f"{count} {table}" for table, count in catalog.items()))
+
+    fx = build_fixtures(engine, args.sample, args.seed)
+    counter = StatementCounter(engine)
+    results, skipped, errors = [], {}, {}
+    print(f"\n{'case':64} {'cold ms':>9} {'median ms':>10} {'statements':>11}")
+    for name in args.case or list(CASES):
+        try:
+            result = run_case(name, fx, engine, counter, args.repeat)
+        except SkipCase as reason:
+            skipped[name] = str(reason)
+            print(f"{name:64} skipped: {reason}")
+            continue
+        except Exception as error:
+            errors[name] = repr(error)
+            print(f"{name:64} failed: {error!r}")
+            continue
+        results.append(result)
+        print(
+            f"{name:64} {result['cold_seconds'] * 1e3:9.2f} "
+            f"{result['median_seconds'] * 1e3:10.2f} {result['statements']:11d}"
+        )
+
+    output = {
+        "suite": SUITE_NAME,
+        "format": RESULTS_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "git_revision": _get_git_revision(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "dialect": engine.dialect.name,
+        },
+        "scale": scale.to_dict(),
+        "catalog": catalog,
+        "sample": len(fx.cocktail_ids),
+        "repeat": args.repeat,
+        "results": results,
+        "skipped": skipped,
+        "errors": errors,
+        "not_covered": get_uncovered_methods(),
+    }
+    with open(args.output, "w") as file:
+        json.dump(output, file, indent=2)
+    print(f"\nResults written to {args.output}")
+    if output["not_covered"]:
+        print("Methods without a case: " + ", ".join(output["not_covered"]))
+    if args.baseline:
+        with open(args.baseline) as file:
+            compare_results(output, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
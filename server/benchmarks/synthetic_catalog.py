@@ -0,0 +1,358 @@
+"""
+Synthetic catalog generator for the benchmarks. Fills an empty database with
+cocktails, linked recipes, ingredients and tags at a configurable scale, with
+step actions, units and quantities drawn from distributions close to those of
+real bar recipes. Rows are bulk inserted with explicit ids, bypassing the
+services, so generating 100k steps takes seconds.
+
+The schema can be created on PostgreSQL or on SQLite, used as an embedded
+stand-in when no PostgreSQL server is available (see create_schema).
+"""
+
+import random
+
+from dataclasses import asdict, dataclass
+from itertools import accumulate, product
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import Engine, event, func, insert, select, text
+
+from src.models.base_model import BaseModel
+from src.models.cocktail import Cocktail
+from src.models.cocktail_tag_association import CocktailTagAssociation
+from src.models.constants import (
+    STEP_POSITION_GAP,
+    CocktailGlassware,
+    MeasuringUnit,
+    MixologyTool,
+    StepAction,
+)
+from src.models.ingredient import Ingredient
+from src.models.step import Step
+from src.models.tag import Tag
+
+INSERT_BATCH_SIZE = 5000
+
+# fmt: off
+BASE_INGREDIENTS = [
+    "white rum", "dark rum", "gin", "vodka", "tequila", "mezcal", "bourbon",
+    "rye whiskey", "scotch", "cognac", "pisco", "cachaça", "campari", "aperol",
+    "sweet vermouth", "dry vermouth", "triple sec", "maraschino", "amaretto",
+    "absinthe", "chartreuse", "angostura bitters", "orange bitters", "lime juice",
+    "lemon juice", "orange juice", "grapefruit juice", "pineapple juice",
+    "cranberry juice", "simple syrup", "honey syrup", "agave syrup", "grenadine",
+    "orgeat", "sugar", "salt", "egg white", "cream", "coconut cream", "soda water",
+    "tonic water", "ginger beer", "cola", "prosecco", "espresso", "mint", "basil",
+    "lime", "lemon", "orange", "cherry", "olive", "cucumber", "strawberry",
+    "raspberry", "blackberry", "pineapple", "nutmeg", "cinnamon", "ice",
+]
+INGREDIENT_STYLES = [
+    "", "aged", "spiced", "smoked", "infused", "homemade", "fresh", "chilled",
+    "overproof", "blended", "barrel-aged", "vanilla", "citrus", "toasted",
+    "rich", "light", "dark", "wild", "bitter", "sweet", "dry", "aromatic",
+    "herbal", "floral", "roasted", "burnt", "salted", "candied", "pickled",
+    "clarified",
+]
+COCKTAIL_ADJECTIVES = [
+    "smoky", "velvet", "golden", "midnight", "crimson", "tropical", "bitter",
+    "silver", "royal", "wild", "frozen", "burning", "electric", "lazy", "lucky",
+    "hidden", "broken", "rusty", "gentle", "savage", "quiet", "restless",
+    "painted", "sunken", "copper", "jade", "ivory", "scarlet", "amber", "blue",
+]
+COCKTAIL_NOUNS = [
+    "harbor", "garden", "tiger", "sailor", "orchard", "compass", "lantern",
+    "parrot", "anchor", "monk", "dancer", "island", "serpent", "falcon", "hermit",
+    "bandit", "canyon", "dragon", "voyage", "widow", "colonel", "mermaid", "ghost",
+    "prophet", "comet", "fox", "pirate", "baron", "cobra", "saint",
+]
+COCKTAIL_STYLES = [
+    "sour", "fizz", "spritz", "smash", "julep", "flip", "punch", "cobbler",
+    "collins", "daisy", "highball", "martini", "negroni", "mule", "swizzle",
+]
+TAG_WORDS = [
+    "classic", "tiki", "summer", "winter", "brunch", "after dinner", "aperitif",
+    "digestif", "low abv", "strong", "bitter", "sweet", "sour", "creamy", "fruity",
+    "herbal", "spicy", "smoky", "sparkling", "frozen", "hot", "party", "holiday",
+    "easy", "advanced", "prohibition era", "modern", "signature", "seasonal",
+    "refreshing",
+]
+# fmt: on
+
+# Relative frequencies, roughly those of classic recipe books
+ACTION_WEIGHTS = {
+    StepAction.ADD_INGREDIENT: 60,
+    StepAction.SHAKE: 8,
+    StepAction.STIR: 6,
+    StepAction.MUDDLE: 5,
+    StepAction.POUR: 9,
+    StepAction.DECORATE: 5,
+    StepAction.BLEND: 2,
+    StepAction.PEEL: 3,
+    StepAction.GRATE: 2,
+}
+ACTION_TOOLS = {
+    StepAction.SHAKE: [MixologyTool.COCKTAIL_SHAKER],
+    StepAction.STIR: [MixologyTool.STIRRING_SPOON, MixologyTool.STIRRING_JAR],
+    StepAction.BLEND: [MixologyTool.BLENDER],
+    StepAction.PEEL: [MixologyTool.PEELER],
+    StepAction.GRATE: [MixologyTool.GRATER],
+    StepAction.DECORATE: [None],
+}
+# None stands for unmeasured additions ("5 ice", "top with soda")
+UNIT_WEIGHTS = {
+    MeasuringUnit.ML: 30,
+    MeasuringUnit.OZ: 25,
+    MeasuringUnit.DASH: 8,
+    MeasuringUnit.TSP: 5,
+    MeasuringUnit.TBSP: 2,
+    MeasuringUnit.PIECE: 5,
+    MeasuringUnit.WEDGE: 4,
+    MeasuringUnit.SLICE: 3,
+    MeasuringUnit.LEAF: 4,
+    MeasuringUnit.GRAM: 3,
+    MeasuringUnit.CUP: 1,
+    MeasuringUnit.CUBE: 1,
+    MeasuringUnit.PINCH: 1,
+    None: 8,
+}
+QUANTITIES = {
+    MeasuringUnit.ML: [5, 10, 15, 20, 22.5, 25, 30, 45, 50, 60, 90, 120],
+    MeasuringUnit.OZ: [0.25, 0.5, 0.75, 1, 1.5, 2, 3],
+    MeasuringUnit.TSP: [0.5, 1, 2],
+    MeasuringUnit.TBSP: [0.5, 1, 2],
+    MeasuringUnit.CUP: [0.25, 0.5, 1],
+    MeasuringUnit.GRAM: [2, 5, 10, 20],
+    None: [None, 1, 2, 5],
+}
+COUNT_QUANTITIES = [1, 1, 1, 2, 2, 3, 4, 6, 8]
+
+
+@dataclass
+class CatalogScale:
+    cocktails: int = 10000
+    steps: int = 100000
+    ingredients: int = 2000
+    tags: int = 300
+    max_tags_per_cocktail: int = 4
+    seed: int = 42
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _unique_names(
+    rng: random.Random, parts: Sequence[Sequence[str]], count: int
+) -> List[str]:
+    """
+    Returns `count` distinct names combining one item of each part, in random
+    order. Numbered variants are used once every combination is taken.
+    """
+    combinations = [
+        " ".join(word for word in combination if word)
+        for combination in product(*parts)
+    ]
+    rng.shuffle(combinations)
+    names = combinations[:count]
+    suffix = 2
+    while len(names) < count:
+        names.extend(f"{name} {suffix}" for name in combinations[: count - len(names)])
+        suffix += 1
+    return names
+
+
+def _get_recipe_lengths(rng: random.Random, scale: CatalogScale) -> List[int]:
+    """
+    Splits the steps among the cocktails: lengths vary around the mean, at least
+    two steps each, and add up to exactly scale.steps.
+    """
+    if scale.steps < 2 * scale.cocktails:
+        raise ValueError("The catalog needs at least two steps per cocktail")
+    mean = scale.steps / scale.cocktails
+    lengths = [
+        max(2, round(rng.triangular(2, max(2, 2 * mean - 2), mean)))
+        for _ in range(scale.cocktails)
+    ]
+    difference = scale.steps - sum(lengths)
+    while difference:
+        index = rng.randrange(scale.cocktails)
+        if difference > 0 or lengths[index] > 2:
+            step = 1 if difference > 0 else -1
+            lengths[index] += step
+            difference -= step
+    return lengths
+
+
+def _get_quantity(rng: random.Random, unit: Optional[MeasuringUnit]):
+    return rng.choice(QUANTITIES.get(unit, COUNT_QUANTITIES))
+
+
+class _StepGenerator:
+    def __init__(self, rng: random.Random, scale: CatalogScale) -> None:
+        self.rng = rng
+        self.actions = list(ACTION_WEIGHTS)
+        self.action_weights = list(ACTION_WEIGHTS.values())
+        self.units = list(UNIT_WEIGHTS)
+        self.unit_weights = list(UNIT_WEIGHTS.values())
+        # Zipf-like popularity: a few ingredients appear in most recipes
+        self.ingredient_ids = list(range(1, scale.ingredients + 1))
+        self.ingredient_cum_weights = list(
+            accumulate(1 / rank for rank in self.ingredient_ids)
+        )
+
+    def _pick_ingredient_id(self) -> int:
+        return self.rng.choices(
+            self.ingredient_ids, cum_weights=self.ingredient_cum_weights
+        )[0]
+
+    def generate(self, step_id: int, cocktail_id: int, index: int, length: int):
+        action = self.rng.choices(self.actions, self.action_weights)[0]
+        if index == 0:
+            action = StepAction.ADD_INGREDIENT
+        elif index == length - 1 and action == StepAction.ADD_INGREDIENT:
+            action = StepAction.POUR
+        row = {
+            "id": step_id,
+            "action": action,
+            "ingredient_id": None,
+            "measuring_unit": None,
+            "quantity": None,
+            "mixology_tool": None,
+            "next_step_id": step_id + 1 if index < length - 1 else None,
+            "is_recipe_first_step": index == 0,
+            "position": (index + 1) * STEP_POSITION_GAP,
+            "cocktail_id": cocktail_id,
+        }
+        if action == StepAction.ADD_INGREDIENT:
+            unit = self.rng.choices(self.units, self.unit_weights)[0]
+            row["ingredient_id"] = self._pick_ingredient_id()
+            row["measuring_unit"] = unit
+            row["quantity"] = _get_quantity(self.rng, unit)
+        elif action in (StepAction.MUDDLE, StepAction.BLEND):
+            row["ingredient_id"] = self._pick_ingredient_id()
+        if action in ACTION_TOOLS:
+            row["mixology_tool"] = self.rng.choice(ACTION_TOOLS[action])
+        return row
+
+
+def _generate_steps(
+    rng: random.Random, scale: CatalogScale, lengths: List[int]
+) -> Iterator[Dict]:
+    generator = _StepGenerator(rng, scale)
+    step_id = 1
+    for cocktail_id, length in enumerate(lengths, start=1):
+        for index in range(length):
+            yield generator.generate(step_id, cocktail_id, index, length)
+            step_id += 1
+
+
+def _insert_rows(connection, table, rows: List[Dict]) -> None:
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        connection.execute(insert(table), rows[start : start + INSERT_BATCH_SIZE])
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def create_schema(engine: Engine) -> None:
+    """
+    Creates the missing tables. On PostgreSQL, run the migrations first so the
+    search extensions and indexes exist too. On SQLite, the deferrable head and
+    next-step constraints, which SQLite doesn't support, are left out; the services
+    still validate recipes. A plain index stands in for the one behind the next-step
+    constraint, which the foreign key checks of step deletes rely on.
+    """
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _enable_sqlite_foreign_keys)
+        steps = Step.__table__
+        for constraint in list(steps.constraints):
+            if getattr(constraint, "deferrable", None):
+                steps.constraints.discard(constraint)
+    BaseModel.metadata.create_all(engine)
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_steps_next_step_id "
+                    "ON steps (next_step_id)"
+                )
+            )
+
+
+def is_catalog_empty(engine: Engine) -> bool:
+    with engine.connect() as connection:
+        return not connection.execute(
+            select(func.count()).select_from(Cocktail)
+        ).scalar()
+
+
+def generate_catalog(engine: Engine, scale: CatalogScale) -> None:
+    """
+    Fills an empty catalog at the given scale, reproducibly for a given seed.
+    Ids are assigned explicitly from 1, so the PostgreSQL sequences are moved past
+    them afterwards.
+    """
+    rng = random.Random(scale.seed)
+    ingredient_names = _unique_names(
+        rng, [INGREDIENT_STYLES, BASE_INGREDIENTS], scale.ingredients
+    )
+    tag_names = _unique_names(rng, [[""], TAG_WORDS], scale.tags)
+    cocktail_names = _unique_names(
+        rng,
+        [COCKTAIL_ADJECTIVES, COCKTAIL_NOUNS, COCKTAIL_STYLES],
+        scale.cocktails,
+    )
+    glassware = list(CocktailGlassware)
+    lengths = _get_recipe_lengths(rng, scale)
+
+    with engine.begin() as connection:
+        _insert_rows(
+            connection,
+            Ingredient.__table__,
+            [{"id": i, "name": name} for i, name in enumerate(ingredient_names, 1)],
+        )
+        _insert_rows(
+            connection,
+            Tag.__table__,
+            [{"id": i, "name": name} for i, name in enumerate(tag_names, 1)],
+        )
+        _insert_rows(
+            connection,
+            Cocktail.__table__,
+            [
+                {
+                    "id": i,
+                    "name": name.title(),
+                    "description": f"A {name} for the benchmarks",
+                    "glassware": rng.choice(glassware),
+                    "revision": 1,
+                }
+                for i, name in enumerate(cocktail_names, 1)
+            ],
+        )
+        # Inserted last to first, so every next step already exists
+        steps = list(_generate_steps(rng, scale, lengths))
+        steps.reverse()
+        _insert_rows(connection, Step.__table__, steps)
+        _insert_rows(
+            connection,
+            CocktailTagAssociation.__table__,
+            [
+                {"cocktail_id": cocktail_id, "tag_id": tag_id}
+                for cocktail_id in range(1, scale.cocktails + 1)
+                for tag_id in rng.sample(
+                    range(1, scale.tags + 1),
+                    rng.randint(0, min(scale.max_tags_per_cocktail, scale.tags)),
+                )
+            ],
+        )
+        if engine.dialect.name == "postgresql":
+            for table in ("ingredients", "tags", "cocktails", "steps"):
+                connection.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"(SELECT MAX(id) FROM {table}))"
+                    )
+                )
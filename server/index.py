@@ -6,23 +6,25 @@ from src.models.constants import MeasuringUnit, StepAction
 from src.models.step import Step
 
 db_service = PGDatabaseService()
-db_service.create_tables()
+db_service.prepare_schema()
 
 with db_service.get_session() as session:
     # Create tags
     tag_service = TagService()
-    tag1 = tag_service.get_or_create_tag(name="strong", session=session)
-    tag2 = tag_service.get_or_create_tag(name="fruit", session=session)
-    list_of_tags = [tag1, tag2]
+    tags_by_name = tag_service.get_or_create_tags(
+        names=["strong", "fruit"], session=session
+    )
+    list_of_tags = list(tags_by_name.values())
 
     # Create ingredients
     ingredient_service = IngredientService()
-    cachaca = ingredient_service.get_or_create_ingredient(
-        name="Cachaça", session=session
+    ingredients_by_name = ingredient_service.get_or_create_ingredients(
+        names=["Cachaça", "Lime", "Sugar", "Ice"], session=session
     )
-    lime = ingredient_service.get_or_create_ingredient(name="Lime", session=session)
-    sugar = ingredient_service.get_or_create_ingredient(name="Sugar", session=session)
-    ice = ingredient_service.get_or_create_ingredient(name="Ice", session=session)
+    cachaca = ingredients_by_name["Cachaça"]
+    lime = ingredients_by_name["Lime"]
+    sugar = ingredients_by_name["Sugar"]
+    ice = ingredients_by_name["Ice"]
     list_of_ingredients = [cachaca, lime, sugar, ice]
 
     # Build steps for the recipe
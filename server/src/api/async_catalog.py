@@ -0,0 +1,127 @@
+from typing import Any, Dict, List, Tuple
+
+from quart import Blueprint, Response, jsonify, request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.http_cache import compute_etag, with_cache_headers
+from src.api.pagination import InvalidPageRequest, get_page_args, split_page
+from src.cache.cocktail_cache import (
+    cache_cocktail_payload,
+    get_cached_cocktail_payload,
+)
+from src.models.services.async_cocktail_service import AsyncCocktailService
+from src.models.services.async_ingredient_service import AsyncIngredientService
+from src.models.services.async_tag_service import AsyncTagService
+
+async_catalog_blueprint = Blueprint("async_catalog", __name__)
+
+
+@async_catalog_blueprint.errorhandler(InvalidPageRequest)
+async def handle_invalid_page_request(error: InvalidPageRequest):
+    return jsonify({"error": str(error)}), 400
+
+
+def _conditional_response(payload: Any, etag: str) -> Response:
+    """
+    Answers with an empty 304 if the request already names the ETag, or with the
+    JSON payload otherwise.
+    """
+    if etag in request.if_none_match:
+        return with_cache_headers(Response("", status=304), etag)
+    return with_cache_headers(jsonify(payload), etag)
+
+
+async def _get_cocktail_payloads(
+    cocktail_service: AsyncCocktailService,
+    session: AsyncSession,
+    revisions: List[Tuple[int, int]],
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Returns the (revision, payload) of the given cocktails, in order, reusing
+    cached payloads of the listed revision (see catalog._get_cocktail_payloads).
+    """
+    payloads = {}
+    for cocktail_id, revision in revisions:
+        cached = get_cached_cocktail_payload(cocktail_id)
+        if cached is not None and cached[0] == revision:
+            payloads[cocktail_id] = cached
+
+    missing_ids = [id for id, _ in revisions if id not in payloads]
+    for revision, payload in await cocktail_service.load_recipe_payloads(
+        missing_ids, session=session
+    ):
+        cache_cocktail_payload(payload["id"], revision, payload)
+        payloads[payload["id"]] = (revision, payload)
+    return [payloads[id] for id, _ in revisions if id in payloads]
+
+
+@async_catalog_blueprint.get("/cocktails")
+async def list_cocktails() -> Response:
+    """
+    Lists cocktails with their recipes, a page at a time, see catalog.list_cocktails.
+    """
+    after_id, limit = get_page_args(request.args)
+    cocktail_service = AsyncCocktailService()
+    async with cocktail_service.get_session() as session:
+        revisions, next_cursor = split_page(
+            await cocktail_service.fetch_cocktail_revisions_page(
+                after_id, limit + 1, session=session
+            ),
+            limit,
+        )
+        etag = compute_etag("cocktails", revisions, next_cursor)
+        if etag in request.if_none_match:
+            return with_cache_headers(Response("", status=304), etag)
+        payloads = await _get_cocktail_payloads(cocktail_service, session, revisions)
+
+    etag = compute_etag(
+        "cocktails",
+        [(payload["id"], revision) for revision, payload in payloads],
+        next_cursor,
+    )
+    body = {
+        "items": [payload for _, payload in payloads],
+        "next_cursor": next_cursor,
+    }
+    return _conditional_response(body, etag)
+
+
+@async_catalog_blueprint.get("/cocktails/<int:cocktail_id>")
+async def get_cocktail(cocktail_id: int) -> Response:
+    """
+    Returns a cocktail with its recipe, from the payload cache when possible.
+    """
+    cached = get_cached_cocktail_payload(cocktail_id)
+    if cached is None:
+        payloads = await AsyncCocktailService().load_recipe_payloads([cocktail_id])
+        if not payloads:
+            return jsonify({"error": "Cocktail not found"}), 404
+        cached = payloads[0]
+        cache_cocktail_payload(cocktail_id, *cached)
+
+    revision, payload = cached
+    return _conditional_response(
+        payload, compute_etag("cocktail", cocktail_id, revision)
+    )
+
+
+async def _list_named_rows(kind: str, fetch_page) -> Response:
+    after_id, limit = get_page_args(request.args)
+    rows, next_cursor = split_page(await fetch_page(after_id, limit + 1), limit)
+    payload = {
+        "items": [{"id": id, "name": name} for id, name in rows],
+        "next_cursor": next_cursor,
+    }
+    return _conditional_response(payload, compute_etag(kind, rows, next_cursor))
+
+
+@async_catalog_blueprint.get("/ingredients")
+async def list_ingredients() -> Response:
+    return await _list_named_rows(
+        "ingredients", AsyncIngredientService().fetch_ingredients_page
+    )
+
+
+@async_catalog_blueprint.get("/tags")
+async def list_tags() -> Response:
+    return await _list_named_rows("tags", AsyncTagService().fetch_tags_page)
@@ -0,0 +1,137 @@
+from typing import Any, Dict, List, Tuple
+
+from flask import Blueprint, Response, jsonify, request
+
+from src.api.http_cache import (
+    cacheable_json_response,
+    cacheable_msgpack_response,
+    compute_etag,
+    is_not_modified,
+    not_modified_response,
+    wants_msgpack,
+)
+from src.api.pagination import InvalidPageRequest, get_page_args, split_page
+from src.cache.cocktail_cache import (
+    cache_cocktail_payload,
+    get_cached_cocktail_payload,
+)
+from src.dtos.encoders import encode_cocktails_msgpack
+from src.models.services.cocktail_service import CocktailService
+from src.models.services.ingredient_service import IngredientService
+from src.models.services.tag_service import TagService
+
+catalog_blueprint = Blueprint("catalog", __name__)
+
+
+@catalog_blueprint.errorhandler(InvalidPageRequest)
+def handle_invalid_page_request(error: InvalidPageRequest):
+    return jsonify({"error": str(error)}), 400
+
+
+def _get_cocktail_payloads(
+    cocktail_service: CocktailService, revisions: List[Tuple[int, int]]
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Returns the (revision, payload) of the given cocktails, in order. Cached
+    payloads of the listed revision are reused; the others are read in bulk from
+    their recipe documents (see CocktailService.load_recipe_payloads) and cached.
+    """
+    payloads = {}
+    for cocktail_id, revision in revisions:
+        cached = get_cached_cocktail_payload(cocktail_id)
+        if cached is not None and cached[0] == revision:
+            payloads[cocktail_id] = cached
+
+    missing_ids = [id for id, _ in revisions if id not in payloads]
+    for revision, payload in cocktail_service.load_recipe_payloads(missing_ids):
+        cache_cocktail_payload(payload["id"], revision, payload)
+        payloads[payload["id"]] = (revision, payload)
+    return [payloads[id] for id, _ in revisions if id in payloads]
+
+
+@catalog_blueprint.get("/cocktails")
+def list_cocktails() -> Response:
+    """
+    Lists cocktails with their recipes, a page at a time. The page ETag is derived
+    from the (id, revision) pairs of its cocktails, which are read through the
+    primary key before any recipe is loaded, so an unchanged page costs one query.
+    Cocktails are rendered from the payload cache when their revision matches.
+    Answers in MessagePack if the client prefers it (see encode_cocktails_msgpack).
+    """
+    after_id, limit = get_page_args(request.args)
+    use_msgpack = wants_msgpack()
+    cocktail_service = CocktailService()
+    revisions, next_cursor = split_page(
+        cocktail_service.fetch_cocktail_revisions_page(after_id, limit + 1), limit
+    )
+    etag = compute_etag("cocktails", revisions, next_cursor, use_msgpack)
+    if is_not_modified(etag):
+        return not_modified_response(etag)
+    payloads = _get_cocktail_payloads(cocktail_service, revisions)
+
+    # Derive the ETag from what was actually rendered, in case it changed
+    etag = compute_etag(
+        "cocktails",
+        [(payload["id"], revision) for revision, payload in payloads],
+        next_cursor,
+        use_msgpack,
+    )
+    items = [payload for _, payload in payloads]
+    if use_msgpack:
+        return cacheable_msgpack_response(
+            encode_cocktails_msgpack(items, next_cursor), etag
+        )
+    return cacheable_json_response({"items": items, "next_cursor": next_cursor}, etag)
+
+
+@catalog_blueprint.get("/cocktails/<int:cocktail_id>")
+def get_cocktail(cocktail_id: int) -> Response:
+    """
+    Returns a cocktail with its recipe. Cached payloads are served without touching
+    the database; they are invalidated whenever the cocktail changes. Otherwise the
+    recipe document is read with a single primary key lookup.
+    In MessagePack, the cocktail is the single item of the envelope.
+    """
+    cached = get_cached_cocktail_payload(cocktail_id)
+    if cached is None:
+        payloads = CocktailService().load_recipe_payloads([cocktail_id])
+        if not payloads:
+            return jsonify({"error": "Cocktail not found"}), 404
+        cached = payloads[0]
+        cache_cocktail_payload(cocktail_id, *cached)
+
+    revision, payload = cached
+    use_msgpack = wants_msgpack()
+    etag = compute_etag("cocktail", cocktail_id, revision, use_msgpack)
+    if is_not_modified(etag):
+        return not_modified_response(etag)
+    if use_msgpack:
+        return cacheable_msgpack_response(encode_cocktails_msgpack([payload]), etag)
+    return cacheable_json_response(payload, etag)
+
+
+def _list_named_rows(kind: str, fetch_page) -> Response:
+    """
+    Lists (id, name) rows a page at a time. The rows are the whole payload, so the
+    ETag is derived from them directly.
+    """
+    after_id, limit = get_page_args(request.args)
+    rows, next_cursor = split_page(fetch_page(after_id, limit + 1), limit)
+    etag = compute_etag(kind, rows, next_cursor)
+    if is_not_modified(etag):
+        return not_modified_response(etag)
+    payload = {
+        "items": [{"id": id, "name": name} for id, name in rows],
+        "next_cursor": next_cursor,
+    }
+    return cacheable_json_response(payload, etag)
+
+
+@catalog_blueprint.get("/ingredients")
+def list_ingredients() -> Response:
+    return _list_named_rows("ingredients", IngredientService().fetch_ingredients_page)
+
+
+@catalog_blueprint.get("/tags")
+def list_tags() -> Response:
+    return _list_named_rows("tags", TagService().fetch_tags_page)
@@ -0,0 +1,39 @@
+import json
+
+from typing import Iterator
+
+from flask import Blueprint, Response
+
+from src.api.serializers import serialize_cocktail
+from src.models.services.cocktail_service import CocktailService
+
+EXPORT_BATCH_SIZE = 500
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+export_blueprint = Blueprint("export", __name__)
+
+
+def generate_catalog_ndjson(batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """
+    Yields the whole catalog as newline-delimited JSON, one cocktail (with its
+    ordered steps, tags and rendered instructions) per line, streaming it batch
+    by batch from CocktailService.iter_recipe_batches.
+    """
+    for cocktails in CocktailService().iter_recipe_batches(batch_size):
+        yield "".join(
+            json.dumps(serialize_cocktail(cocktail), ensure_ascii=False) + "\n"
+            for cocktail in cocktails
+        )
+
+
+@export_blueprint.get("/export/cocktails")
+def export_cocktails() -> Response:
+    """
+    Streams the catalog as NDJSON with a chunked response: the first batch goes
+    out as soon as it is loaded, and nothing is buffered in between.
+    """
+    return Response(
+        generate_catalog_ndjson(),
+        mimetype=NDJSON_MIMETYPE,
+        headers={"Content-Disposition": "attachment; filename=cocktails.ndjson"},
+    )
@@ -0,0 +1,62 @@
+import hashlib
+
+from typing import Any
+
+from flask import Response, request
+
+from src.dtos.encoders import JSON_MIMETYPE, MSGPACK_MIMETYPE, encode_json
+
+CACHE_CONTROL = "no-cache"
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Derives a strong ETag from the values that fully determine a response body,
+    e.g. the (id, revision) pairs of the rows it renders.
+    """
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+
+
+def is_not_modified(etag: str) -> bool:
+    """
+    Returns True if the request's If-None-Match already names the given ETag.
+    """
+    return etag in request.if_none_match
+
+
+def wants_msgpack() -> bool:
+    """
+    Returns True if the request prefers MessagePack over JSON (Accept header).
+    """
+    best_match = request.accept_mimetypes.best_match([JSON_MIMETYPE, MSGPACK_MIMETYPE])
+    return best_match == MSGPACK_MIMETYPE
+
+
+def not_modified_response(etag: str) -> Response:
+    response = Response(status=304)
+    return with_cache_headers(response, etag)
+
+
+def cacheable_json_response(payload: Any, etag: str) -> Response:
+    """
+    Returns the JSON payload with its ETag. Clients must revalidate every time,
+    which is cheap: unchanged resources are answered with an empty 304.
+    """
+    response = Response(encode_json(payload), mimetype=JSON_MIMETYPE)
+    return with_cache_headers(response, etag)
+
+
+def cacheable_msgpack_response(data: bytes, etag: str) -> Response:
+    response = Response(data, mimetype=MSGPACK_MIMETYPE)
+    return with_cache_headers(response, etag)
+
+
+def with_cache_headers(response: Response, etag: str) -> Response:
+    """
+    Sets the ETag and revalidation headers. Works with any Werkzeug-based response,
+    including the asyncio app's.
+    """
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.vary.add("Accept")
+    return response
@@ -0,0 +1,15 @@
+from flask import Blueprint, Response
+
+from src.metrics.service_metrics import PROMETHEUS_MIMETYPE, get_service_metrics
+
+metrics_blueprint = Blueprint("metrics", __name__)
+
+
+@metrics_blueprint.get("/metrics")
+def get_metrics() -> Response:
+    """
+    Exposes the service metrics (see ServiceMetrics) for Prometheus to scrape.
+    """
+    return Response(
+        get_service_metrics().render_prometheus(), content_type=PROMETHEUS_MIMETYPE
+    )
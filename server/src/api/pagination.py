@@ -0,0 +1,62 @@
+import base64
+import json
+
+from typing import List, Optional, Tuple
+
+from werkzeug.datastructures import MultiDict
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidPageRequest(ValueError):
+    pass
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encodes the keyset position after the last row of a page as an opaque,
+    URL-safe cursor.
+    """
+    payload = json.dumps({"after": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decodes a cursor made by encode_cursor. No cursor means the first page.
+    """
+    if not cursor:
+        return None
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        after = json.loads(payload)["after"]
+    except (ValueError, KeyError, TypeError) as error:
+        raise InvalidPageRequest("Invalid cursor") from error
+    if not isinstance(after, int) or isinstance(after, bool):
+        raise InvalidPageRequest("Invalid cursor")
+    return after
+
+
+def get_page_args(args: MultiDict) -> Tuple[Optional[int], int]:
+    """
+    Reads the `cursor` and `limit` query arguments. Returns the id to continue
+    after and the page size, clamped to MAX_PAGE_SIZE.
+    """
+    try:
+        limit = int(args.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError as error:
+        raise InvalidPageRequest("limit must be a positive integer") from error
+    if limit < 1:
+        raise InvalidPageRequest("limit must be a positive integer")
+    return decode_cursor(args.get("cursor")), min(limit, MAX_PAGE_SIZE)
+
+
+def split_page(rows: List[Tuple], limit: int) -> Tuple[List[Tuple], Optional[str]]:
+    """
+    Splits rows fetched with limit + 1, whose first value is the id, into the page
+    and the cursor of the next page, if there is one.
+    """
+    page = rows[:limit]
+    next_cursor = encode_cursor(page[-1][0]) if len(rows) > limit else None
+    return page, next_cursor
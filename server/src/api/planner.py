@@ -0,0 +1,93 @@
+import math
+
+from typing import Any, Dict, Tuple
+
+from flask import Blueprint, Response, jsonify, request
+
+from src.database.bulk_get_or_create import normalize_name
+from src.models.services.cocktail_service import CocktailService
+from src.models.services.ingredient_service import IngredientService
+
+MAX_PLANNED_COCKTAILS = 5000
+
+planner_blueprint = Blueprint("planner", __name__)
+
+
+class InvalidPlanRequest(ValueError):
+    pass
+
+
+@planner_blueprint.errorhandler(InvalidPlanRequest)
+def handle_invalid_plan_request(error: InvalidPlanRequest):
+    return jsonify({"error": str(error)}), 400
+
+
+def _is_positive_number(value: Any) -> bool:
+    # The JSON parser lets Infinity and NaN through
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+        and value > 0
+    )
+
+
+def _get_servings_by_cocktail_id(entries: list) -> Dict[int, float]:
+    servings_by_cocktail_id: Dict[int, float] = {}
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("id"), int):
+            raise InvalidPlanRequest("Every cocktail needs an integer id")
+        servings = entry.get("servings", 1)
+        if not _is_positive_number(servings):
+            raise InvalidPlanRequest("servings must be a positive number")
+        cocktail_id = entry["id"]
+        total_servings = servings_by_cocktail_id.get(cocktail_id, 0) + servings
+        if not math.isfinite(total_servings):
+            raise InvalidPlanRequest("servings must be a positive number")
+        servings_by_cocktail_id[cocktail_id] = total_servings
+    return servings_by_cocktail_id
+
+
+def _get_bottle_sizes(sizes_by_name: Any) -> Dict[int, float]:
+    if not isinstance(sizes_by_name, dict):
+        raise InvalidPlanRequest("bottle_sizes must map ingredient names to ml")
+    bottle_sizes = {}
+    ingredient_service = IngredientService()
+    for name, size in sizes_by_name.items():
+        if not _is_positive_number(size):
+            raise InvalidPlanRequest("Bottle sizes must be positive numbers of ml")
+        ingredient = ingredient_service.fetch_ingredient_by_name(normalize_name(name))
+        if ingredient is None:
+            raise InvalidPlanRequest(f"Unknown ingredient: {name}")
+        bottle_sizes[ingredient.id] = float(size)
+    return bottle_sizes
+
+
+def get_plan_args(body: Any) -> Tuple[Dict[int, float], Dict[int, float]]:
+    """
+    Reads a shopping list request:
+    {"cocktails": [{"id": 1, "servings": 4}, ...], "bottle_sizes": {"rum": 700}}.
+    Servings of a cocktail listed twice add up. Returns the servings by cocktail
+    id, and the bottle sizes in ml by ingredient id.
+    """
+    if not isinstance(body, dict) or not isinstance(body.get("cocktails"), list):
+        raise InvalidPlanRequest("cocktails must be a list")
+    if len(body["cocktails"]) > MAX_PLANNED_COCKTAILS:
+        raise InvalidPlanRequest(f"At most {MAX_PLANNED_COCKTAILS} cocktails")
+    return (
+        _get_servings_by_cocktail_id(body["cocktails"]),
+        _get_bottle_sizes(body.get("bottle_sizes") or {}),
+    )
+
+
+@planner_blueprint.post("/shopping-list")
+def create_shopping_list() -> Response:
+    """
+    Totals the ingredients needed to serve many cocktails, see
+    CocktailService.plan_shopping_list.
+    """
+    servings_by_cocktail_id, bottle_sizes = get_plan_args(request.get_json(silent=True))
+    shopping_list = CocktailService().plan_shopping_list(
+        servings_by_cocktail_id, bottle_sizes
+    )
+    return jsonify(shopping_list.to_payload())
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from flask import Flask, Response, g, jsonify
+
+from src.database.session_scope import (
+    enter_session_scope,
+    exit_session_scope,
+    get_current_session_scope,
+)
+
+
+def init_request_sessions(app: Flask) -> None:
+    """
+    Runs every request of the app in a SessionScope, so the service calls of a
+    request share one session and one transaction without passing it around.
+    The unit of work is committed once the response is ready (a failing commit
+    turns into an error response), and rolled back if the request failed. When a
+    service call failed and the view answered with a success anyway, its writes
+    are rolled back and the client gets an error instead.
+    """
+
+    @app.before_request
+    def enter_request_session_scope() -> None:
+        g.session_scope_token = enter_session_scope()
+
+    @app.after_request
+    def commit_request_session_scope(response: Response) -> Response:
+        scope = get_current_session_scope()
+        if scope is None:
+            return response
+        doomed = scope.doomed
+        scope.commit()
+        if doomed and response.status_code < 400:
+            response = jsonify(
+                {"error": "The request failed and its changes were rolled back"}
+            )
+            response.status_code = 500
+        return response
+
+    @app.teardown_request
+    def exit_request_session_scope(error: Optional[BaseException]) -> None:
+        token = g.pop("session_scope_token", None)
+        if token is not None:
+            exit_session_scope(token)
@@ -0,0 +1,74 @@
+from typing import List, Optional, Tuple
+
+from flask import Blueprint, Response, jsonify, request
+from werkzeug.datastructures import MultiDict
+
+from src.indexes.name_index import NameMatch
+from src.models.constants import NameSearchKind
+from src.models.services.name_search_service import NameSearchService
+
+DEFAULT_SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
+
+search_blueprint = Blueprint("search", __name__)
+
+
+class InvalidSearchRequest(ValueError):
+    pass
+
+
+@search_blueprint.errorhandler(InvalidSearchRequest)
+def handle_invalid_search_request(error: InvalidSearchRequest):
+    return jsonify({"error": str(error)}), 400
+
+
+def get_search_args(
+    args: MultiDict,
+) -> Tuple[str, Optional[List[NameSearchKind]], int]:
+    """
+    Reads the query (`q`), the kinds to search (repeatable `kind`, all by default)
+    and the `limit` of a search request, clamped to
+    MAX_SEARCH_LIMIT.
+    """
+    try:
+        kinds = [NameSearchKind(kind) for kind in args.getlist("kind")] or None
+    except ValueError as error:
+        raise InvalidSearchRequest(str(error)) from error
+    limit = args.get("limit", DEFAULT_SEARCH_LIMIT, type=int)
+    if limit < 1:
+        raise InvalidSearchRequest("limit must be a positive integer")
+    return args.get("q", ""), kinds, min(limit, MAX_SEARCH_LIMIT)
+
+
+def _to_response(matches: List[NameMatch]) -> Response:
+    return jsonify(
+        {
+            "items": [
+                {
+                    "kind": match.kind.value,
+                    "id": match.id,
+                    "name": match.name,
+                    "rank": match.rank,
+                }
+                for match in matches
+            ]
+        }
+    )
+
+
+@search_blueprint.get("/search/suggest")
+def suggest_names() -> Response:
+    """
+    Autocompletes names as the user types, from the in-memory name index.
+    """
+    query, kinds, limit = get_search_args(request.args)
+    return _to_response(NameSearchService().suggest_names(query, kinds, limit))
+
+
+@search_blueprint.get("/search")
+def search_names() -> Response:
+    """
+    Ranked search of names containing, or similar to, the query.
+    """
+    query, kinds, limit = get_search_args(request.args)
+    return _to_response(NameSearchService().search_names(query, kinds, limit))
@@ -0,0 +1,34 @@
+from typing import Any, Dict, Optional
+
+from src.models.cocktail import Cocktail
+from src.models.step import Step
+
+
+def _enum_value(value: Any) -> Optional[str]:
+    return value.value if value is not None else None
+
+
+def serialize_step(step: Step) -> Dict[str, Any]:
+    return {
+        "action": _enum_value(step.action),
+        "ingredient": step.ingredient.name if step.ingredient else None,
+        "measuring_unit": _enum_value(step.measuring_unit),
+        "quantity": step.quantity,
+        "mixology_tool": _enum_value(step.mixology_tool),
+    }
+
+
+def serialize_cocktail(cocktail: Cocktail) -> Dict[str, Any]:
+    """
+    Serializes a cocktail loaded with its recipe (see CocktailService.load_recipes).
+    """
+    return {
+        "id": cocktail.id,
+        "name": cocktail.name,
+        "description": cocktail.description,
+        "glassware": _enum_value(cocktail.glassware),
+        "revision": cocktail.revision,
+        "tags": [tag.name for tag in cocktail.tags],
+        "steps": [serialize_step(step) for step in cocktail.steps],
+        "instructions": cocktail.get_human_readable_instructions(),
+    }
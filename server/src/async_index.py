@@ -0,0 +1,23 @@
+from quart import Quart, jsonify
+
+from src.api.async_catalog import async_catalog_blueprint
+from src.database.async_engine_registry import dispose_async_engines
+
+# Asyncio serving mode: the read API of src/index.py as an ASGI app, backed by the
+# async services. Serve with an ASGI server, e.g. `hypercorn src.async_index:app`.
+app = Quart(__name__)
+app.register_blueprint(async_catalog_blueprint)
+
+
+@app.route("/ping", methods=["GET"])
+async def get_ping():
+    return jsonify({"message": "pong"})
+
+
+@app.after_serving
+async def close_database_connections():
+    await dispose_async_engines()
+
+
+if __name__ == "__main__":
+    app.run(debug=True)
@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Optional
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class CacheBackend(ABC):
+    """
+    Interface of the key-value stores behind the application caches. Values must
+    be treated as immutable by callers. The in-process backend can be swapped for
+    a shared one (see set_cache_backend) without touching the callers.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached value, or None on a miss.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value, expiring after `ttl` seconds (the backend default if None).
+        """
+
+    @abstractmethod
+    def delete(self, keys: Iterable[str]) -> None:
+        """
+        Invalidates the given keys; missing keys are ignored.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> CacheStats:
+        pass
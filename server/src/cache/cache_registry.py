@@ -0,0 +1,31 @@
+from threading import Lock
+from typing import Optional
+
+from src.cache.cache_backend import CacheBackend
+from src.cache.memory_cache_backend import MemoryCacheBackend
+from src.settings import CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS
+
+_cache: Optional[CacheBackend] = None
+_cache_lock = Lock()
+
+
+def get_cache() -> CacheBackend:
+    """
+    Returns the process-wide cache backend, an in-memory LRU/TTL cache unless
+    another backend was set.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = MemoryCacheBackend(CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS)
+    return _cache
+
+
+def set_cache_backend(backend: CacheBackend) -> None:
+    """
+    Replaces the process-wide cache backend, e.g. with a shared one.
+    """
+    global _cache
+    with _cache_lock:
+        _cache = backend
@@ -0,0 +1,26 @@
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.cache.cache_registry import get_cache
+
+# (revision, serialized cocktail)
+CachedCocktailPayload = Tuple[int, Dict[str, Any]]
+
+
+def cocktail_payload_key(cocktail_id: int) -> str:
+    return f"cocktails:payload:{cocktail_id}"
+
+
+def get_cached_cocktail_payload(cocktail_id: int) -> Optional[CachedCocktailPayload]:
+    return get_cache().get(cocktail_payload_key(cocktail_id))
+
+
+def cache_cocktail_payload(
+    cocktail_id: int, revision: int, payload: Dict[str, Any]
+) -> None:
+    get_cache().set(cocktail_payload_key(cocktail_id), (revision, payload))
+
+
+def invalidate_cocktail_payloads(cocktail_ids: Iterable[int]) -> None:
+    get_cache().delete(
+        cocktail_payload_key(cocktail_id) for cocktail_id in cocktail_ids
+    )
@@ -0,0 +1,114 @@
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, TypeVar
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, SessionTransaction, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.cache.cache_registry import get_cache
+from src.models.base_model import BaseModel
+
+NamedModel = TypeVar("NamedModel", bound=BaseModel)
+NamedRow = Dict[str, Any]
+
+FETCHED_NAMED_ROWS_KEY = "fetched_named_rows"
+TRANSACTION_WROTE_KEY = "named_rows_transaction_wrote"
+
+
+def named_entity_key(model: Type[NamedModel], field: str, value: Any) -> str:
+    return f"{model.__tablename__}:{field}:{value}"
+
+
+def get_cached_named_row(
+    model: Type[NamedModel], field: str, value: Any
+) -> Optional[NamedRow]:
+    """
+    Returns the cached row (every column value, by attribute name) of an
+    ingredient or tag looked up by "id" or "name", or None.
+    """
+    return get_cache().get(named_entity_key(model, field, value))
+
+
+def to_detached_entity(model: Type[NamedModel], row: NamedRow) -> NamedModel:
+    """
+    Rebuilds a cached row as a detached instance with every column loaded, which
+    can be merged into a session with load=False without emitting a query. Its
+    relationships are not loaded.
+    """
+    entity = model(name=row["name"])
+    for key, value in row.items():
+        set_committed_value(entity, key, value)
+    make_transient_to_detached(entity)
+    return entity
+
+
+def get_cached_named_entity(
+    session: Session, model: Type[NamedModel], field: str, value: Any
+) -> Optional[NamedModel]:
+    """
+    Looks up an ingredient or tag cached by "id" or "name", merged into the session
+    without a query.
+    """
+    row = get_cached_named_row(model, field, value)
+    if row is None:
+        return None
+    return session.merge(to_detached_entity(model, row), load=False)
+
+
+def cache_named_entity(
+    session: Session, model: Type[NamedModel], entity: Optional[NamedModel]
+) -> None:
+    """
+    Caches an entity's column values under both its id and its name, once the
+    row is known to be committed: when the session's transaction commits, or ends
+    without having written anything. Rows read after a write may not outlive the
+    transaction, so they are dropped if it rolls back.
+    Missing entities are not cached, so later creations need no invalidation.
+    """
+    if entity is None:
+        return
+    row = {
+        column.key: getattr(entity, column.key)
+        for column in inspect(model).column_attrs
+    }
+    session.info.setdefault(FETCHED_NAMED_ROWS_KEY, []).append((model, row))
+
+
+def _set_cached_named_rows(rows: Iterable[Tuple[Type[BaseModel], NamedRow]]) -> None:
+    cache = get_cache()
+    for model, row in rows:
+        cache.set(named_entity_key(model, "id", row["id"]), row)
+        cache.set(named_entity_key(model, "name", row["name"]), row)
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_transaction_flushed(session: Session, _flush_context) -> None:
+    session.info[TRANSACTION_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_transaction_written(orm_execute_state) -> None:
+    # INSERT, UPDATE and DELETE statements write without flushing, e.g. upserts
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[TRANSACTION_WROTE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed_named_rows(session: Session) -> None:
+    _set_cached_named_rows(session.info.pop(FETCHED_NAMED_ROWS_KEY, ()))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _cache_read_only_named_rows(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    if transaction.parent is not None:
+        return
+    # Left over when the transaction did not commit: a transaction that never
+    # wrote only ever read committed rows
+    fetched = session.info.pop(FETCHED_NAMED_ROWS_KEY, ())
+    if not session.info.pop(TRANSACTION_WROTE_KEY, False):
+        _set_cached_named_rows(fetched)
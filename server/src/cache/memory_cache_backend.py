@@ -0,0 +1,66 @@
+import time
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Iterable, Optional, Tuple
+
+from src.cache.cache_backend import CacheBackend, CacheStats
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Process-local cache bounded by entry count, evicting the least recently used
+    entries first. Entries also expire after a time to live.
+    """
+
+    def __init__(self, max_entries: int, default_ttl: Optional[float] = None) -> None:
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        # key -> (expires_at or None, value), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if self.max_entries <= 0:
+            return
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def delete(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> CacheStats:
+        with self._lock:
+            stats = CacheStats(**vars(self._stats))
+            stats.size = len(self._entries)
+            return stats
@@ -0,0 +1,34 @@
+import argparse
+
+from src.importer.recipe_import_service import RecipeImportService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bulk import cocktail recipes from a JSON Lines or CSV file."
+    )
+    parser.add_argument("path", help="Path to a .jsonl/.ndjson or .csv recipe file")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Recipes written and committed per batch",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Checkpoint file used to resume an interrupted import",
+    )
+    args = parser.parse_args()
+
+    stats = RecipeImportService().import_file(
+        args.path,
+        batch_size=args.batch_size,
+        checkpoint_path=args.checkpoint,
+        verbose=True,
+    )
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import argparse
+
+from src.models.services.cocktail_service import CocktailService
+
+
+def main() -> None:
+    argparse.ArgumentParser(
+        description="Rewrite every recipe's volumes in ml and masses in grams."
+    ).parse_args()
+
+    cocktail_ids = CocktailService().normalize_recipe_units()
+    print(f"Normalized the units of {len(cocktail_ids)} cocktails")
+
+
+if __name__ == "__main__":
+    main()
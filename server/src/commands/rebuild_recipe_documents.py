@@ -0,0 +1,26 @@
+import argparse
+
+from src.models.constants import RECIPE_DOCUMENT_BATCH_SIZE
+from src.models.services.cocktail_service import CocktailService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the precomputed recipe document of every cocktail."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=RECIPE_DOCUMENT_BATCH_SIZE,
+        help="Cocktails rebuilt and committed per batch",
+    )
+    args = parser.parse_args()
+
+    written = CocktailService().rebuild_all_recipe_documents(
+        batch_size=args.batch_size, verbose=True
+    )
+    print(f"Rebuilt the recipe documents of {written} cocktails")
+
+
+if __name__ == "__main__":
+    main()
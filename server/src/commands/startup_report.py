@@ -0,0 +1,151 @@
+import argparse
+import importlib
+import subprocess
+import sys
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+# Boot phases of the Flask app, in the order they happen. Each import phase only
+# pays for the modules the phases before it did not load.
+IMPORT_PHASES = (
+    ("settings", ("src.settings",)),
+    ("sqlalchemy", ("sqlalchemy", "sqlalchemy.orm")),
+    (
+        "models",
+        (
+            "src.models.cocktail",
+            "src.models.cocktail_tag_association",
+            "src.models.ingredient",
+            "src.models.step",
+            "src.models.tag",
+        ),
+    ),
+    (
+        "services",
+        (
+            "src.models.services.cocktail_service",
+            "src.models.services.ingredient_service",
+            "src.models.services.tag_service",
+            "src.models.services.name_search_service",
+        ),
+    ),
+    ("flask", ("flask",)),
+    (
+        "api",
+        (
+            "src.api.catalog",
+            "src.api.export",
+            "src.api.metrics",
+            "src.api.planner",
+            "src.api.search",
+        ),
+    ),
+    ("app module", ("src.index",)),
+)
+
+
+def _import_phase(modules: Tuple[str, ...]) -> Callable[[], None]:
+    def run() -> None:
+        for module in modules:
+            importlib.import_module(module)
+
+    return run
+
+
+def _create_app() -> None:
+    # Blueprints and the schema check on FAST_STARTUP. The name index is warmed in
+    # the background, after the app is ready, so it isn't timed.
+    from src.index import create_app
+
+    create_app(warm_name_index=False)
+
+
+def _first_query() -> None:
+    from sqlalchemy import text
+
+    from src.database.db_service import PGDatabaseService
+
+    with PGDatabaseService().engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def time_phases(with_database: bool) -> List[Tuple[str, float]]:
+    """
+    Runs the boot phases in this process and returns their durations, in seconds.
+    Must run in a fresh interpreter, or modules imported earlier are free.
+    """
+    phases = [(name, _import_phase(modules)) for name, modules in IMPORT_PHASES]
+    phases.append(("app", _create_app))
+    if with_database:
+        phases.append(("first query", _first_query))
+    durations = []
+    for name, run in phases:
+        started = perf_counter()
+        run()
+        durations.append((name, perf_counter() - started))
+    return durations
+
+
+def get_slowest_imports(count: int) -> List[Tuple[str, float]]:
+    """
+    Imports the app in a child interpreter with `-X importtime` and returns the
+    `count` modules that took the longest to import by themselves, in seconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.index"],
+        capture_output=True,
+        text=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _cumulative_us, module = line[len("import time:") :].split("|")
+        imports.append((module.strip(), int(self_us) / 1e6))
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Break the app's cold start down by import and init phase."
+    )
+    parser.add_argument(
+        "--no-database",
+        action="store_true",
+        help="Skip the first query (the schema check still runs on FAST_STARTUP)",
+    )
+    parser.add_argument(
+        "--imports",
+        type=int,
+        default=10,
+        help="Number of slowest modules to list (0 to skip)",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Exit with status 1 when the phases take longer in total",
+    )
+    args = parser.parse_args()
+
+    durations = time_phases(with_database=not args.no_database)
+    total = sum(seconds for _name, seconds in durations)
+    from src.settings import FAST_STARTUP
+
+    print(f"Startup phases (FAST_STARTUP={FAST_STARTUP}):")
+    for name, seconds in durations:
+        print(f"  {name:<16}{seconds * 1000:>9.1f} ms")
+    print(f"  {'total':<16}{total * 1000:>9.1f} ms")
+
+    if args.imports:
+        print("Slowest imports (self time, in a fresh interpreter):")
+        for module, seconds in get_slowest_imports(args.imports):
+            print(f"  {module:<48}{seconds * 1000:>9.1f} ms")
+
+    if args.budget_ms is not None and total * 1000 > args.budget_ms:
+        print(f"Over the {args.budget_ms:.0f} ms startup budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
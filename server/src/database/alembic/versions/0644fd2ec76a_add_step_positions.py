@@ -0,0 +1,77 @@
+"""Add sparse step positions
+
+Revision ID: 0644fd2ec76a
+Revises: ec27be7030bb
+Create Date: 2026-10-18 18:50:12.204113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0644fd2ec76a"
+down_revision: Union[str, Sequence[str], None] = "ec27be7030bb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STEP_POSITION_GAP = 1024
+MAX_RECIPE_STEPS = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("steps", sa.Column("position", sa.Integer(), nullable=True))
+    op.create_index(
+        "ix_steps_cocktail_id_position",
+        "steps",
+        ["cocktail_id", "position"],
+        unique=False,
+    )
+    # Deleting a step must unlink its predecessor, not delete it
+    op.drop_constraint("steps_next_step_id_fkey", "steps", type_="foreignkey")
+    op.create_foreign_key(
+        "steps_next_step_id_fkey",
+        "steps",
+        "steps",
+        ["next_step_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    # Backfill positions by walking every recipe linked list from its head
+    op.execute(
+        f"""
+        WITH RECURSIVE recipe_order AS (
+            SELECT id, next_step_id, 1 AS position
+            FROM steps
+            WHERE is_recipe_first_step
+            UNION ALL
+            SELECT steps.id, steps.next_step_id, recipe_order.position + 1
+            FROM steps
+            JOIN recipe_order ON steps.id = recipe_order.next_step_id
+            WHERE recipe_order.position < {MAX_RECIPE_STEPS}
+        )
+        UPDATE steps
+        SET position = recipe_order.position * {STEP_POSITION_GAP}
+        FROM recipe_order
+        WHERE steps.id = recipe_order.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("steps_next_step_id_fkey", "steps", type_="foreignkey")
+    op.create_foreign_key(
+        "steps_next_step_id_fkey",
+        "steps",
+        "steps",
+        ["next_step_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.drop_index("ix_steps_cocktail_id_position", table_name="steps")
+    op.drop_column("steps", "position")
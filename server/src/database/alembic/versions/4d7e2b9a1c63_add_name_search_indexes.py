@@ -0,0 +1,47 @@
+"""Add accent-insensitive trigram indexes on names
+
+Revision ID: 4d7e2b9a1c63
+Revises: c3a8e5f19d27
+Create Date: 2026-10-18 23:14:08.215904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d7e2b9a1c63"
+down_revision: Union[str, Sequence[str], None] = "c3a8e5f19d27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NAMED_TABLES = ["cocktails", "ingredients", "tags"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() is only STABLE (its dictionary could change), so it can't be used
+    # in an index expression; pinning the dictionary makes an IMMUTABLE wrapper.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+    for table in NAMED_TABLES:
+        op.execute(
+            f"CREATE INDEX ix_{table}_name_trgm ON {table} "
+            "USING gin (f_unaccent(lower(name)) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in NAMED_TABLES:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_name_trgm")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -0,0 +1,43 @@
+"""Enforce recipe integrity in the database
+
+Revision ID: 5e3f633ea1cd
+Revises: 0644fd2ec76a
+Create Date: 2026-10-18 19:02:47.531920
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e3f633ea1cd"
+down_revision: Union[str, Sequence[str], None] = "0644fd2ec76a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "uq_steps_cocktail_id_first_step",
+        "steps",
+        ["cocktail_id"],
+        unique=True,
+        postgresql_where=sa.text("is_recipe_first_step"),
+    )
+    op.create_unique_constraint(
+        "uq_steps_next_step_id",
+        "steps",
+        ["next_step_id"],
+        deferrable=True,
+        initially="DEFERRED",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_steps_next_step_id", "steps", type_="unique")
+    op.drop_index("uq_steps_cocktail_id_first_step", table_name="steps")
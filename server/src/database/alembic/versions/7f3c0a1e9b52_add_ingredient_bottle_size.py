@@ -0,0 +1,29 @@
+"""Add a bottle size to ingredients
+
+Revision ID: 7f3c0a1e9b52
+Revises: 4d7e2b9a1c63
+Create Date: 2026-10-19 00:41:57.308126
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3c0a1e9b52"
+down_revision: Union[str, Sequence[str], None] = "4d7e2b9a1c63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("ingredients", sa.Column("bottle_size_ml", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("ingredients", "bottle_size_ml")
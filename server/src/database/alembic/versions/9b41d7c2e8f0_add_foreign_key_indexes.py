@@ -0,0 +1,42 @@
+"""Add indexes on foreign keys used by cocktail searches
+
+Revision ID: 9b41d7c2e8f0
+Revises: 5e3f633ea1cd
+Create Date: 2026-10-18 20:14:05.118342
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b41d7c2e8f0"
+down_revision: Union[str, Sequence[str], None] = "5e3f633ea1cd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # steps.cocktail_id is already the leading column of
+    # ix_steps_cocktail_id_position, which serves lookups by cocktail.
+    op.create_index(
+        op.f("ix_steps_ingredient_id"), "steps", ["ingredient_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_cocktail_tag_association_tag_id"),
+        "cocktail_tag_association",
+        ["tag_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_cocktail_tag_association_tag_id"),
+        table_name="cocktail_tag_association",
+    )
+    op.drop_index(op.f("ix_steps_ingredient_id"), table_name="steps")
@@ -0,0 +1,53 @@
+"""Delete tag associations along with their cocktail
+
+Revision ID: a6c2f8d40e17
+Revises: e4a9c71d3b58
+Create Date: 2026-10-20 10:12:48.306271
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6c2f8d40e17"
+down_revision: Union[str, Sequence[str], None] = "e4a9c71d3b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Steps already cascade from their cocktail; with tag associations doing the
+    # same, a cocktail can be deleted without loading its children
+    op.drop_constraint(
+        "cocktail_tag_association_cocktail_id_fkey",
+        "cocktail_tag_association",
+        type_="foreignkey",
+    )
+    op.create_foreign_key(
+        "cocktail_tag_association_cocktail_id_fkey",
+        "cocktail_tag_association",
+        "cocktails",
+        ["cocktail_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "cocktail_tag_association_cocktail_id_fkey",
+        "cocktail_tag_association",
+        type_="foreignkey",
+    )
+    op.create_foreign_key(
+        "cocktail_tag_association_cocktail_id_fkey",
+        "cocktail_tag_association",
+        "cocktails",
+        ["cocktail_id"],
+        ["id"],
+    )
@@ -0,0 +1,39 @@
+"""Add a precomputed recipe document to cocktails
+
+Revision ID: b8d41f6a2c90
+Revises: 7f3c0a1e9b52
+Create Date: 2026-10-19 09:12:40.518377
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8d41f6a2c90"
+down_revision: Union[str, Sequence[str], None] = "7f3c0a1e9b52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled by `python -m src.commands.rebuild_recipe_documents`; until then,
+    # reads fall back to loading the recipes
+    op.add_column(
+        "cocktails",
+        sa.Column(
+            "recipe_document",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("cocktails", "recipe_document")
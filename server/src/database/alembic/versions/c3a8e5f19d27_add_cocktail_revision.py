@@ -0,0 +1,32 @@
+"""Add a revision counter to cocktails
+
+Revision ID: c3a8e5f19d27
+Revises: 9b41d7c2e8f0
+Create Date: 2026-10-18 21:02:33.640871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a8e5f19d27"
+down_revision: Union[str, Sequence[str], None] = "9b41d7c2e8f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "cocktails",
+        sa.Column("revision", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("cocktails", "revision")
@@ -0,0 +1,47 @@
+"""Defer the one head per recipe check to the end of the transaction
+
+Revision ID: e4a9c71d3b58
+Revises: b8d41f6a2c90
+Create Date: 2026-10-19 14:27:03.884512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a9c71d3b58"
+down_revision: Union[str, Sequence[str], None] = "b8d41f6a2c90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Unique indexes are checked row by row and can't be deferred; an exclusion
+    # constraint over the same partial btree can, so one UPDATE can move the head
+    op.drop_index("uq_steps_cocktail_id_first_step", table_name="steps")
+    op.create_exclude_constraint(
+        "ex_steps_cocktail_id_first_step",
+        "steps",
+        ("cocktail_id", "="),
+        where=sa.text("is_recipe_first_step"),
+        using="btree",
+        deferrable=True,
+        initially="DEFERRED",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("ex_steps_cocktail_id_first_step", "steps")
+    op.create_index(
+        "uq_steps_cocktail_id_first_step",
+        "steps",
+        ["cocktail_id"],
+        unique=True,
+        postgresql_where=sa.text("is_recipe_first_step"),
+    )
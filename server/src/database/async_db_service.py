@@ -0,0 +1,36 @@
+from typing import Any, Callable
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.database.async_engine_registry import (
+    get_async_engine,
+    get_async_session_factory,
+)
+from src.database.constants import POSTGRESQL__ASYNCPG__DB_URI as async_pg_uri
+
+
+class AsyncPGDatabaseService:
+    """
+    Base of the asyncio services, sharing one asyncio engine and connection pool.
+    """
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return get_async_engine(async_pg_uri)
+
+    def get_session(self) -> AsyncSession:
+        """
+        Create a SQLAlchemy AsyncSession instance.
+        """
+        return get_async_session_factory(async_pg_uri)()
+
+    async def _run_sync(
+        self, session: AsyncSession, method: Callable, *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Runs a synchronous service method (decorated with with_upper_scope_session)
+        on the Session behind the AsyncSession, in the same transaction.
+        """
+        return await session.run_sync(
+            lambda sync_session: method(*args, session=sync_session, **kwargs)
+        )
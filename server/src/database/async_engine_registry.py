@@ -0,0 +1,74 @@
+from threading import Lock
+from typing import Dict
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from src.metrics.instrumentation import instrument_engine
+from src.settings import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+
+_async_engines: Dict[str, AsyncEngine] = {}
+_async_session_factories: Dict[str, async_sessionmaker] = {}
+_registry_lock = Lock()
+
+
+def get_async_engine(uri: str) -> AsyncEngine:
+    """
+    Returns the process-wide asyncio engine for the given URI, creating it (and its
+    connection pool) on first use. Pooled connections belong to the event loop
+    that opened them, so the engine must only be used from the serving loop.
+    """
+    engine = _async_engines.get(uri)
+    if engine is not None:
+        return engine
+    with _registry_lock:
+        engine = _async_engines.get(uri)
+        if engine is None:
+            engine = create_async_engine(
+                uri,
+                echo=False,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_pre_ping=DB_POOL_PRE_PING,
+                pool_recycle=DB_POOL_RECYCLE,
+                pool_timeout=DB_POOL_TIMEOUT,
+            )
+            instrument_engine(engine.sync_engine)
+            _async_engines[uri] = engine
+    return engine
+
+
+def get_async_session_factory(uri: str) -> async_sessionmaker:
+    """
+    Returns the process-wide async_sessionmaker bound to the engine for the URI.
+    Objects are not expired on commit: in asyncio mode attributes cannot be
+    lazily reloaded, so results must stay readable after the session commits.
+    """
+    factory = _async_session_factories.get(uri)
+    if factory is not None:
+        return factory
+    engine = get_async_engine(uri)
+    with _registry_lock:
+        factory = _async_session_factories.get(uri)
+        if factory is None:
+            factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+            _async_session_factories[uri] = factory
+    return factory
+
+
+async def dispose_async_engines() -> None:
+    """
+    Disposes every registered asyncio engine and forgets them, e.g. when the
+    serving loop shuts down.
+    """
+    with _registry_lock:
+        engines = list(_async_engines.values())
+        _async_engines.clear()
+        _async_session_factories.clear()
+    for engine in engines:
+        await engine.dispose()
@@ -0,0 +1,44 @@
+from functools import wraps
+from typing import Any
+
+from src.metrics.instrumentation import enter_service_call, exit_service_call
+
+
+async def _call_with_async_session(func, service, *args, **kwargs) -> Any:
+    session = kwargs.get("session")
+    if session is not None:
+        result = await func(service, *args, **kwargs)
+        await session.flush()
+        return result
+    async with service.get_session() as session:
+        kwargs["session"] = session
+        result = await func(service, *args, **kwargs)
+        await session.commit()
+        return result
+
+
+def with_upper_scope_async_session(func):
+    """
+    Asyncio counterpart of with_upper_scope_session, for coroutine service methods.
+    If a 'session' keyword argument is provided, it is used as-is and the caller
+    owns the transaction. If not, a new AsyncSession is created with
+    self.get_session(), injected into the call, committed after execution and
+    closed. Sessions don't expire objects on commit, so results need no refresh.
+    Every call is counted in the service metrics, see enter_service_call.
+    """
+
+    method = func.__qualname__
+
+    @wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        frame = enter_service_call(method)
+        try:
+            return await _call_with_async_session(func, self, *args, **kwargs)
+        except Exception:
+            if frame is not None:
+                frame.failed = True
+            raise
+        finally:
+            exit_service_call(frame)
+
+    return wrapper
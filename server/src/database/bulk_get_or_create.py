@@ -0,0 +1,65 @@
+from typing import Dict, Iterable, Type, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from src.database.named_entity_changes import track_created_named_entities
+from src.models.base_model import BaseModel
+
+NamedModel = TypeVar("NamedModel", bound=BaseModel)
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalizes an ingredient or tag name the way it is stored.
+    """
+    return name.strip().lower()
+
+
+def _get_insert(session: Session):
+    """
+    Returns the INSERT ... ON CONFLICT construct of the session's database.
+    SQLite only serves as a stand-in for PostgreSQL, e.g. in the benchmarks.
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite_insert
+    return pg_insert
+
+
+def get_or_create_by_name(
+    session: Session, model: Type[NamedModel], names: Iterable[str]
+) -> Dict[str, NamedModel]:
+    """
+    Resolves a batch of names of a model with a unique `name` column, creating the
+    missing rows. Costs one INSERT ... ON CONFLICT DO NOTHING RETURNING for the
+    whole batch, plus one SELECT for the names that already existed.
+    Never commits; the caller owns the transaction.
+    Returns a mapping from each given name to its entity.
+    """
+    normalized_by_name = {name: normalize_name(name) for name in names}
+    unique_names = sorted(set(normalized_by_name.values()))
+    if not unique_names:
+        return {}
+
+    created = session.execute(
+        _get_insert(session)(model)
+        .values([{"name": name} for name in unique_names])
+        .on_conflict_do_nothing(index_elements=[model.name])
+        .returning(model)
+    ).scalars()
+    entities_by_name = {entity.name: entity for entity in created}
+    track_created_named_entities(session, model, entities_by_name.values())
+
+    existing_names = [name for name in unique_names if name not in entities_by_name]
+    if existing_names:
+        existing = session.execute(
+            select(model).where(model.name.in_(existing_names))
+        ).scalars()
+        entities_by_name.update({entity.name: entity for entity in existing})
+
+    return {
+        name: entities_by_name[normalized]
+        for name, normalized in normalized_by_name.items()
+    }
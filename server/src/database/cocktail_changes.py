@@ -0,0 +1,64 @@
+from typing import Callable, Iterable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+CHANGED_COCKTAIL_IDS_KEY = "changed_cocktail_ids"
+
+CocktailChangesListener = Callable[[Set[int]], None]
+CocktailChangesCommittingListener = Callable[[Session, Set[int]], None]
+
+_committed_listeners: List[CocktailChangesListener] = []
+_committing_listeners: List[CocktailChangesCommittingListener] = []
+
+
+def track_cocktail_changes(session: Session, cocktail_ids: Iterable[int]) -> None:
+    """
+    Records that the given cocktails (or their steps) changed in the session's
+    current transaction. Listeners are notified once the transaction commits.
+    """
+    changed = session.info.setdefault(CHANGED_COCKTAIL_IDS_KEY, set())
+    changed.update(cocktail_id for cocktail_id in cocktail_ids if cocktail_id)
+
+
+def on_cocktail_changes_committed(
+    listener: CocktailChangesListener,
+) -> CocktailChangesListener:
+    """
+    Registers a listener called with the ids of the cocktails changed by every
+    committed transaction. Can be used as a decorator.
+    """
+    _committed_listeners.append(listener)
+    return listener
+
+
+def on_cocktail_changes_committing(
+    listener: CocktailChangesCommittingListener,
+) -> CocktailChangesCommittingListener:
+    """
+    Registers a listener called with the session and the ids of the changed
+    cocktails right before a transaction that changed cocktails commits, so it can
+    write in that same transaction. Can be used as a decorator.
+    """
+    _committing_listeners.append(listener)
+    return listener
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_committing_cocktail_changes(session: Session) -> None:
+    changed = session.info.get(CHANGED_COCKTAIL_IDS_KEY)
+    if not changed:
+        return
+    for listener in _committing_listeners:
+        listener(session, set(changed))
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_committed_cocktail_changes(session: Session) -> None:
+    # Ids tracked in a transaction that was rolled back stay in the session info
+    # and are reported with its next commit; listeners only ever over-refresh.
+    changed = session.info.pop(CHANGED_COCKTAIL_IDS_KEY, None)
+    if not changed:
+        return
+    for listener in _committed_listeners:
+        listener(changed)
@@ -1,27 +1,37 @@
-from sqlalchemy import create_engine, Engine
-from sqlalchemy_utils import create_database, database_exists
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
 
 from src.database.constants import POSTGRESQL__PSYCOPG2__DB_URI as pg_uri
+from src.database.engine_registry import get_engine, get_session_factory
+from src.database.name_search_schema import create_name_search_schema
+from src.database.schema_revision import check_schema_revision
+from src.settings import FAST_STARTUP
 
 
 class DBModel:
     def __init__(self) -> None:
-        self.engine = self._get_pg_engine_from_settings()
         super().__init__()
 
-    def _get_pg_engine_from_settings(self) -> Engine:
-        if not database_exists(pg_uri):
-            print("Database does not exist. Creating...")
-            create_database(pg_uri)
+    @property
+    def engine(self) -> Engine:
+        """
+        The shared engine, created on first use, so services that never touch
+        the synchronous engine (e.g. when wrapped by async services) don't connect.
+        """
+        return self._get_pg_engine_from_settings()
 
-        return create_engine(pg_uri, echo=False)
+    def _get_pg_engine_from_settings(self) -> Engine:
+        """
+        Returns the shared engine for the configured database. Every service
+        instance reuses the same engine and connection pool.
+        """
+        return get_engine(pg_uri)
 
     def get_session(self) -> Session:
         """
         Create a SQLAlchemy session instance.
         """
-        return sessionmaker(bind=self.engine)()
+        return get_session_factory(pg_uri)()
 
 
 class PGDatabaseService(DBModel):
@@ -40,6 +50,20 @@ class PGDatabaseService(DBModel):
         """
         print("Creating all tables...")
         BaseModel.metadata.create_all(self.engine)
+        # Name search relies on extensions and indexes create_all doesn't know of
+        if self.engine.dialect.name == "postgresql":
+            create_name_search_schema(self.engine)
+
+    def prepare_schema(self) -> None:
+        """
+        Makes sure the schema is ready: on FAST_STARTUP, checks that the database
+        is migrated to the latest Alembic revision, otherwise creates any missing
+        table.
+        """
+        if FAST_STARTUP:
+            check_schema_revision(self.engine)
+        else:
+            self.create_tables()
 
     def get_db_uri(self) -> str:
         """
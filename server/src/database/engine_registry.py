@@ -0,0 +1,103 @@
+from threading import Lock
+from typing import Dict
+
+from sqlalchemy import create_engine, Engine
+from sqlalchemy.orm import sessionmaker
+
+from src.metrics.instrumentation import instrument_engine
+from src.settings import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    FAST_STARTUP,
+)
+
+_engines: Dict[str, Engine] = {}
+_session_factories: Dict[str, sessionmaker] = {}
+_registry_lock = Lock()
+
+
+def _create_engine_for_uri(uri: str) -> Engine:
+    if not FAST_STARTUP:
+        _create_database_if_missing(uri)
+
+    engine = create_engine(
+        uri,
+        echo=False,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_timeout=DB_POOL_TIMEOUT,
+    )
+    instrument_engine(engine)
+    return engine
+
+
+def _create_database_if_missing(uri: str) -> None:
+    # Connects to the server's maintenance database, so it is skipped on
+    # FAST_STARTUP, where the database is provisioned and migrated beforehand
+    from sqlalchemy_utils import create_database, database_exists
+
+    if not database_exists(uri):
+        print("Database does not exist. Creating...")
+        create_database(uri)
+
+
+def get_engine(uri: str) -> Engine:
+    """
+    Returns the process-wide engine for the given URI, creating it (and its
+    connection pool) on first use. The database existence probe only runs once,
+    and not at all on FAST_STARTUP.
+    """
+    engine = _engines.get(uri)
+    if engine is not None:
+        return engine
+    with _registry_lock:
+        engine = _engines.get(uri)
+        if engine is None:
+            engine = _create_engine_for_uri(uri)
+            _engines[uri] = engine
+    return engine
+
+
+def register_engine(uri: str, engine: Engine) -> None:
+    """
+    Makes the services use an existing engine for the given URI instead of
+    creating one, e.g. a benchmark's stand-in database. Must be called before the
+    first session for that URI is opened.
+    """
+    instrument_engine(engine)
+    with _registry_lock:
+        _engines[uri] = engine
+        _session_factories.pop(uri, None)
+
+
+def get_session_factory(uri: str) -> sessionmaker:
+    """
+    Returns the process-wide sessionmaker bound to the engine for the given URI.
+    """
+    factory = _session_factories.get(uri)
+    if factory is not None:
+        return factory
+    engine = get_engine(uri)
+    with _registry_lock:
+        factory = _session_factories.get(uri)
+        if factory is None:
+            factory = sessionmaker(bind=engine)
+            _session_factories[uri] = factory
+    return factory
+
+
+def dispose_engines() -> None:
+    """
+    Disposes every registered engine and forgets them. Meant for process
+    shutdown and for forked workers, which must not share pooled connections.
+    """
+    with _registry_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+        _session_factories.clear()
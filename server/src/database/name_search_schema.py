@@ -0,0 +1,37 @@
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import DBAPIError
+
+NAMED_TABLES = ("cocktails", "ingredients", "tags")
+
+# What NameSearchService.search_names needs on top of the tables, as created by
+# the 4d7e2b9a1c63 migration. unaccent() is only STABLE (its dictionary could
+# change), so it can't be used in an index expression; pinning the dictionary
+# makes an IMMUTABLE wrapper.
+NAME_SEARCH_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    """,
+    *(
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_name_trgm ON {table} "
+        "USING gin (f_unaccent(lower(name)) gin_trgm_ops)"
+        for table in NAMED_TABLES
+    ),
+)
+
+
+def create_name_search_schema(engine: Engine) -> None:
+    """
+    Creates the trigram and unaccent extensions, the f_unaccent function and the
+    trigram name indexes, if missing. PostgreSQL only. Without the contrib
+    extensions, the rest of the app still works and only ranked search fails.
+    """
+    try:
+        with engine.begin() as connection:
+            for ddl in NAME_SEARCH_DDL:
+                connection.execute(text(ddl))
+    except DBAPIError as error:
+        print(f"Name search is unavailable, its schema can't be created: {error}")
@@ -0,0 +1,51 @@
+from typing import Callable, Iterable, List, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.models.base_model import BaseModel
+
+CREATED_NAMED_ENTITIES_KEY = "created_named_entities"
+
+# (model, id, name) of an ingredient or tag row
+CreatedNamedEntity = Tuple[Type[BaseModel], int, str]
+NamedEntitiesListener = Callable[[List[CreatedNamedEntity]], None]
+
+_created_listeners: List[NamedEntitiesListener] = []
+
+
+def track_created_named_entities(
+    session: Session, model: Type[BaseModel], entities: Iterable[BaseModel]
+) -> None:
+    """
+    Records ingredients or tags created in the session's current transaction.
+    Listeners are notified once the transaction commits.
+    """
+    created = session.info.setdefault(CREATED_NAMED_ENTITIES_KEY, [])
+    created.extend((model, entity.id, entity.name) for entity in entities)
+
+
+def on_named_entities_created(
+    listener: NamedEntitiesListener,
+) -> NamedEntitiesListener:
+    """
+    Registers a listener called with the ingredients and tags created by every
+    committed transaction. Can be used as a decorator.
+    """
+    _created_listeners.append(listener)
+    return listener
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_created_named_entities(session: Session) -> None:
+    created = session.info.pop(CREATED_NAMED_ENTITIES_KEY, None)
+    if not created:
+        return
+    for listener in _created_listeners:
+        listener(created)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_created_named_entities(session: Session) -> None:
+    # Rows inserted by a rolled back transaction never existed
+    session.info.pop(CREATED_NAMED_ENTITIES_KEY, None)
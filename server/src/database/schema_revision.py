@@ -0,0 +1,67 @@
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Set
+
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import DBAPIError
+
+ALEMBIC_VERSIONS_DIR = Path(__file__).parent / "alembic" / "versions"
+
+_REVISION_PATTERN = re.compile(r"^revision\b[^=]*=\s*['\"](\w+)['\"]", re.MULTILINE)
+_DOWN_REVISION_PATTERN = re.compile(r"^down_revision\b[^=]*=(.*)$", re.MULTILINE)
+_REVISION_ID_PATTERN = re.compile(r"['\"](\w+)['\"]")
+
+
+class SchemaRevisionError(RuntimeError):
+    pass
+
+
+@lru_cache(maxsize=1)
+def get_head_revisions() -> Set[str]:
+    """
+    Returns the head revisions of the migration scripts: the revisions no other
+    revision builds on. The scripts are scanned for their revision identifiers
+    rather than loaded through Alembic, which takes longer to import than the
+    whole check is meant to take.
+    """
+    revisions, down_revisions = set(), set()
+    for path in ALEMBIC_VERSIONS_DIR.glob("*.py"):
+        source = path.read_text(encoding="utf-8")
+        revision = _REVISION_PATTERN.search(source)
+        if revision is None:
+            continue
+        revisions.add(revision.group(1))
+        down_revision = _DOWN_REVISION_PATTERN.search(source)
+        if down_revision is not None:
+            down_revisions.update(_REVISION_ID_PATTERN.findall(down_revision.group(1)))
+    return revisions - down_revisions
+
+
+def get_database_revisions(engine: Engine) -> Set[str]:
+    """
+    Returns the revisions the database was migrated to, empty if it never was.
+    """
+    with engine.connect() as connection:
+        try:
+            return set(
+                connection.execute(text("SELECT version_num FROM alembic_version"))
+                .scalars()
+                .all()
+            )
+        except DBAPIError:
+            return set()
+
+
+def check_schema_revision(engine: Engine) -> None:
+    """
+    Raises SchemaRevisionError unless the database is migrated to the head of the
+    migration scripts. Costs a single query.
+    """
+    heads = get_head_revisions()
+    current = get_database_revisions(engine)
+    if current != heads:
+        raise SchemaRevisionError(
+            f"Database schema is at revision {sorted(current) or 'none'}, expected "
+            f"{sorted(heads)}. Run `alembic upgrade head`."
+        )
@@ -1,41 +1,124 @@
-from functools import wraps
+from collections import defaultdict
+from functools import partial, wraps
+from typing import Any, List
 
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Session
+
+from src.database.session_scope import SessionScope, get_current_session_scope
+from src.metrics.instrumentation import enter_service_call, exit_service_call
 from src.models.base_model import BaseModel
 
 
-def with_upper_scope_session(func):
+def _has_pending_changes(session: Session) -> bool:
+    return bool(session.new or session.dirty or session.deleted)
+
+
+def _reload_entities(session: Session, entities: List[BaseModel]) -> None:
+    """
+    Reloads entities expired by a commit with one SELECT per mapped class, rather
+    than one session.refresh() per entity.
+    """
+    entities_by_mapper = defaultdict(list)
+    for entity in entities:
+        state = inspect(entity)
+        if state.identity is not None:
+            entities_by_mapper[state.mapper].append(entity)
+    for mapper, mapped_entities in entities_by_mapper.items():
+        if len(mapper.primary_key) != 1:
+            for entity in mapped_entities:
+                session.refresh(entity)
+            continue
+        ids = [inspect(entity).identity[0] for entity in mapped_entities]
+        session.execute(
+            select(mapper)
+            .where(mapper.primary_key[0].in_(ids))
+            .execution_options(populate_existing=True)
+        ).scalars().all()
+
+
+def _reload_result(session: Session, result: Any) -> None:
+    if isinstance(result, BaseModel):
+        _reload_entities(session, [result])
+    elif isinstance(result, list) and all(
+        isinstance(item, BaseModel) for item in result
+    ):
+        _reload_entities(session, result)
+
+
+def _call_in_scope(
+    scope: SessionScope, func, read_only: bool, service, *args, **kwargs
+) -> Any:
+    """
+    Runs a service method on the session of the active SessionScope. A failing
+    call dooms the whole unit of work, even if the caller handles the error: a
+    write may have failed halfway.
+    """
+    session = kwargs["session"] = scope.get_session(service.get_session)
+    if not read_only:
+        scope.has_writes = True
+    try:
+        result = func(service, *args, **kwargs)
+    except Exception:
+        scope.failed = True
+        raise
+    if not read_only and _has_pending_changes(session):
+        session.flush()
+    return result
+
+
+def _call_with_session(func, read_only: bool, service, *args, **kwargs) -> Any:
+    session = kwargs.get("session")
+    if session is not None:
+        result = func(service, *args, **kwargs)
+        # Queries autoflush, so only the changes made by the call are pending
+        if not read_only and _has_pending_changes(session):
+            session.flush()
+        return result
+
+    scope = get_current_session_scope()
+    if scope is not None:
+        return _call_in_scope(scope, func, read_only, service, *args, **kwargs)
+
+    with service.get_session() as session:
+        kwargs["session"] = session
+        result = func(service, *args, **kwargs)
+        if read_only:
+            return result
+        session.commit()
+        _reload_result(session, result)
+        return result
+
+
+def with_upper_scope_session(func=None, *, read_only: bool = False):
     """
     Decorator for service methods to provide SQLAlchemy session management.
     If a 'session' keyword argument is provided, it is used as-is.
-    If not, the decorator creates a new session using self.get_session(), injects it
-    into the method call, commits after execution, and closes automatically.
+    If not, and a SessionScope is active (e.g. during a Flask request, see
+    init_request_sessions), the scope's session is injected and the scope commits
+    once it ends.
+    Otherwise the decorator creates a new session using self.get_session(), injects
+    it into the method call, commits after execution, and closes automatically.
     This allows methods to be used both with upper-scope sessions (for transaction
     control) or standalone with automatic session handling.
+    Methods marked with read_only=True never flush nor commit.
+    Every call is counted in the service metrics, see enter_service_call.
     """
+    if func is None:
+        return partial(with_upper_scope_session, read_only=read_only)
+
+    method = func.__qualname__
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        session = kwargs.get("session")
-        if session is not None:
-            # Ensure all pending changes are flushed before manipulation
-            session.flush()
-            result = func(self, *args, **kwargs)
-            session.flush()
-            return result
-        with self.get_session() as session:
-            kwargs["session"] = session
-            # Ensure all pending changes are flushed before manipulation
-            session.flush()
-            result = func(self, *args, **kwargs)
-            session.commit()
-            session.flush()
-            if isinstance(result, BaseModel):
-                session.refresh(result)
-            elif isinstance(result, list) and all(
-                isinstance(item, BaseModel) for item in result
-            ):
-                for item in result:
-                    session.refresh(item)
-            return result
+        frame = enter_service_call(method)
+        try:
+            return _call_with_session(func, read_only, self, *args, **kwargs)
+        except Exception:
+            if frame is not None:
+                frame.failed = True
+            raise
+        finally:
+            exit_service_call(frame)
 
     return wrapper
@@ -0,0 +1,94 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+
+class SessionScope:
+    """
+    Unit of work shared by every service call made while it is active. Its
+    session is opened by the first call that needs one, and is committed or rolled
+    back once, when the scope ends. Scopes where only read-only calls ran are
+    never committed.
+    """
+
+    def __init__(self) -> None:
+        self.session: Optional[Session] = None
+        self.has_writes = False
+        self.failed = False
+
+    def get_session(self, session_factory: Callable[[], Session]) -> Session:
+        if self.session is None:
+            self.session = session_factory()
+        return self.session
+
+    @property
+    def doomed(self) -> bool:
+        """
+        Whether the scope holds writes that will be rolled back because a call in
+        it failed.
+        """
+        return self.has_writes and self.failed
+
+    def commit(self) -> None:
+        """
+        Commits the unit of work, unless it holds no writes or a call in it failed,
+        in which case it is rolled back.
+        """
+        if self.session is None:
+            return
+        if self.has_writes and not self.failed:
+            self.session.commit()
+        else:
+            self.session.rollback()
+        self.has_writes = False
+
+    def close(self) -> None:
+        """
+        Closes the session, rolling back anything that was not committed.
+        """
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+
+_current_scope: ContextVar[Optional[SessionScope]] = ContextVar(
+    "session_scope", default=None
+)
+
+
+def get_current_session_scope() -> Optional[SessionScope]:
+    return _current_scope.get()
+
+
+def enter_session_scope() -> Token:
+    """
+    Makes a new SessionScope current in this context. The returned token is given
+    back to exit_session_scope, which closes the scope.
+    """
+    return _current_scope.set(SessionScope())
+
+
+def exit_session_scope(token: Token) -> None:
+    scope = _current_scope.get()
+    try:
+        if scope is not None:
+            scope.close()
+    finally:
+        _current_scope.reset(token)
+
+
+@contextmanager
+def session_scope() -> Iterator[SessionScope]:
+    """
+    Runs the block as one unit of work: service calls inside it share a session,
+    which is committed at the end of the block, or rolled back if it raises.
+    """
+    token = enter_session_scope()
+    try:
+        scope = _current_scope.get()
+        yield scope
+        scope.commit()
+    finally:
+        exit_session_scope(token)
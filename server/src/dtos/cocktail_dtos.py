@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from src.helpers.instruction_renderer import render_instructions, step_needs_ingredient
+from src.models.constants import (
+    CocktailGlassware,
+    MeasuringUnit,
+    MixologyTool,
+    StepAction,
+)
+
+
+def _enum_value(value: Any) -> Optional[str]:
+    return value.value if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class IngredientDTO:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class TagDTO:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class StepDTO:
+    action: StepAction
+    ingredient: Optional[IngredientDTO]
+    measuring_unit: Optional[MeasuringUnit]
+    quantity: Optional[float]
+    mixology_tool: Optional[MixologyTool]
+
+    def get_render_values(self) -> Tuple:
+        """
+        Returns the tuple used by the instruction renderer, see
+        Step.get_render_values.
+        """
+        ingredient_name = (
+            self.ingredient.name
+            if self.ingredient and step_needs_ingredient(self.action)
+            else None
+        )
+        return (
+            self.action,
+            ingredient_name,
+            self.measuring_unit,
+            self.quantity,
+            self.mixology_tool,
+        )
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "action": self.action.value,
+            "ingredient": self.ingredient.name if self.ingredient else None,
+            "measuring_unit": _enum_value(self.measuring_unit),
+            "quantity": self.quantity,
+            "mixology_tool": _enum_value(self.mixology_tool),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CocktailDTO:
+    """
+    Read-only snapshot of a cocktail and its recipe, built straight from result
+    rows (see CocktailService.load_recipe_dtos) instead of hydrated ORM objects.
+    Steps are in recipe order.
+    """
+
+    id: int
+    name: str
+    description: Optional[str]
+    glassware: Optional[CocktailGlassware]
+    revision: int
+    tags: Tuple[TagDTO, ...]
+    steps: Tuple[StepDTO, ...]
+
+    def get_human_readable_instructions(self) -> str:
+        return render_instructions(
+            (step.get_render_values() for step in self.steps), self.glassware
+        )
+
+    def to_payload(self) -> Dict[str, Any]:
+        """
+        Returns the JSON-ready payload, in the shape of serializers.serialize_cocktail.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "glassware": _enum_value(self.glassware),
+            "revision": self.revision,
+            "tags": [tag.name for tag in self.tags],
+            "steps": [step.to_payload() for step in self.steps],
+            "instructions": self.get_human_readable_instructions(),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class DeletedCocktailsDTO:
+    """
+    Rows removed by CocktailService.delete_cocktails.
+    """
+
+    cocktails: int = 0
+    steps: int = 0
+    tag_associations: int = 0
@@ -0,0 +1,144 @@
+import json
+
+from enum import Enum
+from typing import Any, Dict, List, Optional, Type
+
+import msgpack
+
+from src.models.constants import (
+    CocktailGlassware,
+    MeasuringUnit,
+    MixologyTool,
+    StepAction,
+)
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPE = "application/msgpack"
+
+# Bumped whenever the packed layout or the enum dictionaries change incompatibly
+MSGPACK_SCHEMA_VERSION = 1
+
+# Packed cocktails and steps are arrays with these fields, in this order
+COCKTAIL_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "glassware",
+    "revision",
+    "tags",
+    "steps",
+    "instructions",
+)
+STEP_FIELDS = ("action", "ingredient", "measuring_unit", "quantity", "mixology_tool")
+
+
+class _EnumDictionary:
+    """
+    Dictionary encoding of an enum's values: a member is packed as its position
+    in the enum definition, so new members must only ever be appended.
+    """
+
+    def __init__(self, enum: Type[Enum]) -> None:
+        self.values = [member.value for member in enum]
+        self.codes = {value: code for code, value in enumerate(self.values)}
+
+    def encode(self, value: Optional[str]) -> Optional[int]:
+        return self.codes[value] if value is not None else None
+
+    def decode(self, code: Optional[int]) -> Optional[str]:
+        return self.values[code] if code is not None else None
+
+
+_ACTIONS = _EnumDictionary(StepAction)
+_MEASURING_UNITS = _EnumDictionary(MeasuringUnit)
+_GLASSWARE = _EnumDictionary(CocktailGlassware)
+_MIXOLOGY_TOOLS = _EnumDictionary(MixologyTool)
+
+
+def encode_json(payload: Any) -> bytes:
+    """
+    Encodes a payload as compact UTF-8 JSON, without the whitespace and escaping
+    of the default encoder.
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def pack_step(step: Dict[str, Any]) -> List[Any]:
+    return [
+        _ACTIONS.encode(step["action"]),
+        step["ingredient"],
+        _MEASURING_UNITS.encode(step["measuring_unit"]),
+        step["quantity"],
+        _MIXOLOGY_TOOLS.encode(step["mixology_tool"]),
+    ]
+
+
+def unpack_step(packed: List[Any]) -> Dict[str, Any]:
+    action, ingredient, measuring_unit, quantity, mixology_tool = packed
+    return {
+        "action": _ACTIONS.decode(action),
+        "ingredient": ingredient,
+        "measuring_unit": _MEASURING_UNITS.decode(measuring_unit),
+        "quantity": quantity,
+        "mixology_tool": _MIXOLOGY_TOOLS.decode(mixology_tool),
+    }
+
+
+def pack_cocktail(cocktail: Dict[str, Any]) -> List[Any]:
+    """
+    Packs a cocktail payload (see CocktailDTO.to_payload) into a positional array
+    (see COCKTAIL_FIELDS) with dictionary-encoded enums.
+    """
+    return [
+        cocktail["id"],
+        cocktail["name"],
+        cocktail["description"],
+        _GLASSWARE.encode(cocktail["glassware"]),
+        cocktail["revision"],
+        cocktail["tags"],
+        [pack_step(step) for step in cocktail["steps"]],
+        cocktail["instructions"],
+    ]
+
+
+def unpack_cocktail(packed: List[Any]) -> Dict[str, Any]:
+    cocktail = dict(zip(COCKTAIL_FIELDS, packed))
+    cocktail["glassware"] = _GLASSWARE.decode(cocktail["glassware"])
+    cocktail["steps"] = [unpack_step(step) for step in cocktail["steps"]]
+    return cocktail
+
+
+def encode_msgpack(payload: Any) -> bytes:
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def decode_msgpack(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False)
+
+
+def encode_cocktails_msgpack(
+    cocktails: List[Dict[str, Any]], next_cursor: Optional[str] = None
+) -> bytes:
+    """
+    Encodes cocktail payloads as a MessagePack envelope:
+    {"schema": MSGPACK_SCHEMA_VERSION, "items": [packed cocktail, ...],
+    "next_cursor": ...}.
+    """
+    return encode_msgpack(
+        {
+            "schema": MSGPACK_SCHEMA_VERSION,
+            "items": [pack_cocktail(cocktail) for cocktail in cocktails],
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+def decode_cocktails_msgpack(data: bytes) -> Dict[str, Any]:
+    """
+    Decodes an envelope of encode_cocktails_msgpack back into cocktail payloads.
+    """
+    envelope = decode_msgpack(data)
+    if envelope.get("schema") != MSGPACK_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported schema version: {envelope.get('schema')}")
+    envelope["items"] = [unpack_cocktail(packed) for packed in envelope["items"]]
+    return envelope
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from src.models.constants import MeasuringUnit
+
+
+@dataclass(frozen=True, slots=True)
+class ShoppingListItem:
+    """
+    Total amount of one ingredient in one canonical unit (ml, gram, or a count
+    unit). quantity is None when the recipes don't say how much to use.
+    """
+
+    ingredient_id: int
+    ingredient: str
+    measuring_unit: Optional[MeasuringUnit]
+    quantity: Optional[float]
+    cocktail_count: int
+    bottle_size_ml: Optional[float] = None
+    bottles: Optional[int] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "ingredient_id": self.ingredient_id,
+            "ingredient": self.ingredient,
+            "measuring_unit": (
+                self.measuring_unit.value if self.measuring_unit else None
+            ),
+            "quantity": self.quantity,
+            "cocktail_count": self.cocktail_count,
+            "bottle_size_ml": self.bottle_size_ml,
+            "bottles": self.bottles,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ShoppingList:
+    items: Tuple[ShoppingListItem, ...]
+    missing_cocktail_ids: Tuple[int, ...] = ()
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "items": [item.to_payload() for item in self.items],
+            "missing_cocktail_ids": list(self.missing_cocktail_ids),
+        }
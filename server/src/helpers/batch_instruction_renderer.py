@@ -0,0 +1,82 @@
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.helpers.instruction_renderer import (
+    render_step,
+    step_needs_glassware,
+    step_needs_ingredient,
+)
+from src.models.constants import StepAction
+
+STEP_FRAME_COLUMNS = [
+    "cocktail_id",
+    "position",
+    "action",
+    "ingredient_name",
+    "measuring_unit",
+    "quantity",
+    "mixology_tool",
+    "glassware",
+]
+RENDER_KEY_COLUMNS = [
+    "action",
+    "ingredient_name",
+    "measuring_unit",
+    "quantity",
+    "mixology_tool",
+    "glassware",
+]
+
+_ACTIONS_WITH_INGREDIENT = [a for a in StepAction if step_needs_ingredient(a)]
+_ACTIONS_WITH_GLASSWARE = [a for a in StepAction if step_needs_glassware(a)]
+
+
+def build_step_frame(rows: Iterable[Sequence]) -> pd.DataFrame:
+    """
+    Builds the columnar step frame (see STEP_FRAME_COLUMNS) from result rows.
+    Rows of cocktails without steps carry a null action.
+    """
+    frame = pd.DataFrame.from_records(rows, columns=STEP_FRAME_COLUMNS)
+    # Keep missing quantities as None rather than NaN, like the ORM path does
+    frame["quantity"] = frame["quantity"].astype(object)
+    frame.loc[frame["quantity"].isna(), "quantity"] = None
+    return frame
+
+
+def render_instructions_frame(frame: pd.DataFrame) -> Dict[int, str]:
+    """
+    Renders the instructions of every cocktail in a step frame at once.
+    Values a step's template does not use are masked, so the frame collapses to
+    its distinct (action, ingredient, unit, quantity, tool, glassware) keys. Each
+    key is rendered once and broadcast back, then lines are numbered and joined
+    per cocktail with grouped string operations.
+    Returns {cocktail_id: instructions}; cocktails without steps map to "".
+    """
+    instructions = {int(cocktail_id): "" for cocktail_id in frame["cocktail_id"]}
+    steps = frame[frame["action"].notna()].sort_values(["cocktail_id", "position"])
+    if steps.empty:
+        return instructions
+
+    steps = steps.copy()
+    uses_ingredient = steps["action"].isin(_ACTIONS_WITH_INGREDIENT)
+    for column in ("ingredient_name", "measuring_unit", "quantity"):
+        steps.loc[~uses_ingredient, column] = None
+    steps.loc[~steps["action"].isin(_ACTIONS_WITH_GLASSWARE), "glassware"] = None
+
+    render_keys = pd.Series(
+        list(steps[RENDER_KEY_COLUMNS].itertuples(index=False, name=None)),
+        index=steps.index,
+        dtype=object,
+    )
+    key_ids, unique_keys = pd.factorize(render_keys)
+    rendered_keys = np.array([render_step(*key) for key in unique_keys], dtype=object)
+
+    step_numbers = steps.groupby("cocktail_id", sort=False).cumcount() + 1
+    lines = "Step " + step_numbers.astype(str) + ": " + rendered_keys[key_ids]
+    joined = lines.groupby(steps["cocktail_id"], sort=False).agg("\n".join)
+    instructions.update(
+        (int(cocktail_id), text) for cocktail_id, text in joined.items()
+    )
+    return instructions
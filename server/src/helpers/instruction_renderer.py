@@ -0,0 +1,160 @@
+import re
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.helpers.number_helper import (
+    measured_ingredient_to_pluralized_string,
+    pluralize_word,
+    quantity_to_normalized_string,
+)
+from src.models.constants import (
+    ActionToHumanReadableMapper,
+    CocktailGlassware,
+    MeasuringUnit,
+    MixologyTool,
+    StepAction,
+)
+
+RENDERED_STEP_CACHE_SIZE = 16384
+
+INGREDIENT_PLACEHOLDER = ":ingredient"
+OBJECT_PLACEHOLDER = ":object"
+GLASSWARE_PLACEHOLDER = ":glassware"
+
+_PLACEHOLDER_PATTERN = re.compile(
+    f"({INGREDIENT_PLACEHOLDER}|{OBJECT_PLACEHOLDER}|{GLASSWARE_PLACEHOLDER})"
+)
+_SPACES_PATTERN = re.compile(" +")
+
+
+def _normalize_text(text: str) -> str:
+    """
+    Applies the instruction text normalization: underscores become spaces,
+    everything is lowercased and repeated spaces are collapsed.
+    """
+    return _SPACES_PATTERN.sub(" ", text.replace("_", " ").lower())
+
+
+class CompiledStepTemplate:
+    """
+    An ActionToHumanReadableMapper template split once into static text and
+    placeholders, with the static text already normalized.
+    """
+
+    __slots__ = ("parts", "placeholders")
+
+    def __init__(self, template: str) -> None:
+        self.parts: List[Tuple[bool, str]] = [
+            (
+                (True, part)
+                if _PLACEHOLDER_PATTERN.fullmatch(part)
+                else (False, _normalize_text(part))
+            )
+            for part in _PLACEHOLDER_PATTERN.split(template)
+            if part
+        ]
+        self.placeholders = frozenset(
+            part for is_placeholder, part in self.parts if is_placeholder
+        )
+
+    def render(self, fragments: Dict[str, str]) -> str:
+        return "".join(
+            fragments[part] if is_placeholder else part
+            for is_placeholder, part in self.parts
+        )
+
+
+COMPILED_STEP_TEMPLATES: Dict[StepAction, CompiledStepTemplate] = {
+    action: CompiledStepTemplate(ActionToHumanReadableMapper.get(action, action.value))
+    for action in StepAction
+}
+
+
+def step_needs_glassware(action: StepAction) -> bool:
+    return GLASSWARE_PLACEHOLDER in COMPILED_STEP_TEMPLATES[action].placeholders
+
+
+def step_needs_ingredient(action: StepAction) -> bool:
+    return INGREDIENT_PLACEHOLDER in COMPILED_STEP_TEMPLATES[action].placeholders
+
+
+@lru_cache(maxsize=RENDERED_STEP_CACHE_SIZE)
+def _render_step(
+    action: StepAction,
+    ingredient_name: Optional[str],
+    measuring_unit: Optional[MeasuringUnit],
+    quantity: Optional[float],
+    mixology_tool: Optional[MixologyTool],
+    glassware: Optional[CocktailGlassware],
+) -> str:
+    template = COMPILED_STEP_TEMPLATES[action]
+    fragments = {}
+    if INGREDIENT_PLACEHOLDER in template.placeholders:
+        fragments[INGREDIENT_PLACEHOLDER] = (
+            measured_ingredient_to_pluralized_string(
+                ingredient_name=ingredient_name,
+                measuring_unit=measuring_unit,
+                quantity=quantity,
+            )
+            if ingredient_name
+            else "ingredient"
+        )
+    if OBJECT_PLACEHOLDER in template.placeholders:
+        fragments[OBJECT_PLACEHOLDER] = (
+            mixology_tool.value if mixology_tool else "object"
+        )
+    if GLASSWARE_PLACEHOLDER in template.placeholders:
+        fragments[GLASSWARE_PLACEHOLDER] = (
+            glassware or CocktailGlassware.LOWBALL
+        ).value
+    return _normalize_text(template.render(fragments)).strip().capitalize()
+
+
+def render_step(
+    action: StepAction,
+    ingredient_name: Optional[str] = None,
+    measuring_unit: Optional[MeasuringUnit] = None,
+    quantity: Optional[float] = None,
+    mixology_tool: Optional[MixologyTool] = None,
+    glassware: Optional[CocktailGlassware] = None,
+) -> str:
+    """
+    Renders a human-readable step explanation, e.g. "Add 50 ml of vodka".
+    Values the action template does not use are dropped before the cached lookup,
+    so e.g. every "shake the cocktail shaker" step shares one cache entry.
+    """
+    placeholders = COMPILED_STEP_TEMPLATES[action].placeholders
+    if INGREDIENT_PLACEHOLDER not in placeholders:
+        ingredient_name = measuring_unit = quantity = None
+    if OBJECT_PLACEHOLDER not in placeholders:
+        mixology_tool = None
+    if GLASSWARE_PLACEHOLDER not in placeholders:
+        glassware = None
+    return _render_step(
+        action, ingredient_name, measuring_unit, quantity, mixology_tool, glassware
+    )
+
+
+def render_instructions(
+    steps: Iterable[Tuple], glassware: Optional[CocktailGlassware] = None
+) -> str:
+    """
+    Renders a whole recipe in a single pass over its ordered steps, given as
+    (action, ingredient_name, measuring_unit, quantity, mixology_tool) tuples.
+    """
+    return "\n".join(
+        f"Step {i}: {render_step(*step, glassware=glassware)}"
+        for i, step in enumerate(steps, start=1)
+    )
+
+
+def get_rendering_cache_info() -> Dict[str, Any]:
+    """
+    Returns the hit/miss statistics of the rendering caches.
+    """
+    return {
+        "rendered_steps": _render_step.cache_info(),
+        "plural_forms": pluralize_word.cache_info(),
+        "quantities": quantity_to_normalized_string.cache_info(),
+    }
@@ -1,31 +1,51 @@
-import inflect
-
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 from decimal import Decimal
 
 from src.models.constants import PLURALIZABLE_MEASURING_UNITS, MeasuringUnit
 
+if TYPE_CHECKING:
+    import inflect
+
+PLURAL_CACHE_SIZE = 4096
+QUANTITY_CACHE_SIZE = 4096
+
+_inflect_engine: Optional["inflect.engine"] = None
+
+
+def _get_inflect_engine() -> "inflect.engine":
+    """
+    Returns the shared inflect engine, built on first use. inflect is imported
+    here, as importing it takes longer than the rest of the app's startup.
+    """
+    global _inflect_engine
+    if _inflect_engine is None:
+        import inflect
+
+        _inflect_engine = inflect.engine()
+    return _inflect_engine
 
+
+@lru_cache(maxsize=PLURAL_CACHE_SIZE)
 def pluralize_word(word: str) -> str:
     """
     Pluralizes a given word using the inflect library.
     """
-    eng = inflect.engine()
-    return eng.plural(word)
+    return _get_inflect_engine().plural(word)
 
 
+@lru_cache(maxsize=QUANTITY_CACHE_SIZE)
 def quantity_to_normalized_string(quantity: Optional[int] = None) -> str:
     """
-    Returns a human-readable string for the quantity without trailing zeros
+    Returns a human-readable string for the quantity without trailing zeros.
+    Floats go through their shortest repr, so 0.1 reads "0.1" rather than its
+    exact binary expansion.
     """
     if quantity is None:
         return None
-    normalized_quantity = Decimal(quantity).normalize()
-    quantity_str = (
-        format(normalized_quantity, "f").rstrip("0").rstrip(".")
-        if "." in format(normalized_quantity, "f")
-        else format(normalized_quantity, "f")
-    )
+    quantity_str = format(Decimal(str(quantity)).normalize(), "f")
+    if "." in quantity_str:
+        quantity_str = quantity_str.rstrip("0").rstrip(".")
     return quantity_str
 
 
@@ -0,0 +1,126 @@
+from typing import Dict, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.dtos.shopping_list_dtos import ShoppingList, ShoppingListItem
+from src.helpers.unit_conversion import (
+    QUANTITY_DECIMALS,
+    from_unit_codes,
+    is_count_unit,
+    to_base_units,
+    to_quantity_array,
+    to_unit_codes,
+)
+from src.models.constants import MeasuringUnit
+
+INGREDIENT_FRAME_COLUMNS = [
+    "cocktail_id",
+    "ingredient_id",
+    "ingredient_name",
+    "measuring_unit",
+    "quantity",
+    "bottle_size_ml",
+]
+
+_ML_CODE = to_unit_codes([MeasuringUnit.ML])[0]
+
+
+def build_ingredient_frame(rows: Iterable[Sequence]) -> pd.DataFrame:
+    """
+    Builds the columnar ingredient frame (see INGREDIENT_FRAME_COLUMNS) from the
+    rows of ADD_INGREDIENT steps. Cocktails without ingredients carry a row with
+    a null ingredient_id.
+    """
+    return pd.DataFrame.from_records(rows, columns=INGREDIENT_FRAME_COLUMNS)
+
+
+def plan_shopping_list(
+    frame: pd.DataFrame,
+    servings_by_cocktail_id: Mapping[int, float],
+    bottle_sizes: Optional[Dict[int, float]] = None,
+) -> ShoppingList:
+    """
+    Totals what the cocktails of an ingredient frame need for the given servings.
+    Step quantities are multiplied by their cocktail's servings and converted to
+    ml or grams in whole-column operations, then summed per (ingredient, unit)
+    with a single groupby. Count units keep their unit and are rounded up.
+    Bottles are counted for volumes of ingredients with a bottle size, given by
+    `bottle_sizes` ({ingredient_id: ml}) or stored on the ingredient.
+    """
+    found_ids = set(frame["cocktail_id"].tolist())
+    missing_ids = tuple(sorted(set(servings_by_cocktail_id) - found_ids))
+    steps = frame[frame["ingredient_id"].notna()]
+    if steps.empty:
+        return ShoppingList((), missing_ids)
+
+    servings = steps["cocktail_id"].map(servings_by_cocktail_id).to_numpy(float)
+    quantities, unit_codes = to_base_units(
+        to_quantity_array(steps["quantity"]) * servings,
+        to_unit_codes(steps["measuring_unit"]),
+    )
+    bottle_size_ml = steps["bottle_size_ml"].astype(float)
+    if bottle_sizes:
+        overrides = steps["ingredient_id"].map(bottle_sizes).astype(float)
+        bottle_size_ml = overrides.fillna(bottle_size_ml)
+
+    totals = (
+        pd.DataFrame(
+            {
+                "ingredient_id": steps["ingredient_id"].astype(np.int64).to_numpy(),
+                "ingredient_name": steps["ingredient_name"].to_numpy(),
+                "unit_code": unit_codes,
+                "quantity": quantities,
+                "cocktail_id": steps["cocktail_id"].to_numpy(),
+                "bottle_size_ml": bottle_size_ml.to_numpy(),
+            }
+        )
+        .groupby(["ingredient_id", "unit_code"], sort=False)
+        .agg(
+            ingredient_name=("ingredient_name", "first"),
+            quantity=("quantity", "sum"),
+            measured_steps=("quantity", "count"),
+            cocktail_count=("cocktail_id", "nunique"),
+            bottle_size_ml=("bottle_size_ml", "first"),
+        )
+        .reset_index()
+        .sort_values(["ingredient_name", "unit_code"])
+    )
+
+    unit_codes = totals["unit_code"].to_numpy()
+    quantity = totals["quantity"].to_numpy()
+    quantity = np.where(
+        is_count_unit(unit_codes),
+        np.ceil(quantity),
+        np.round(quantity, QUANTITY_DECIMALS),
+    )
+    # Unmeasured steps alone ("top up with soda") don't add up to an amount
+    quantity[totals["measured_steps"].to_numpy() == 0] = np.nan
+    sizes = totals["bottle_size_ml"].to_numpy()
+    has_bottles = (unit_codes == _ML_CODE) & (sizes > 0) & ~np.isnan(quantity)
+    bottles = np.full(len(totals), np.nan)
+    bottles[has_bottles] = np.ceil(quantity[has_bottles] / sizes[has_bottles])
+
+    items = tuple(
+        ShoppingListItem(
+            ingredient_id=int(row.ingredient_id),
+            ingredient=row.ingredient_name,
+            measuring_unit=unit,
+            quantity=_none_if_nan(item_quantity),
+            cocktail_count=int(row.cocktail_count),
+            bottle_size_ml=float(row.bottle_size_ml) if has_bottle else None,
+            bottles=int(item_bottles) if has_bottle else None,
+        )
+        for row, unit, item_quantity, has_bottle, item_bottles in zip(
+            totals.itertuples(index=False),
+            from_unit_codes(unit_codes),
+            quantity.tolist(),
+            has_bottles.tolist(),
+            bottles.tolist(),
+        )
+    )
+    return ShoppingList(items, missing_ids)
+
+
+def _none_if_nan(value: float) -> Optional[float]:
+    return None if np.isnan(value) else value
@@ -0,0 +1,31 @@
+import re
+import unicodedata
+
+from functools import lru_cache
+from typing import List
+
+FOLD_CACHE_SIZE = 4096
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=FOLD_CACHE_SIZE)
+def fold_text(text: str) -> str:
+    """
+    Folds text for accent- and case-insensitive matching: accents are stripped
+    ("cachaça" -> "cachaca"), case is folded and runs of whitespace collapse to one
+    space.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def get_word_suffixes(folded_text: str) -> List[str]:
+    """
+    Returns the folded text from the start of each of its words, e.g.
+    "whiskey sour" -> ["whiskey sour", "sour"].
+    """
+    return [
+        folded_text[match.start() :] for match in _WORD_PATTERN.finditer(folded_text)
+    ]
@@ -0,0 +1,271 @@
+from dataclasses import replace
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.dtos.cocktail_dtos import CocktailDTO
+from src.models.constants import MeasuringUnit, UnitDimension
+
+# Scaled and converted volumes and masses are rounded to this many decimals
+QUANTITY_DECIMALS = 2
+
+UNIT_DIMENSIONS = {
+    MeasuringUnit.ML: UnitDimension.VOLUME,
+    MeasuringUnit.OZ: UnitDimension.VOLUME,
+    MeasuringUnit.TSP: UnitDimension.VOLUME,
+    MeasuringUnit.TBSP: UnitDimension.VOLUME,
+    MeasuringUnit.CUP: UnitDimension.VOLUME,
+    MeasuringUnit.PINT: UnitDimension.VOLUME,
+    MeasuringUnit.QUART: UnitDimension.VOLUME,
+    MeasuringUnit.GALLON: UnitDimension.VOLUME,
+    MeasuringUnit.LITER: UnitDimension.VOLUME,
+    MeasuringUnit.GRAM: UnitDimension.MASS,
+    MeasuringUnit.KG: UnitDimension.MASS,
+    MeasuringUnit.LB: UnitDimension.MASS,
+    MeasuringUnit.DASH: UnitDimension.COUNT,
+    MeasuringUnit.PINCH: UnitDimension.COUNT,
+    MeasuringUnit.SLICE: UnitDimension.COUNT,
+    MeasuringUnit.WEDGE: UnitDimension.COUNT,
+    MeasuringUnit.PIECE: UnitDimension.COUNT,
+    MeasuringUnit.CUBE: UnitDimension.COUNT,
+    MeasuringUnit.LEAF: UnitDimension.COUNT,
+}
+
+BASE_UNITS = {
+    UnitDimension.VOLUME: MeasuringUnit.ML,
+    UnitDimension.MASS: MeasuringUnit.GRAM,
+}
+
+# Size of one unit in the base unit of its dimension (US customary volumes)
+UNIT_FACTORS = {
+    MeasuringUnit.ML: 1.0,
+    MeasuringUnit.OZ: 29.5735295625,
+    MeasuringUnit.TSP: 4.92892159375,
+    MeasuringUnit.TBSP: 14.78676478125,
+    MeasuringUnit.CUP: 236.5882365,
+    MeasuringUnit.PINT: 473.176473,
+    MeasuringUnit.QUART: 946.352946,
+    MeasuringUnit.GALLON: 3785.411784,
+    MeasuringUnit.LITER: 1000.0,
+    MeasuringUnit.GRAM: 1.0,
+    MeasuringUnit.KG: 1000.0,
+    MeasuringUnit.LB: 453.59237,
+}
+
+# Code of a step without measuring unit (e.g. "5 ice"), which counts items
+NO_UNIT = -1
+
+# Lookup tables indexed by unit code, the unit's position in MeasuringUnit. The
+# extra last entry is for NO_UNIT, so that code -1 indexes it.
+_UNITS = list(MeasuringUnit)
+_UNIT_CODES = {unit: code for code, unit in enumerate(_UNITS)}
+_DIMENSIONS = list(UnitDimension)
+_DIMENSION_CODES = np.array(
+    [_DIMENSIONS.index(UNIT_DIMENSIONS[unit]) for unit in _UNITS]
+    + [_DIMENSIONS.index(UnitDimension.COUNT)],
+    dtype=np.int8,
+)
+_FACTORS = np.array([UNIT_FACTORS.get(unit, 1.0) for unit in _UNITS] + [1.0])
+_BASE_UNIT_CODES = np.array(
+    [_UNIT_CODES[BASE_UNITS.get(UNIT_DIMENSIONS[unit], unit)] for unit in _UNITS]
+    + [NO_UNIT],
+    dtype=np.int16,
+)
+_VOLUME = _DIMENSIONS.index(UnitDimension.VOLUME)
+_COUNT = _DIMENSIONS.index(UnitDimension.COUNT)
+
+
+class UnitConversionError(ValueError):
+    pass
+
+
+def to_unit_codes(units: Iterable[Optional[MeasuringUnit]]) -> np.ndarray:
+    return np.fromiter(
+        (NO_UNIT if unit is None else _UNIT_CODES[unit] for unit in units),
+        dtype=np.int16,
+    )
+
+
+def from_unit_codes(codes: np.ndarray) -> List[Optional[MeasuringUnit]]:
+    return [None if code == NO_UNIT else _UNITS[code] for code in codes.tolist()]
+
+
+def is_count_unit(codes: np.ndarray) -> np.ndarray:
+    """
+    Returns which unit codes are count units (including NO_UNIT), element-wise.
+    """
+    return _DIMENSION_CODES[codes] == _COUNT
+
+
+def to_quantity_array(quantities: Iterable[Optional[float]]) -> np.ndarray:
+    """
+    Returns the quantities as a float array, missing quantities being NaN.
+    """
+    return np.fromiter(
+        (np.nan if quantity is None else quantity for quantity in quantities),
+        dtype=np.float64,
+    )
+
+
+def convert_quantities(
+    quantities: np.ndarray, from_codes: np.ndarray, to_codes: np.ndarray
+) -> np.ndarray:
+    """
+    Converts quantities between units of the same dimension, element-wise.
+    Count units only "convert" to themselves; anything else raises
+    UnitConversionError rather than guessing.
+    """
+    from_codes, to_codes = np.broadcast_arrays(from_codes, to_codes)
+    incompatible = _DIMENSION_CODES[from_codes] != _DIMENSION_CODES[to_codes]
+    incompatible |= (_DIMENSION_CODES[from_codes] == _COUNT) & (from_codes != to_codes)
+    if incompatible.any():
+        index = int(np.flatnonzero(incompatible)[0])
+        raise UnitConversionError(
+            f"Cannot convert {_describe(from_codes[index])} "
+            f"to {_describe(to_codes[index])}"
+        )
+    converted = quantities * (_FACTORS[from_codes] / _FACTORS[to_codes])
+    return np.where(
+        _DIMENSION_CODES[to_codes] == _COUNT,
+        converted,
+        np.round(converted, QUANTITY_DECIMALS),
+    )
+
+
+def convert_quantity(
+    quantity: float, from_unit: MeasuringUnit, to_unit: MeasuringUnit
+) -> float:
+    return float(
+        convert_quantities(
+            np.array([quantity], dtype=np.float64),
+            to_unit_codes([from_unit]),
+            to_unit_codes([to_unit]),
+        )[0]
+    )
+
+
+def to_base_units(
+    quantities: np.ndarray, codes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts volumes to ml and masses to grams; count units are left as they are.
+    Returns the converted quantities and their unit codes.
+    """
+    base_codes = _BASE_UNIT_CODES[codes]
+    return convert_quantities(quantities, codes, base_codes), base_codes
+
+
+def get_recipe_volumes(
+    quantities: np.ndarray, codes: np.ndarray, recipe_index: np.ndarray, count: int
+) -> np.ndarray:
+    """
+    Returns the total volume in ml of each of `count` recipes, given the steps of
+    all of them and the recipe each step belongs to. Masses and counts are not
+    part of the volume.
+    """
+    is_volume = (_DIMENSION_CODES[codes] == _VOLUME) & ~np.isnan(quantities)
+    return np.bincount(
+        recipe_index[is_volume],
+        weights=quantities[is_volume] * _FACTORS[codes[is_volume]],
+        minlength=count,
+    )
+
+
+def scale_quantities(
+    quantities: np.ndarray,
+    codes: np.ndarray,
+    factors: np.ndarray,
+    round_counts: bool = True,
+) -> np.ndarray:
+    """
+    Multiplies each quantity by its factor. Volumes and masses are rounded to
+    QUANTITY_DECIMALS. Count units are rounded to whole items if round_counts is
+    set, never below one item (half a lime wedge is still a wedge).
+    """
+    scaled = quantities * factors
+    is_count = is_count_unit(codes)
+    if round_counts:
+        whole = np.maximum(np.round(scaled), 1.0)
+        scaled = np.where(is_count & (scaled > 0), whole, scaled)
+    return np.where(is_count, scaled, np.round(scaled, QUANTITY_DECIMALS))
+
+
+def _describe(code: int) -> str:
+    return "unitless counts" if code == NO_UNIT else _UNITS[code].value
+
+
+def _flatten_steps(
+    cocktails: Sequence[CocktailDTO],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the quantities, unit codes and recipe index of every step of the
+    given cocktails, as flat arrays.
+    """
+    steps = [step for cocktail in cocktails for step in cocktail.steps]
+    recipe_index = np.repeat(
+        np.arange(len(cocktails)), [len(cocktail.steps) for cocktail in cocktails]
+    )
+    return (
+        to_quantity_array(step.quantity for step in steps),
+        to_unit_codes(step.measuring_unit for step in steps),
+        recipe_index,
+    )
+
+
+def _rebuild(
+    cocktails: Sequence[CocktailDTO], quantities: np.ndarray, codes: np.ndarray
+) -> List[CocktailDTO]:
+    """
+    Returns copies of the cocktails whose steps take their quantities and units
+    from the flat arrays, in _flatten_steps order.
+    """
+    quantity_list = [None if np.isnan(q) else q for q in quantities.tolist()]
+    unit_list = from_unit_codes(codes)
+    rebuilt, offset = [], 0
+    for cocktail in cocktails:
+        steps = tuple(
+            replace(step, quantity=quantity_list[i], measuring_unit=unit_list[i])
+            for i, step in enumerate(cocktail.steps, start=offset)
+        )
+        offset += len(steps)
+        rebuilt.append(replace(cocktail, steps=steps))
+    return rebuilt
+
+
+def scale_recipes(
+    cocktails: Sequence[CocktailDTO],
+    servings: Optional[float] = None,
+    target_volume_ml: Optional[float] = None,
+    round_counts: bool = True,
+) -> List[CocktailDTO]:
+    """
+    Scales a batch of recipes (one serving each) to a number of servings, or so
+    that the liquid volume of each recipe reaches target_volume_ml. All step
+    quantities are scaled in one pass over flat arrays. Units are kept; count
+    units are handled as in scale_quantities.
+    """
+    if (servings is None) == (target_volume_ml is None):
+        raise ValueError("Give either servings or target_volume_ml")
+    quantities, codes, recipe_index = _flatten_steps(cocktails)
+    if servings is not None:
+        recipe_factors = np.full(len(cocktails), float(servings))
+    else:
+        volumes = get_recipe_volumes(quantities, codes, recipe_index, len(cocktails))
+        without_volume = [c.id for c, v in zip(cocktails, volumes.tolist()) if v <= 0]
+        if without_volume:
+            raise UnitConversionError(
+                f"Cocktails {without_volume} have no volume to scale to a target"
+            )
+        recipe_factors = target_volume_ml / volumes
+    scaled = scale_quantities(
+        quantities, codes, recipe_factors[recipe_index], round_counts=round_counts
+    )
+    return _rebuild(cocktails, scaled, codes)
+
+
+def normalize_recipes(cocktails: Sequence[CocktailDTO]) -> List[CocktailDTO]:
+    """
+    Expresses every volume in ml and every mass in grams, see to_base_units.
+    """
+    quantities, codes, _ = _flatten_steps(cocktails)
+    return _rebuild(cocktails, *to_base_units(quantities, codes))
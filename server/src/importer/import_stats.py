@@ -0,0 +1,107 @@
+import json
+import os
+import time
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class ImportStats:
+    """
+    Counters and per-stage timings of a recipe import run.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.stage_seconds: Dict[str, float] = {}
+        self.recipes_read = 0
+        self.cocktails_inserted = 0
+        self.cocktails_skipped = 0
+        self.steps_inserted = 0
+        self.tag_associations_inserted = 0
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Adds the time spent inside the block to the given stage.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + elapsed
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def rows_written(self) -> int:
+        return (
+            self.cocktails_inserted
+            + self.steps_inserted
+            + self.tag_associations_inserted
+        )
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.rows_written / elapsed if elapsed else 0.0
+
+    @property
+    def recipes_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.recipes_read / elapsed if elapsed else 0.0
+
+    def report(self) -> str:
+        lines = [
+            f"recipes read: {self.recipes_read} "
+            f"({self.recipes_per_second:.0f} recipes/s)",
+            f"cocktails inserted: {self.cocktails_inserted}, "
+            f"skipped (already existing): {self.cocktails_skipped}",
+            f"steps inserted: {self.steps_inserted}",
+            f"tag associations inserted: {self.tag_associations_inserted}",
+            f"rows written: {self.rows_written} ({self.rows_per_second:.0f} rows/s)",
+            f"elapsed: {self.elapsed_seconds:.2f}s",
+        ]
+        lines.extend(
+            f"  {stage}: {seconds:.2f}s"
+            for stage, seconds in sorted(
+                self.stage_seconds.items(), key=lambda item: -item[1]
+            )
+        )
+        return "\n".join(lines)
+
+
+class ImportCheckpoint:
+    """
+    Persists how many recipes of a source file have been committed, so an
+    interrupted import can resume after the last committed batch.
+    """
+
+    def __init__(self, path: Optional[str]) -> None:
+        self.path = path
+
+    def load(self, source_path: str) -> int:
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        with open(self.path, encoding="utf-8") as file:
+            data = json.load(file)
+        if data.get("source_path") != os.path.abspath(source_path):
+            return 0
+        return int(data.get("recipes_committed", 0))
+
+    def save(self, source_path: str, recipes_committed: int) -> None:
+        if not self.path:
+            return
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "source_path": os.path.abspath(source_path),
+                    "recipes_committed": recipes_committed,
+                },
+                file,
+            )
+        os.replace(temporary_path, self.path)
@@ -0,0 +1,204 @@
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from src.database.bulk_get_or_create import get_or_create_by_name
+from src.database.cocktail_changes import track_cocktail_changes
+from src.database.db_service import PGDatabaseService
+from src.importer.import_stats import ImportCheckpoint, ImportStats
+from src.importer.recipe_records import RecipeRecord, read_recipes
+from src.models.cocktail import Cocktail
+from src.models.cocktail_tag_association import CocktailTagAssociation
+from src.models.constants import STEP_POSITION_GAP, CocktailGlassware
+from src.models.ingredient import Ingredient
+from src.models.step import Step
+from src.models.tag import Tag
+
+STEPS_ID_SEQUENCE = "steps_id_seq"
+
+
+def _chunked(
+    records: Iterable[Tuple[int, RecipeRecord]], size: int
+) -> Iterator[List[Tuple[int, RecipeRecord]]]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class RecipeImportService(PGDatabaseService):
+    """
+    Service to bulk import recipe catalogs, bypassing the per-object ORM path.
+    Recipes are streamed from the source file and written in batches: ingredients
+    and tags are resolved once per batch, and cocktails, steps and tag
+    associations are written with multi-row INSERTs, committing every batch.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+    def import_file(
+        self,
+        path: str,
+        batch_size: int = 1000,
+        checkpoint_path: Optional[str] = None,
+        verbose: bool = False,
+    ) -> ImportStats:
+        """
+        Imports every recipe of a JSON Lines or CSV file. Cocktails whose name
+        already exists are skipped. If a checkpoint path is given, the number of
+        committed recipes is saved after every batch, and a later run with the same
+        checkpoint resumes right after the last committed batch.
+        """
+        stats = ImportStats()
+        checkpoint = ImportCheckpoint(checkpoint_path)
+        recipes_committed = checkpoint.load(path)
+
+        records = islice(read_recipes(path), recipes_committed, None)
+        for batch in _chunked(records, batch_size):
+            with self.get_session() as session:
+                self._import_batch(session, [record for _, record in batch], stats)
+                with stats.stage("commit"):
+                    session.commit()
+            recipes_committed += len(batch)
+            checkpoint.save(path, recipes_committed)
+            if verbose:
+                print(
+                    f"{recipes_committed} recipes committed "
+                    f"(last line {batch[-1][0]}, {stats.rows_per_second:.0f} rows/s)"
+                )
+        return stats
+
+    def _import_batch(
+        self, session: Session, records: List[RecipeRecord], stats: ImportStats
+    ) -> None:
+        stats.recipes_read += len(records)
+
+        with stats.stage("resolve ingredients and tags"):
+            ingredients_by_name = get_or_create_by_name(
+                session,
+                Ingredient,
+                {
+                    step.ingredient
+                    for record in records
+                    for step in record.steps
+                    if step.ingredient
+                },
+            )
+            tags_by_name = get_or_create_by_name(
+                session, Tag, {tag for record in records for tag in record.tags}
+            )
+
+        with stats.stage("insert cocktails"):
+            cocktail_ids_by_name = self._insert_cocktails(session, records, stats)
+        track_cocktail_changes(session, cocktail_ids_by_name.values())
+
+        new_records = [
+            record for record in records if record.name in cocktail_ids_by_name
+        ]
+        with stats.stage("insert steps"):
+            self._insert_steps(
+                session, new_records, cocktail_ids_by_name, ingredients_by_name, stats
+            )
+
+        with stats.stage("insert tag associations"):
+            associations = [
+                {
+                    "cocktail_id": cocktail_ids_by_name[record.name],
+                    "tag_id": tags_by_name[tag].id,
+                }
+                for record in new_records
+                for tag in dict.fromkeys(record.tags)
+            ]
+            if associations:
+                insert_associations = pg_insert(
+                    CocktailTagAssociation.__table__
+                ).on_conflict_do_nothing()
+                session.execute(insert_associations, associations)
+                stats.tag_associations_inserted += len(associations)
+
+    def _insert_cocktails(
+        self, session: Session, records: List[RecipeRecord], stats: ImportStats
+    ) -> Dict[str, int]:
+        """
+        Inserts the batch cocktails, skipping names that already exist (in the
+        database or earlier in the batch). Returns the new ids by name.
+        """
+        unique_records = list({record.name: record for record in records}.values())
+        if not unique_records:
+            return {}
+        rows = session.execute(
+            pg_insert(Cocktail.__table__)
+            .values(
+                [
+                    {
+                        "name": record.name,
+                        "description": record.description,
+                        "glassware": record.glassware or CocktailGlassware.LOWBALL,
+                    }
+                    for record in unique_records
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(Cocktail.__table__.c.id, Cocktail.__table__.c.name)
+        ).all()
+        cocktail_ids_by_name = {name: id for id, name in rows}
+        stats.cocktails_inserted += len(cocktail_ids_by_name)
+        stats.cocktails_skipped += len(records) - len(cocktail_ids_by_name)
+        return cocktail_ids_by_name
+
+    def _allocate_step_ids(self, session: Session, count: int) -> Iterator[int]:
+        """
+        Reserves `count` ids from the steps sequence in a single query.
+        """
+        return iter(
+            session.execute(
+                select(func.nextval(STEPS_ID_SEQUENCE)).select_from(
+                    func.generate_series(1, count)
+                )
+            ).scalars()
+        )
+
+    def _insert_steps(
+        self,
+        session: Session,
+        records: List[RecipeRecord],
+        cocktail_ids_by_name: Dict[str, int],
+        ingredients_by_name: Dict[str, Ingredient],
+        stats: ImportStats,
+    ) -> None:
+        """
+        Writes the steps of the batch with multi-row INSERTs. Step ids are drawn
+        from the sequence up front, so next_step_id links can be built in memory.
+        """
+        total_steps = sum(len(record.steps) for record in records)
+        if not total_steps:
+            return
+        step_ids = self._allocate_step_ids(session, total_steps)
+
+        rows = []
+        for record in records:
+            ids = [next(step_ids) for _ in record.steps]
+            for i, step in enumerate(record.steps):
+                ingredient = ingredients_by_name.get(step.ingredient)
+                rows.append(
+                    {
+                        "id": ids[i],
+                        "action": step.action,
+                        "ingredient_id": ingredient.id if ingredient else None,
+                        "measuring_unit": step.measuring_unit,
+                        "quantity": step.quantity,
+                        "mixology_tool": step.mixology_tool,
+                        "next_step_id": ids[i + 1] if i + 1 < len(ids) else None,
+                        "is_recipe_first_step": i == 0,
+                        "position": (i + 1) * STEP_POSITION_GAP,
+                        "cocktail_id": cocktail_ids_by_name[record.name],
+                    }
+                )
+        # Rows are batched into several statements by the driver. Writing each
+        # recipe tail first keeps every next_step_id pointing at an inserted row.
+        rows.reverse()
+        session.execute(insert(Step.__table__), rows)
+        stats.steps_inserted += len(rows)
@@ -0,0 +1,132 @@
+import csv
+import json
+
+from dataclasses import dataclass, field
+from enum import Enum
+from itertools import groupby
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from src.models.constants import (
+    CocktailGlassware,
+    MeasuringUnit,
+    MixologyTool,
+    StepAction,
+)
+
+CSV_TAG_SEPARATOR = "|"
+
+
+@dataclass
+class StepRecord:
+    action: StepAction
+    ingredient: Optional[str] = None
+    measuring_unit: Optional[MeasuringUnit] = None
+    quantity: Optional[float] = None
+    mixology_tool: Optional[MixologyTool] = None
+
+
+@dataclass
+class RecipeRecord:
+    name: str
+    description: Optional[str] = None
+    glassware: Optional[CocktailGlassware] = None
+    tags: List[str] = field(default_factory=list)
+    steps: List[StepRecord] = field(default_factory=list)
+
+
+def parse_enum(enum_class: Type[Enum], value: Optional[str]) -> Optional[Enum]:
+    """
+    Parses an enum from either its member name or its value, case-insensitively.
+    Empty values are returned as None.
+    """
+    if value is None or not str(value).strip():
+        return None
+    normalized = str(value).strip()
+    for member in enum_class:
+        if normalized.upper() == member.name or normalized.lower() == member.value:
+            return member
+    raise ValueError(f"Unknown {enum_class.__name__}: {value!r}")
+
+
+def _parse_quantity(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def _parse_step(data: Dict[str, Any]) -> StepRecord:
+    return StepRecord(
+        action=parse_enum(StepAction, data.get("action")),
+        ingredient=data.get("ingredient") or None,
+        measuring_unit=parse_enum(MeasuringUnit, data.get("measuring_unit")),
+        quantity=_parse_quantity(data.get("quantity")),
+        mixology_tool=parse_enum(MixologyTool, data.get("mixology_tool")),
+    )
+
+
+def read_jsonl_recipes(path: str) -> Iterator[Tuple[int, RecipeRecord]]:
+    """
+    Streams (line_number, RecipeRecord) pairs from a JSON Lines file, one recipe
+    per line:
+        {"name": "Caipirinha", "description": "...", "glassware": "lowball",
+         "tags": ["strong"], "steps": [{"action": "add_ingredient",
+         "ingredient": "lime", "measuring_unit": "piece", "quantity": 8}]}
+    """
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            try:
+                record = RecipeRecord(
+                    name=data["name"].strip(),
+                    description=data.get("description"),
+                    glassware=parse_enum(CocktailGlassware, data.get("glassware")),
+                    tags=list(data.get("tags") or []),
+                    steps=[_parse_step(step) for step in data.get("steps") or []],
+                )
+            except (KeyError, ValueError) as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from e
+            yield line_number, record
+
+
+def read_csv_recipes(path: str) -> Iterator[Tuple[int, RecipeRecord]]:
+    """
+    Streams (line_number, RecipeRecord) pairs from a CSV file with one row per
+    step, rows of the same recipe being consecutive. Columns: name, description,
+    glassware, tags ("|" separated), action, ingredient, measuring_unit, quantity
+    and mixology_tool. Recipe columns are read from the first row of each recipe.
+    """
+    with open(path, encoding="utf-8", newline="") as file:
+        rows = enumerate(csv.DictReader(file), start=2)
+        for name, recipe_rows in groupby(rows, key=lambda row: row[1]["name"]):
+            recipe_rows = list(recipe_rows)
+            line_number, first_row = recipe_rows[0]
+            try:
+                record = RecipeRecord(
+                    name=name.strip(),
+                    description=first_row.get("description") or None,
+                    glassware=parse_enum(CocktailGlassware, first_row.get("glassware")),
+                    tags=[
+                        tag
+                        for tag in (first_row.get("tags") or "").split(
+                            CSV_TAG_SEPARATOR
+                        )
+                        if tag.strip()
+                    ],
+                    steps=[_parse_step(row) for _, row in recipe_rows if row["action"]],
+                )
+            except (KeyError, ValueError) as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from e
+            yield line_number, record
+
+
+def read_recipes(path: str) -> Iterator[Tuple[int, RecipeRecord]]:
+    """
+    Streams recipes from a .jsonl/.ndjson or .csv file.
+    """
+    if path.endswith((".jsonl", ".ndjson")):
+        return read_jsonl_recipes(path)
+    if path.endswith(".csv"):
+        return read_csv_recipes(path)
+    raise ValueError(f"Unsupported recipe file format: {path}")
@@ -1,17 +1,46 @@
 from flask import Flask, jsonify
 
-app = Flask(__name__)
+from src.api.catalog import catalog_blueprint
+from src.api.export import export_blueprint
+from src.api.metrics import metrics_blueprint
+from src.api.planner import planner_blueprint
+from src.api.request_sessions import init_request_sessions
+from src.api.search import search_blueprint
+from src.database.db_service import PGDatabaseService
+from src.indexes.name_index import start_warming_name_index
+from src.models.services.name_search_service import NameSearchService
+from src.settings import FAST_STARTUP, NAME_INDEX_WARM_ON_STARTUP
 
 
-@app.route("/ping", methods=["GET"])
-def get_ping():
-    return jsonify({"message": "pong"})
+def create_app(warm_name_index: bool = NAME_INDEX_WARM_ON_STARTUP) -> Flask:
+    """
+    Builds the Flask app. Checks the schema on FAST_STARTUP and starts warming the
+    name index, so importing this module alone opens no database connection.
+    """
+    app = Flask(__name__)
+    init_request_sessions(app)
+    app.register_blueprint(catalog_blueprint)
+    app.register_blueprint(search_blueprint)
+    app.register_blueprint(export_blueprint)
+    app.register_blueprint(planner_blueprint)
+    app.register_blueprint(metrics_blueprint)
 
+    @app.route("/ping", methods=["GET"])
+    def get_ping():
+        return jsonify({"message": "pong"})
 
-@app.post("/drink")
-def post_drink():
-    return jsonify({"message": "drink"})
+    @app.post("/drink")
+    def post_drink():
+        return jsonify({"message": "drink"})
+
+    if FAST_STARTUP:
+        PGDatabaseService().prepare_schema()
+
+    if warm_name_index:
+        start_warming_name_index(NameSearchService().get_session)
+
+    return app
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    create_app().run(debug=True)
@@ -0,0 +1,285 @@
+from threading import RLock
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.database.cocktail_changes import on_cocktail_changes_committed
+from src.models.cocktail import Cocktail
+from src.models.step import Step
+
+WORD_BITS = 64
+_NO_COCKTAIL = -1
+
+
+class IngredientIndex:
+    """
+    In-process inverted index of the ingredients used by every cocktail.
+    Each ingredient id is mapped to a bit position and each cocktail is stored as
+    one row of a packed uint64 bitset matrix, so subset ("makeable with"), superset
+    ("contains all of") and "missing at most k" queries over the whole catalog run
+    as vectorized bit operations.
+    The index is loaded on first use and kept up to date incrementally: committed
+    cocktail changes mark their rows stale, and stale rows are re-read on the next
+    query.
+    """
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._loaded = False
+        self._stale_cocktail_ids: Set[int] = set()
+        self._bit_by_ingredient_id: Dict[int, int] = {}
+        self._row_by_cocktail_id: Dict[int, int] = {}
+        self._free_rows: List[int] = []
+        self._row_count = 0
+        self._cocktail_ids = np.full(0, _NO_COCKTAIL, dtype=np.int64)
+        self._bitsets = np.zeros((0, 0), dtype=np.uint64)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._row_by_cocktail_id)
+
+    def invalidate(self, cocktail_ids: Iterable[int]) -> None:
+        """
+        Marks cocktails as changed; their rows are re-read on the next sync.
+        """
+        with self._lock:
+            self._stale_cocktail_ids.update(cocktail_ids)
+
+    def reset(self) -> None:
+        """
+        Forgets the whole index; it is loaded again on the next sync.
+        """
+        with self._lock:
+            self._loaded = False
+            self._stale_cocktail_ids.clear()
+
+    def sync(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Loads the index on first use, or re-reads the rows of stale cocktails.
+        Reads go through a short-lived session of their own: the index outlives
+        the caller's transaction, so it must not pick up its uncommitted steps.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._stale_cocktail_ids.clear()
+                with session_factory() as session:
+                    self.load(session)
+            elif self._stale_cocktail_ids:
+                stale_cocktail_ids = self._stale_cocktail_ids
+                self._stale_cocktail_ids = set()
+                with session_factory() as session:
+                    self.refresh(session, stale_cocktail_ids)
+
+    def load(self, session: Session) -> None:
+        """
+        Rebuilds the whole index with two queries: all cocktail ids and the distinct
+        (cocktail, ingredient) pairs of their steps.
+        """
+        cocktail_ids = np.fromiter(
+            session.execute(select(Cocktail.id).order_by(Cocktail.id)).scalars(),
+            dtype=np.int64,
+        )
+        pairs = np.array(
+            session.execute(
+                select(Step.cocktail_id, Step.ingredient_id)
+                .where(Step.ingredient_id.is_not(None))
+                .distinct()
+            ).all(),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+
+        with self._lock:
+            ingredient_ids, bits = np.unique(pairs[:, 1], return_inverse=True)
+            rows = np.searchsorted(cocktail_ids, pairs[:, 0])
+            known = rows < len(cocktail_ids)
+            known[known] = cocktail_ids[rows[known]] == pairs[known, 0]
+            rows, bits = rows[known], bits[known]
+
+            bitsets = np.zeros(
+                (len(cocktail_ids), self._get_word_count(len(ingredient_ids))),
+                dtype=np.uint64,
+            )
+            np.bitwise_or.at(
+                bitsets,
+                (rows, bits // WORD_BITS),
+                np.left_shift(np.uint64(1), (bits % WORD_BITS).astype(np.uint64)),
+            )
+
+            self._bit_by_ingredient_id = {
+                int(ingredient_id): bit
+                for bit, ingredient_id in enumerate(ingredient_ids)
+            }
+            self._row_by_cocktail_id = {
+                int(cocktail_id): row for row, cocktail_id in enumerate(cocktail_ids)
+            }
+            self._free_rows = []
+            self._row_count = len(cocktail_ids)
+            self._cocktail_ids = cocktail_ids
+            self._bitsets = bitsets
+            self._loaded = True
+
+    def refresh(self, session: Session, cocktail_ids: Iterable[int]) -> None:
+        """
+        Re-reads the ingredients of the given cocktails in one query, dropping the
+        cocktails that no longer exist.
+        """
+        cocktail_ids = set(cocktail_ids)
+        if not cocktail_ids:
+            return
+        ingredient_ids_by_cocktail_id: Dict[int, Set[int]] = {
+            cocktail_id: set()
+            for cocktail_id in session.execute(
+                select(Cocktail.id).where(Cocktail.id.in_(cocktail_ids))
+            ).scalars()
+        }
+        for cocktail_id, ingredient_id in session.execute(
+            select(Step.cocktail_id, Step.ingredient_id)
+            .where(Step.cocktail_id.in_(cocktail_ids), Step.ingredient_id.is_not(None))
+            .distinct()
+        ):
+            ingredient_ids_by_cocktail_id[cocktail_id].add(ingredient_id)
+
+        with self._lock:
+            for cocktail_id in cocktail_ids - ingredient_ids_by_cocktail_id.keys():
+                self.remove_cocktail(cocktail_id)
+            for cocktail_id, ingredient_ids in ingredient_ids_by_cocktail_id.items():
+                self.set_cocktail_ingredients(cocktail_id, ingredient_ids)
+
+    def set_cocktail_ingredients(
+        self, cocktail_id: int, ingredient_ids: Iterable[int]
+    ) -> None:
+        """
+        Stores (or replaces) the ingredient set of a cocktail.
+        """
+        with self._lock:
+            bits = self._get_or_assign_bits(ingredient_ids)
+            row = self._row_by_cocktail_id.get(cocktail_id)
+            if row is None:
+                row = self._allocate_row(cocktail_id)
+            self._bitsets[row] = self._to_bitset(bits)
+
+    def remove_cocktail(self, cocktail_id: int) -> None:
+        with self._lock:
+            row = self._row_by_cocktail_id.pop(cocktail_id, None)
+            if row is None:
+                return
+            self._bitsets[row] = 0
+            self._cocktail_ids[row] = _NO_COCKTAIL
+            self._free_rows.append(row)
+
+    def find_makeable(self, ingredient_ids: Iterable[int]) -> List[int]:
+        """
+        Returns the ids of the cocktails whose ingredients are all among the given
+        ones (cocktail ingredients are a subset of the given set).
+        """
+        return list(self.find_missing_at_most(ingredient_ids, 0))
+
+    def find_containing_all(self, ingredient_ids: Iterable[int]) -> List[int]:
+        """
+        Returns the ids of the cocktails that use every given ingredient (cocktail
+        ingredients are a superset of the given set).
+        """
+        with self._lock:
+            mask, unknown = self._to_query_mask(ingredient_ids)
+            if unknown:
+                return []
+            rows = self._live_rows()
+            matches = ((self._bitsets[rows] & mask) == mask).all(axis=1)
+            return sorted(self._cocktail_ids[rows[matches]].tolist())
+
+    def find_missing_at_most(
+        self, ingredient_ids: Iterable[int], max_missing: int
+    ) -> Dict[int, int]:
+        """
+        Returns {cocktail_id: missing ingredient count} for the cocktails that need
+        at most `max_missing` ingredients besides the given ones, ordered by
+        missing count and then by id.
+        """
+        with self._lock:
+            mask, _ = self._to_query_mask(ingredient_ids)
+            rows = self._live_rows()
+            missing = np.bitwise_count(self._bitsets[rows] & ~mask).sum(
+                axis=1, dtype=np.int64
+            )
+            matches = missing <= max_missing
+            found_ids = self._cocktail_ids[rows[matches]]
+            found_missing = missing[matches]
+            order = np.lexsort((found_ids, found_missing))
+            return dict(zip(found_ids[order].tolist(), found_missing[order].tolist()))
+
+    def _get_word_count(self, bit_count: int) -> int:
+        return max(1, -(-bit_count // WORD_BITS))
+
+    def _live_rows(self) -> np.ndarray:
+        return np.flatnonzero(self._cocktail_ids[: self._row_count] != _NO_COCKTAIL)
+
+    def _get_or_assign_bits(self, ingredient_ids: Iterable[int]) -> List[int]:
+        bits = []
+        for ingredient_id in ingredient_ids:
+            bit = self._bit_by_ingredient_id.get(ingredient_id)
+            if bit is None:
+                bit = len(self._bit_by_ingredient_id)
+                self._bit_by_ingredient_id[ingredient_id] = bit
+            bits.append(bit)
+        word_count = self._get_word_count(len(self._bit_by_ingredient_id))
+        if word_count > self._bitsets.shape[1]:
+            self._bitsets = np.pad(
+                self._bitsets, ((0, 0), (0, word_count - self._bitsets.shape[1]))
+            )
+        return bits
+
+    def _allocate_row(self, cocktail_id: int) -> int:
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = self._row_count
+            self._row_count += 1
+            if row >= len(self._cocktail_ids):
+                capacity = max(64, 2 * len(self._cocktail_ids))
+                grow_by = capacity - len(self._cocktail_ids)
+                self._cocktail_ids = np.pad(
+                    self._cocktail_ids, (0, grow_by), constant_values=_NO_COCKTAIL
+                )
+                self._bitsets = np.pad(self._bitsets, ((0, grow_by), (0, 0)))
+        self._cocktail_ids[row] = cocktail_id
+        self._row_by_cocktail_id[cocktail_id] = row
+        return row
+
+    def _to_bitset(self, bits: Iterable[int]) -> np.ndarray:
+        bitset = np.zeros(self._bitsets.shape[1], dtype=np.uint64)
+        for bit in bits:
+            bitset[bit // WORD_BITS] |= np.uint64(1) << np.uint64(bit % WORD_BITS)
+        return bitset
+
+    def _to_query_mask(self, ingredient_ids: Iterable[int]) -> Tuple[np.ndarray, int]:
+        """
+        Returns the bitset of the given ingredients, and how many of them are not
+        used by any indexed cocktail.
+        """
+        bits, unknown = [], 0
+        for ingredient_id in set(ingredient_ids):
+            bit = self._bit_by_ingredient_id.get(ingredient_id)
+            if bit is None:
+                unknown += 1
+            else:
+                bits.append(bit)
+        return self._to_bitset(bits), unknown
+
+
+_ingredient_index = IngredientIndex()
+
+
+def get_ingredient_index() -> IngredientIndex:
+    """
+    Returns the process-wide ingredient index.
+    """
+    return _ingredient_index
+
+
+on_cocktail_changes_committed(_ingredient_index.invalidate)
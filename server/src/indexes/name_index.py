@@ -0,0 +1,267 @@
+from bisect import bisect_left, insort
+from threading import RLock, Thread
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.database.cocktail_changes import on_cocktail_changes_committed
+from src.database.named_entity_changes import (
+    CreatedNamedEntity,
+    on_named_entities_created,
+)
+from src.helpers.text_helper import fold_text, get_word_suffixes
+from src.models.cocktail import Cocktail
+from src.models.constants import NameSearchKind
+from src.models.ingredient import Ingredient
+from src.models.tag import Tag
+
+MODEL_BY_KIND = {
+    NameSearchKind.COCKTAIL: Cocktail,
+    NameSearchKind.INGREDIENT: Ingredient,
+    NameSearchKind.TAG: Tag,
+}
+KIND_BY_MODEL = {model: kind for kind, model in MODEL_BY_KIND.items()}
+
+# Ranks of a match, best first
+EXACT_MATCH = 0
+NAME_PREFIX_MATCH = 1
+WORD_PREFIX_MATCH = 2
+
+
+class NameMatch(NamedTuple):
+    kind: NameSearchKind
+    id: int
+    name: str
+    rank: int
+
+
+class _SortedNames:
+    """
+    The folded names of one kind of entity, as two sorted arrays of (key, id):
+    whole names, and names from the start of each of their words. Every entry
+    starting with a prefix is a contiguous run found by bisection, already in
+    alphabetical order.
+    """
+
+    def __init__(self) -> None:
+        self.names: Dict[int, str] = {}
+        self.name_keys: List[Tuple[str, int]] = []
+        self.word_keys: List[Tuple[str, int]] = []
+
+    def load(self, rows: Iterable[Tuple[int, str]]) -> None:
+        self.names = dict(rows)
+        self.name_keys, self.word_keys = [], []
+        for id, name in self.names.items():
+            folded = fold_text(name)
+            self.name_keys.append((folded, id))
+            self.word_keys.extend((key, id) for key in get_word_suffixes(folded)[1:])
+        self.name_keys.sort()
+        self.word_keys.sort()
+
+    def add(self, id: int, name: str) -> None:
+        if self.names.get(id) == name:
+            return
+        self.remove(id)
+        self.names[id] = name
+        folded = fold_text(name)
+        insort(self.name_keys, (folded, id))
+        for key in get_word_suffixes(folded)[1:]:
+            insort(self.word_keys, (key, id))
+
+    def remove(self, id: int) -> None:
+        name = self.names.pop(id, None)
+        if name is None:
+            return
+        folded = fold_text(name)
+        self._discard(self.name_keys, (folded, id))
+        for key in get_word_suffixes(folded)[1:]:
+            self._discard(self.word_keys, (key, id))
+
+    def find(self, prefix: str, limit: int) -> List[Tuple[int, int, str]]:
+        """
+        Returns up to `limit` (rank, id, folded key) matches of a folded prefix:
+        the exact match, then names starting with the prefix, then names with a
+        later word starting with it.
+        """
+        matches, seen = [], set()
+        for keys, is_word_match in ((self.name_keys, False), (self.word_keys, True)):
+            position = bisect_left(keys, (prefix,))
+            while len(matches) < limit and position < len(keys):
+                key, id = keys[position]
+                if not key.startswith(prefix):
+                    break
+                position += 1
+                if id in seen:
+                    continue
+                seen.add(id)
+                if is_word_match:
+                    rank = WORD_PREFIX_MATCH
+                else:
+                    rank = EXACT_MATCH if key == prefix else NAME_PREFIX_MATCH
+                matches.append((rank, id, key))
+        return matches
+
+    def _discard(self, keys: List[Tuple[str, int]], entry: Tuple[str, int]) -> None:
+        position = bisect_left(keys, entry)
+        if position < len(keys) and keys[position] == entry:
+            del keys[position]
+
+
+class NameIndex:
+    """
+    In-process prefix index of cocktail, ingredient and tag names, for keystroke
+    level autocomplete. Names are folded (accents stripped, case folded) and kept
+    in sorted arrays, so a lookup is a couple of bisections and never touches the
+    database.
+    The index is loaded on first use (or warmed at startup) and kept up to date
+    from committed writes: created ingredients and tags are added directly, and
+    changed cocktails are marked stale and re-read by id on the next sync.
+    """
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._loaded = False
+        self._stale_cocktail_ids: Set[int] = set()
+        self._names_by_kind = {kind: _SortedNames() for kind in NameSearchKind}
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def needs_sync(self) -> bool:
+        return not self._loaded or bool(self._stale_cocktail_ids)
+
+    def invalidate_cocktails(self, cocktail_ids: Iterable[int]) -> None:
+        """
+        Marks cocktails as changed; their names are re-read on the next sync.
+        """
+        with self._lock:
+            self._stale_cocktail_ids.update(cocktail_ids)
+
+    def add_created_entities(self, created: List[CreatedNamedEntity]) -> None:
+        """
+        Adds committed ingredients and tags. Ignored until the index is loaded,
+        since loading reads them anyway.
+        """
+        with self._lock:
+            if not self._loaded:
+                return
+            for model, id, name in created:
+                kind = KIND_BY_MODEL.get(model)
+                if kind is not None:
+                    self._names_by_kind[kind].add(id, name)
+
+    def reset(self) -> None:
+        """
+        Forgets the whole index; it is loaded again on the next sync.
+        """
+        with self._lock:
+            self._loaded = False
+            self._stale_cocktail_ids.clear()
+
+    def sync(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Loads the index on first use, or re-reads the names of stale cocktails.
+        Reads go through a short-lived session of their own, so the index never
+        picks up the uncommitted names of a caller's transaction.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._stale_cocktail_ids.clear()
+                with session_factory() as session:
+                    self.load(session)
+            elif self._stale_cocktail_ids:
+                stale_cocktail_ids = self._stale_cocktail_ids
+                self._stale_cocktail_ids = set()
+                with session_factory() as session:
+                    self.refresh_cocktails(session, stale_cocktail_ids)
+
+    def load(self, session: Session) -> None:
+        """
+        Rebuilds the whole index with one (id, name) query per kind.
+        """
+        with self._lock:
+            for kind, model in MODEL_BY_KIND.items():
+                self._names_by_kind[kind].load(
+                    session.execute(select(model.id, model.name)).all()
+                )
+            self._loaded = True
+
+    def refresh_cocktails(self, session: Session, cocktail_ids: Iterable[int]) -> None:
+        """
+        Re-reads the names of the given cocktails, dropping the ones that no longer
+        exist.
+        """
+        cocktail_ids = set(cocktail_ids)
+        if not cocktail_ids:
+            return
+        names = dict(
+            session.execute(
+                select(Cocktail.id, Cocktail.name).where(Cocktail.id.in_(cocktail_ids))
+            ).all()
+        )
+        with self._lock:
+            cocktail_names = self._names_by_kind[NameSearchKind.COCKTAIL]
+            for cocktail_id in cocktail_ids - names.keys():
+                cocktail_names.remove(cocktail_id)
+            for cocktail_id, name in names.items():
+                cocktail_names.add(cocktail_id, name)
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Iterable[NameSearchKind]] = None,
+        limit: int = 10,
+    ) -> List[NameMatch]:
+        """
+        Returns up to `limit` names starting with the query, or with a word starting
+        with it, accent and case insensitively. Exact matches come first, then
+        name prefixes, then word prefixes, each in alphabetical order.
+        """
+        prefix = fold_text(query)
+        if not prefix or limit <= 0:
+            return []
+        candidates = []
+        with self._lock:
+            for kind in kinds or list(NameSearchKind):
+                names = self._names_by_kind[kind]
+                for rank, id, key in names.find(prefix, limit):
+                    candidates.append((rank, key, kind.value, id, names.names[id]))
+        candidates.sort()
+        return [
+            NameMatch(NameSearchKind(kind), id, name, rank)
+            for rank, _, kind, id, name in candidates[:limit]
+        ]
+
+
+_name_index = NameIndex()
+
+
+def get_name_index() -> NameIndex:
+    """
+    Returns the process-wide name index.
+    """
+    return _name_index
+
+
+def start_warming_name_index(session_factory: Callable[[], Session]) -> Thread:
+    """
+    Loads the name index in a background thread, so the first keystrokes are
+    answered from memory without delaying startup. Searches made meanwhile wait
+    for the load.
+    """
+
+    thread = Thread(
+        target=_name_index.sync,
+        args=(session_factory,),
+        name="name-index-warmup",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+on_cocktail_changes_committed(_name_index.invalidate_cocktails)
+on_named_entities_created(_name_index.add_created_entities)
@@ -0,0 +1,113 @@
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Optional
+
+from sqlalchemy import Engine, event
+
+from src.metrics.service_metrics import get_service_metrics
+from src.settings import SERVICE_METRICS_ENABLED
+
+_STATEMENT_STARTS_KEY = "metrics_statement_starts"
+
+
+class ServiceCallFrame:
+    """
+    A service method call in progress. The SQL statements it runs itself are
+    added to it; those of nested service calls go to their own frames, and only
+    the time of the nested calls is added, so it can be told apart.
+    """
+
+    __slots__ = (
+        "method",
+        "started",
+        "statements",
+        "db_seconds",
+        "nested_seconds",
+        "failed",
+        "token",
+    )
+
+    def __init__(self, method: str) -> None:
+        self.method = method
+        self.started = perf_counter()
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.nested_seconds = 0.0
+        self.failed = False
+        self.token: Optional[Token] = None
+
+
+_current_frame: ContextVar[Optional[ServiceCallFrame]] = ContextVar(
+    "service_call_frame", default=None
+)
+
+
+def enter_service_call(method: str) -> Optional[ServiceCallFrame]:
+    """
+    Starts measuring a service method call; see exit_service_call. Returns None
+    when metrics are disabled.
+    """
+    if not SERVICE_METRICS_ENABLED:
+        return None
+    frame = ServiceCallFrame(method)
+    frame.token = _current_frame.set(frame)
+    return frame
+
+
+def exit_service_call(frame: Optional[ServiceCallFrame]) -> None:
+    """
+    Records a finished call: its duration, which includes the calls nested in
+    it, and its own (exclusive) statements, database and Python time, which
+    don't, so they add up across methods without counting anything twice.
+    """
+    if frame is None:
+        return
+    seconds = perf_counter() - frame.started
+    _current_frame.reset(frame.token)
+    parent = _current_frame.get()
+    if parent is not None:
+        parent.nested_seconds += seconds
+    python_seconds = max(0.0, seconds - frame.nested_seconds - frame.db_seconds)
+    get_service_metrics().record_call(
+        frame.method,
+        seconds,
+        frame.statements,
+        frame.db_seconds,
+        python_seconds,
+        frame.failed,
+    )
+
+
+def _before_cursor_execute(connection, *_args) -> None:
+    connection.info.setdefault(_STATEMENT_STARTS_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(connection, *_args) -> None:
+    seconds = perf_counter() - connection.info[_STATEMENT_STARTS_KEY].pop()
+    get_service_metrics().record_statement(seconds)
+    frame = _current_frame.get()
+    if frame is not None:
+        frame.statements += 1
+        frame.db_seconds += seconds
+
+
+def _handle_error(context) -> None:
+    # A failed statement never reaches after_cursor_execute
+    if context.connection is not None:
+        starts = context.connection.info.get(_STATEMENT_STARTS_KEY)
+        if starts:
+            starts.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Times every SQL statement of the engine and counts it in the process-wide
+    totals and in the service call it runs for.
+    """
+    if not SERVICE_METRICS_ENABLED or event.contains(
+        engine, "after_cursor_execute", _after_cursor_execute
+    ):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -0,0 +1,205 @@
+from bisect import bisect_left
+from itertools import accumulate
+from threading import Lock
+from typing import Any, Dict, List, Sequence
+
+# Upper bounds of the service call latency histogram, in seconds
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+METRICS_PREFIX = "mixologist"
+PROMETHEUS_MIMETYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (metric name, help text, snapshot key) of the exported counters. The SQL
+# counters are the only totals over every statement, in service calls or not.
+# The per method SQL, database and Python counters are exclusive of nested
+# service calls, so they can be summed across methods.
+SQL_COUNTERS = (
+    ("sql_statements_total", "SQL statements executed", "statements"),
+    ("sql_seconds_total", "Time spent in SQL statements", "db_seconds"),
+)
+METHOD_COUNTERS = (
+    ("service_calls_total", "Service method calls", "calls"),
+    ("service_errors_total", "Service method calls that raised", "errors"),
+    (
+        "service_self_sql_statements_total",
+        "SQL statements run by calls, excluding nested service calls",
+        "statements",
+    ),
+    (
+        "service_self_db_seconds_total",
+        "Database time of calls, excluding nested service calls",
+        "db_seconds",
+    ),
+    (
+        "service_self_python_seconds_total",
+        "Python time of calls, excluding nested service calls",
+        "python_seconds",
+    ),
+)
+
+
+class _MethodStats:
+    __slots__ = (
+        "calls",
+        "errors",
+        "statements",
+        "seconds",
+        "db_seconds",
+        "python_seconds",
+        "buckets",
+    )
+
+    def __init__(self, bucket_count: int) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.statements = 0
+        self.seconds = 0.0
+        self.db_seconds = 0.0
+        self.python_seconds = 0.0
+        # Non-cumulative counts; the last one is for calls above every bound
+        self.buckets = [0] * (bucket_count + 1)
+
+
+class ServiceMetrics:
+    """
+    Process-wide counters of the service layer: per service method, the calls,
+    failures, a latency histogram, and the SQL statements, database and Python
+    time of the calls themselves, excluding the service calls nested in them;
+    plus totals over every SQL statement, inside service calls or not.
+    Updates take one short lock, so they are cheap enough to stay always on.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._lock = Lock()
+        self._methods: Dict[str, _MethodStats] = {}
+        self._statements = 0
+        self._db_seconds = 0.0
+
+    def record_call(
+        self,
+        method: str,
+        seconds: float,
+        statements: int,
+        db_seconds: float,
+        python_seconds: float,
+        failed: bool = False,
+    ) -> None:
+        bucket = bisect_left(self.buckets, seconds)
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = _MethodStats(len(self.buckets))
+            stats.calls += 1
+            stats.errors += failed
+            stats.statements += statements
+            stats.seconds += seconds
+            stats.db_seconds += db_seconds
+            stats.python_seconds += python_seconds
+            stats.buckets[bucket] += 1
+
+    def record_statement(self, seconds: float) -> None:
+        with self._lock:
+            self._statements += 1
+            self._db_seconds += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
+            self._statements = 0
+            self._db_seconds = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a consistent copy of every counter. Times are in seconds. A call's
+        duration includes its nested service calls; its statements, database time
+        and Python time (the rest of its duration) don't. Histogram counts are
+        cumulative, as in Prometheus, the last one counting every call.
+        """
+        with self._lock:
+            methods = {
+                method: {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "statements": stats.statements,
+                    "seconds": stats.seconds,
+                    "db_seconds": stats.db_seconds,
+                    "python_seconds": stats.python_seconds,
+                    "latency_buckets": list(accumulate(stats.buckets)),
+                }
+                for method, stats in sorted(self._methods.items())
+            }
+            return {
+                "statements": self._statements,
+                "db_seconds": self._db_seconds,
+                "latency_bounds": list(self.buckets),
+                "methods": methods,
+            }
+
+    def render_prometheus(self) -> str:
+        """
+        Renders the counters in the Prometheus text exposition format.
+        """
+        snapshot = self.snapshot()
+        bounds = [_format_bound(bound) for bound in self.buckets] + ["+Inf"]
+        methods = snapshot["methods"]
+        lines = []
+        for name, help_text, key in SQL_COUNTERS:
+            lines += _header(name, "counter", help_text)
+            lines.append(f"{METRICS_PREFIX}_{name} {snapshot[key]}")
+        for name, help_text, key in METHOD_COUNTERS:
+            lines += _header(name, "counter", help_text)
+            lines += [
+                f'{METRICS_PREFIX}_{name}{{method="{_escape(method)}"}} {stats[key]}'
+                for method, stats in methods.items()
+            ]
+        name = "service_duration_seconds"
+        lines += _header(name, "histogram", "Service method call latency")
+        for method, stats in methods.items():
+            label = f'method="{_escape(method)}"'
+            lines += [
+                f'{METRICS_PREFIX}_{name}_bucket{{{label},le="{bound}"}} {count}'
+                for bound, count in zip(bounds, stats["latency_buckets"])
+            ]
+            lines.append(f"{METRICS_PREFIX}_{name}_sum{{{label}}} {stats['seconds']}")
+            lines.append(f"{METRICS_PREFIX}_{name}_count{{{label}}} {stats['calls']}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _header(name: str, kind: str, help_text: str) -> List[str]:
+    return [
+        f"# HELP {METRICS_PREFIX}_{name} {help_text}",
+        f"# TYPE {METRICS_PREFIX}_{name} {kind}",
+    ]
+
+
+_service_metrics = ServiceMetrics()
+
+
+def get_service_metrics() -> ServiceMetrics:
+    """
+    Returns the process-wide service metrics.
+    """
+    return _service_metrics
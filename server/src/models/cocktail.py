@@ -1,7 +1,9 @@
-from typing import List, Optional
-from sqlalchemy import Integer, String, Enum
+from typing import Any, Dict, List, Optional
+from sqlalchemy import JSON, Integer, String, Enum, event
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from src.helpers.instruction_renderer import render_instructions
 from src.models.base_model import BaseModel
 from src.models.cocktail_tag_association import CocktailTagAssociation
 from src.models.constants import CocktailGlassware
@@ -18,16 +20,38 @@ class Cocktail(BaseModel):
     glassware: Mapped[CocktailGlassware] = mapped_column(
         Enum(CocktailGlassware), nullable=False, default=CocktailGlassware.LOWBALL
     )
-    # ORM relationship for all steps (bidirectional, for ORM integrity)
+    # Bumped on every change to the cocktail, its steps or its tags (see
+    # CocktailService._after_cocktail_mutation). Read APIs derive ETags from it.
+    revision: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+    # Precomputed read payload (see CocktailDTO.to_payload), rebuilt in the same
+    # transaction as every change (see CocktailService.rebuild_recipe_documents).
+    # Stale when its revision is behind the cocktail's. Deferred, so ORM loads
+    # don't carry it.
+    recipe_document: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=True, deferred=True
+    )
+    # ORM relationship for all steps (bidirectional, for ORM integrity). Steps and
+    # tag associations are removed by their ON DELETE CASCADE foreign keys, so
+    # deleting a cocktail doesn't load them.
     all_steps = relationship(
-        "Step", back_populates="cocktail", cascade="all, delete-orphan"
+        "Step",
+        back_populates="cocktail",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     cocktail_tag_associations: Mapped[List[CocktailTagAssociation]] = relationship(
         "CocktailTagAssociation",
         back_populates="cocktail",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
+    # Ordered step view, filled by the recipe loader or by the first walk of the
+    # linked list. Not a mapped attribute; reset on refresh/expire and by mutations.
+    _ordered_steps = None
+
     def __init__(
         self,
         name: str,
@@ -40,9 +64,23 @@ class Cocktail(BaseModel):
 
     def __repr__(self) -> str:
         return (
-            f"<Cocktail(id={self.id}, name={self.name}, total steps={len(self.steps)})>"
+            f"<Cocktail(id={self.id}, name={self.name}, "
+            f"total steps={self.total_steps})>"
         )
 
+    def set_ordered_steps(self, steps: List["Step"]) -> None:
+        """
+        Caches an already ordered list of steps, e.g. loaded in bulk with
+        Step.get_recipe_order_cte, so later property calls skip the list walk.
+        """
+        self._ordered_steps = list(steps)
+
+    def reset_steps_cache(self) -> None:
+        """
+        Drops the cached step order. Must be called after relinking steps.
+        """
+        self._ordered_steps = None
+
     @property
     def first_step(self) -> Optional["Step"]:
         return next((s for s in self.all_steps if s.is_recipe_first_step), None)
@@ -51,13 +89,16 @@ class Cocktail(BaseModel):
     def steps(self) -> List["Step"]:
         """
         Returns the steps of the cocktail in order, starting from the first step.
+        The order is walked once and cached until the recipe changes.
         """
-        steps = []
-        current_step = self.first_step
-        while current_step:
-            steps.append(current_step)
-            current_step = current_step.next_step
-        return steps
+        if self._ordered_steps is None:
+            steps = []
+            current_step = self.first_step
+            while current_step:
+                steps.append(current_step)
+                current_step = current_step.next_step
+            self._ordered_steps = steps
+        return list(self._ordered_steps)
 
     @property
     def tags(self) -> List[Tag]:
@@ -72,7 +113,8 @@ class Cocktail(BaseModel):
 
     @property
     def last_step(self) -> Optional[Step]:
-        return self.steps[-1] if self.steps else None
+        steps = self.steps
+        return steps[-1] if steps else None
 
     def get_human_readable_glassware(self) -> str:
         """
@@ -89,15 +131,14 @@ class Cocktail(BaseModel):
         """
         Returns a human-readable string of the cocktail's recipe instructions.
         """
-        instructions = []
-        for i, step in enumerate(self.steps):
-            step_instruction = (
-                f"Step {i + 1}: " + step.get_human_readable_step_explanation()
-            )
-            if ":glassware" in step_instruction:
-                glassware_name = self.get_human_readable_glassware()
-                step_instruction = step_instruction.replace(
-                    ":glassware", glassware_name
-                )
-            instructions.append(step_instruction)
-        return "\n".join(instructions)
+        return render_instructions(
+            (step.get_render_values() for step in self.steps), self.glassware
+        )
+
+
+@event.listens_for(Cocktail, "refresh")
+@event.listens_for(Cocktail, "expire")
+def _reset_cocktail_steps_cache(target: Cocktail, *_args) -> None:
+    # Rollbacks expire the states of deleted objects that may be gone already
+    if target is not None:
+        target.reset_steps_cache()
@@ -7,8 +7,11 @@ from src.models.base_model import BaseModel
 
 class CocktailTagAssociation(BaseModel):
     __tablename__ = "cocktail_tag_association"
-    cocktail_id = Column(Integer, ForeignKey("cocktails.id"), primary_key=True)
-    tag_id = Column(Integer, ForeignKey("tags.id"), primary_key=True)
+    cocktail_id = Column(
+        Integer, ForeignKey("cocktails.id", ondelete="CASCADE"), primary_key=True
+    )
+    # The primary key only serves lookups by cocktail_id, its leading column
+    tag_id = Column(Integer, ForeignKey("tags.id"), primary_key=True, index=True)
 
     # Relationships
     cocktail = relationship("Cocktail", back_populates="cocktail_tag_associations")
@@ -1,5 +1,20 @@
 from enum import Enum
 
+# Upper bound on recipe length when walking step linked lists in SQL. Guards the
+# recursive queries against looping forever on a corrupted (cyclic) recipe.
+MAX_RECIPE_STEPS = 1000
+
+# Distance between the sparse positions given to consecutive recipe steps. Leaves
+# room for inserts between two steps before the recipe has to be renumbered.
+STEP_POSITION_GAP = 1024
+
+# Cocktails whose recipe documents are rebuilt together, see
+# CocktailService.rebuild_recipe_documents
+RECIPE_DOCUMENT_BATCH_SIZE = 500
+
+# Cocktails deleted together, see CocktailService.delete_cocktails
+COCKTAIL_DELETE_BATCH_SIZE = 1000
+
 
 class StepAction(Enum):
     ADD_INGREDIENT = "add_ingredient"
@@ -74,6 +89,13 @@ class MeasuringUnit(Enum):
     PINCH = "pinch"
 
 
+class UnitDimension(Enum):
+    VOLUME = "volume"
+    MASS = "mass"
+    # Discrete or approximate measures (pieces, dashes...), never converted
+    COUNT = "count"
+
+
 PLURALIZABLE_MEASURING_UNITS = [
     MeasuringUnit.DASH,
     MeasuringUnit.TSP,
@@ -105,3 +127,23 @@ class MixologyTool(Enum):
     JIGGER = "jigger"
     STIRRING_SPOON = "stirring_spoon"
     STIRRING_JAR = "stirring_jar"
+
+
+class MatchMode(Enum):
+    # Matches cocktails with at least one of the given tags or ingredients
+    ANY = "any"
+    # Matches cocktails with every one of the given tags or ingredients
+    ALL = "all"
+
+
+class CocktailSearchOrder(Enum):
+    ID = "id"
+    NAME = "name"
+    # Most matched tags and ingredients first, then by name
+    RELEVANCE = "relevance"
+
+
+class NameSearchKind(Enum):
+    COCKTAIL = "cocktail"
+    INGREDIENT = "ingredient"
+    TAG = "tag"
@@ -1,5 +1,7 @@
+from typing import Optional
+
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Integer, String
+from sqlalchemy import Float, Integer, String
 
 
 from src.models.base_model import BaseModel
@@ -12,6 +14,8 @@ class Ingredient(BaseModel):
     name: Mapped[str] = mapped_column(
         String(124), unique=True, index=True, nullable=False
     )
+    # Size of the bottle the ingredient is bought in, used by the shopping list
+    bottle_size_ml: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     def __init__(self, name: str):
         self.name = name
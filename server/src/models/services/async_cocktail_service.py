@@ -0,0 +1,429 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.async_db_service import AsyncPGDatabaseService
+from src.database.async_session_decorator import with_upper_scope_async_session
+from src.dtos.cocktail_dtos import DeletedCocktailsDTO
+from src.models.cocktail import Cocktail
+from src.models.constants import (
+    COCKTAIL_DELETE_BATCH_SIZE,
+    MatchMode,
+    MeasuringUnit,
+    StepAction,
+)
+from src.models.ingredient import Ingredient
+from src.models.services.cocktail_search import CocktailSearch
+from src.models.services.cocktail_service import CocktailService
+from src.models.step import Step
+from src.models.tag import Tag
+
+
+class AsyncCocktailService(AsyncPGDatabaseService):
+    """
+    Asyncio version of CocktailService. Reads run natively on the AsyncSession and
+    load everything they return eagerly, since lazy loads are not available in
+    asyncio mode. Writes reuse the synchronous implementation, with its recipe
+    validation and mutation hooks, through AsyncSession.run_sync. Objects returned
+    by writes are not eagerly loaded; read them back with load_recipes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._service = CocktailService()
+
+    async def _attach_ordered_steps(
+        self, session: AsyncSession, cocktails: List[Cocktail]
+    ) -> None:
+        if not cocktails:
+            return
+        steps = (
+            await session.execute(
+                self._service._get_ordered_steps_query(
+                    [cocktail.id for cocktail in cocktails]
+                )
+            )
+        ).scalars()
+        self._service._link_ordered_steps(cocktails, list(steps))
+
+    @with_upper_scope_async_session
+    async def fetch_cocktails(
+        self,
+        id: Optional[int],
+        name: Optional[str],
+        tags: Optional[List[Tag]] = [],
+        with_ingredients: Optional[List[Ingredient]] = None,
+        with_recipes: Optional[bool] = False,
+        tag_match_mode: Optional[MatchMode] = MatchMode.ANY,
+        ingredient_match_mode: Optional[MatchMode] = MatchMode.ALL,
+        session: AsyncSession = None,
+    ) -> List[Cocktail]:
+        """
+        Fetches cocktails based on optional id, name, tags and ingredients, see
+        CocktailService.fetch_cocktails.
+        """
+        search = (
+            CocktailSearch()
+            .with_id(id)
+            .with_name(name)
+            .with_tags(tags, mode=tag_match_mode)
+            .with_ingredients(with_ingredients, mode=ingredient_match_mode)
+        )
+        return await self.search_cocktails(
+            search, with_recipes=with_recipes, session=session
+        )
+
+    @with_upper_scope_async_session
+    async def search_cocktails(
+        self,
+        search: CocktailSearch,
+        with_recipes: Optional[bool] = False,
+        session: AsyncSession = None,
+    ) -> List[Cocktail]:
+        """
+        Runs a CocktailSearch as a single query. If with_recipes is set, tags and
+        ordered steps are loaded in bulk as well.
+        """
+        query = search.build()
+        if with_recipes:
+            query = query.options(*self._service._get_recipe_load_options())
+        cocktails = list((await session.execute(query)).scalars().all())
+        if with_recipes:
+            await self._attach_ordered_steps(session, cocktails)
+        return cocktails
+
+    @with_upper_scope_async_session
+    async def load_recipes(
+        self, cocktail_ids: List[int], session: AsyncSession = None
+    ) -> List[Cocktail]:
+        """
+        Loads cocktails with their tags, ingredients and ordered steps in three
+        queries, see CocktailService.load_recipes. Cocktails are ordered by id.
+        """
+        if not cocktail_ids:
+            return []
+        cocktails = list(
+            (
+                await session.execute(
+                    select(Cocktail)
+                    .where(Cocktail.id.in_(cocktail_ids))
+                    .options(*self._service._get_recipe_load_options())
+                    .order_by(Cocktail.id)
+                )
+            ).scalars()
+        )
+        await self._attach_ordered_steps(session, cocktails)
+        return cocktails
+
+    @with_upper_scope_async_session
+    async def load_recipe_payloads(
+        self, cocktail_ids: List[int], session: AsyncSession = None
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        return await self._run_sync(
+            session, self._service.load_recipe_payloads, cocktail_ids
+        )
+
+    @with_upper_scope_async_session
+    async def fetch_cocktail_revisions_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = 50,
+        session: AsyncSession = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Returns up to `limit` (id, revision) pairs of the cocktails following
+        `after_id`, in id order (keyset pagination over the primary key).
+        """
+        query = select(Cocktail.id, Cocktail.revision)
+        if after_id is not None:
+            query = query.where(Cocktail.id > after_id)
+        rows = await session.execute(query.order_by(Cocktail.id).limit(limit))
+        return [(id, revision) for id, revision in rows]
+
+    @with_upper_scope_async_session
+    async def fetch_cocktail_revision(
+        self, cocktail_id: int, session: AsyncSession = None
+    ) -> Optional[int]:
+        """
+        Returns the current revision of a cocktail, or None if it does not exist.
+        """
+        return (
+            await session.execute(
+                select(Cocktail.revision).where(Cocktail.id == cocktail_id)
+            )
+        ).scalar_one_or_none()
+
+    @with_upper_scope_async_session
+    async def render_instructions_for_cocktails(
+        self, cocktail_ids: List[int], session: AsyncSession = None
+    ) -> Dict[int, str]:
+        return await self._run_sync(
+            session, self._service.render_instructions_for_cocktails, cocktail_ids
+        )
+
+    @with_upper_scope_async_session
+    async def find_makeable_cocktail_ids(
+        self,
+        ingredients: List[Ingredient],
+        max_missing: Optional[int] = 0,
+        session: AsyncSession = None,
+    ) -> Dict[int, int]:
+        return await self._run_sync(
+            session,
+            self._service.find_makeable_cocktail_ids,
+            ingredients,
+            max_missing=max_missing,
+        )
+
+    @with_upper_scope_async_session
+    async def find_cocktail_ids_with_all_ingredients(
+        self, ingredients: List[Ingredient], session: AsyncSession = None
+    ) -> List[int]:
+        return await self._run_sync(
+            session, self._service.find_cocktail_ids_with_all_ingredients, ingredients
+        )
+
+    @with_upper_scope_async_session
+    async def update_or_create(
+        self,
+        name: str,
+        description: str,
+        tags: Optional[List[Tag]] = [],
+        steps: Optional[List[Step]] = [],
+        validate: Optional[bool] = True,
+        session: AsyncSession = None,
+    ) -> Cocktail:
+        return await self._run_sync(
+            session,
+            self._service.update_or_create,
+            name,
+            description,
+            tags=tags,
+            steps=steps,
+            validate=validate,
+        )
+
+    @with_upper_scope_async_session
+    async def delete_cocktail(
+        self, cocktail_id: int, session: AsyncSession = None
+    ) -> bool:
+        return await self._run_sync(session, self._service.delete_cocktail, cocktail_id)
+
+    @with_upper_scope_async_session
+    async def delete_cocktails(
+        self,
+        cocktail_ids: Iterable[int],
+        batch_size: int = COCKTAIL_DELETE_BATCH_SIZE,
+        session: AsyncSession = None,
+    ) -> DeletedCocktailsDTO:
+        return await self._run_sync(
+            session, self._service.delete_cocktails, cocktail_ids, batch_size
+        )
+
+    @with_upper_scope_async_session
+    async def remove_step_from_recipe(
+        self,
+        cocktail: Cocktail,
+        step_id: int,
+        validate: Optional[bool] = True,
+        session: AsyncSession = None,
+    ) -> bool:
+        return await self._run_sync(
+            session,
+            self._service.remove_step_from_recipe,
+            cocktail,
+            step_id,
+            validate=validate,
+        )
+
+    @with_upper_scope_async_session
+    async def clear_all_recipe_steps(
+        self, cocktail: Cocktail, session: AsyncSession = None
+    ) -> None:
+        return await self._run_sync(
+            session, self._service.clear_all_recipe_steps, cocktail
+        )
+
+    @with_upper_scope_async_session
+    async def create_step(
+        self,
+        cocktail: Cocktail,
+        action: StepAction,
+        ingredient: Optional[Ingredient] = None,
+        measuring_unit: Optional[MeasuringUnit] = None,
+        quantity: Optional[float] = None,
+        session: AsyncSession = None,
+    ) -> Step:
+        return await self._run_sync(
+            session,
+            self._service.create_step,
+            cocktail,
+            action,
+            ingredient=ingredient,
+            measuring_unit=measuring_unit,
+            quantity=quantity,
+        )
+
+    @with_upper_scope_async_session
+    async def create_step_linked_list(
+        self,
+        steps: List[Step],
+        cocktail: Cocktail,
+        validate: Optional[bool] = True,
+        session: AsyncSession = None,
+    ) -> Cocktail:
+        return await self._run_sync(
+            session,
+            self._service.create_step_linked_list,
+            steps,
+            cocktail,
+            validate=validate,
+        )
+
+    @with_upper_scope_async_session
+    async def add_step_to_specific_recipe_position(
+        self,
+        new_step: Step,
+        recipe_step_order: Optional[int] = None,
+        validate: Optional[bool] = True,
+        session: AsyncSession = None,
+    ) -> Cocktail:
+        return await self._run_sync(
+            session,
+            self._service.add_step_to_specific_recipe_position,
+            new_step,
+            recipe_step_order=recipe_step_order,
+            validate=validate,
+        )
+
+    @with_upper_scope_async_session
+    async def append_step_to_end_of_recipe(
+        self,
+        new_step: Step,
+        validate: Optional[bool] = True,
+        session: AsyncSession = None,
+    ) -> Cocktail:
+        return await self._run_sync(
+            session,
+            self._service.append_step_to_end_of_recipe,
+            new_step,
+            validate=validate,
+        )
+
+    @with_upper_scope_async_session
+    async def insert_step_to_recipe_head(
+        self,
+        new_step: Step,
+        validate: Optional[bool] = True,
+        session: AsyncSession = None,
+    ) -> Cocktail:
+        return await self._run_sync(
+            session,
+            self._service.insert_step_to_recipe_head,
+            new_step,
+            validate=validate,
+        )
+
+    @with_upper_scope_async_session
+    async def reorder_recipe(
+        self,
+        cocktail: Cocktail,
+        ordered_step_ids: List[int],
+        validate: Optional[bool] = True,
+        session: AsyncSession = None,
+    ) -> Cocktail:
+        return await self._run_sync(
+            session,
+            self._service.reorder_recipe,
+            cocktail,
+            ordered_step_ids,
+            validate=validate,
+        )
+
+    @with_upper_scope_async_session
+    async def move_step_to_recipe_position(
+        self,
+        cocktail: Cocktail,
+        step_id: int,
+        recipe_step_order: Optional[int] = None,
+        validate: Optional[bool] = True,
+        session: AsyncSession = None,
+    ) -> bool:
+        return await self._run_sync(
+            session,
+            self._service.move_step_to_recipe_position,
+            cocktail,
+            step_id,
+            recipe_step_order=recipe_step_order,
+            validate=validate,
+        )
+
+    @with_upper_scope_async_session
+    async def swap_recipe_steps(
+        self,
+        cocktail: Cocktail,
+        step_id: int,
+        other_step_id: int,
+        validate: Optional[bool] = True,
+        session: AsyncSession = None,
+    ) -> bool:
+        return await self._run_sync(
+            session,
+            self._service.swap_recipe_steps,
+            cocktail,
+            step_id,
+            other_step_id,
+            validate=validate,
+        )
+
+    @with_upper_scope_async_session
+    async def get_step_at_position(
+        self,
+        cocktail: Cocktail,
+        recipe_step_order: int,
+        session: AsyncSession = None,
+    ) -> Optional[Step]:
+        return await self._run_sync(
+            session, self._service.get_step_at_position, cocktail, recipe_step_order
+        )
+
+    @with_upper_scope_async_session
+    async def associate_tag_with_cocktail(
+        self, cocktail: Cocktail, tag: Tag, session: AsyncSession = None
+    ) -> Cocktail:
+        return await self._run_sync(
+            session, self._service.associate_tag_with_cocktail, cocktail, tag
+        )
+
+    @with_upper_scope_async_session
+    async def dissociate_tag_from_cocktail(
+        self, cocktail: Cocktail, tag: Tag, session: AsyncSession = None
+    ) -> Cocktail:
+        return await self._run_sync(
+            session, self._service.dissociate_tag_from_cocktail, cocktail, tag
+        )
+
+    @with_upper_scope_async_session
+    async def associate_tags_with_cocktail(
+        self, cocktail: Cocktail, tags: List[Tag], session: AsyncSession = None
+    ) -> Cocktail:
+        return await self._run_sync(
+            session, self._service.associate_tags_with_cocktail, cocktail, tags
+        )
+
+    @with_upper_scope_async_session
+    async def dissociate_tags_from_cocktail(
+        self, cocktail: Cocktail, tags: List[Tag], session: AsyncSession = None
+    ) -> Cocktail:
+        return await self._run_sync(
+            session, self._service.dissociate_tags_from_cocktail, cocktail, tags
+        )
+
+    @with_upper_scope_async_session
+    async def dissociate_all_tags_from_cocktail(
+        self, cocktail: Cocktail, session: AsyncSession = None
+    ) -> Cocktail:
+        return await self._run_sync(
+            session, self._service.dissociate_all_tags_from_cocktail, cocktail
+        )
@@ -0,0 +1,112 @@
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.entity_cache import (
+    cache_named_entity,
+    get_cached_named_row,
+    to_detached_entity,
+)
+from src.database.async_db_service import AsyncPGDatabaseService
+from src.database.async_session_decorator import with_upper_scope_async_session
+from src.models.ingredient import Ingredient
+from src.models.services.ingredient_service import IngredientService
+
+
+class AsyncIngredientService(AsyncPGDatabaseService):
+    """
+    Asyncio version of IngredientService. Reads run natively on the AsyncSession;
+    writes reuse the synchronous implementation through AsyncSession.run_sync.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._service = IngredientService()
+
+    @with_upper_scope_async_session
+    async def fetch_ingredients(
+        self, id: Optional[int], name: Optional[str], session: AsyncSession = None
+    ) -> List[Ingredient]:
+        """
+        Fetches ingredients from the database based on optional filters: id and name.
+        If no filters are provided, all ingredients are returned.
+        """
+        query = select(Ingredient).where(
+            *self._service._get_filter_conditions(id=id, name=name)
+        )
+        return list((await session.execute(query)).scalars().all())
+
+    @with_upper_scope_async_session
+    async def fetch_ingredients_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = 50,
+        session: AsyncSession = None,
+    ) -> List[Tuple[int, str]]:
+        """
+        Returns up to `limit` (id, name) rows of the ingredients following
+        `after_id`, in id order (keyset pagination over the primary key).
+        """
+        query = select(Ingredient.id, Ingredient.name)
+        if after_id is not None:
+            query = query.where(Ingredient.id > after_id)
+        rows = await session.execute(query.order_by(Ingredient.id).limit(limit))
+        return [(id, name) for id, name in rows]
+
+    @with_upper_scope_async_session
+    async def fetch_ingredient_by_id(
+        self, id: int, session: AsyncSession = None
+    ) -> Optional[Ingredient]:
+        """
+        Fetches a single ingredient by its ID, from the entity cache when possible.
+        A cached ingredient carries every column, bottle_size_ml included.
+        """
+        row = get_cached_named_row(Ingredient, "id", id)
+        if row is not None:
+            return await session.merge(to_detached_entity(Ingredient, row), load=False)
+        ingredient = (
+            await session.execute(select(Ingredient).where(Ingredient.id == id))
+        ).scalar_one_or_none()
+        cache_named_entity(session.sync_session, Ingredient, ingredient)
+        return ingredient
+
+    @with_upper_scope_async_session
+    async def fetch_ingredient_by_name(
+        self, name: str, session: AsyncSession = None
+    ) -> Optional[Ingredient]:
+        """
+        Fetches a single ingredient by its name, from the entity cache when possible.
+        A cached ingredient carries every column, bottle_size_ml included.
+        """
+        row = get_cached_named_row(Ingredient, "name", name)
+        if row is not None:
+            return await session.merge(to_detached_entity(Ingredient, row), load=False)
+        ingredient = (
+            await session.execute(select(Ingredient).where(Ingredient.name == name))
+        ).scalar_one_or_none()
+        cache_named_entity(session.sync_session, Ingredient, ingredient)
+        return ingredient
+
+    @with_upper_scope_async_session
+    async def get_or_create_ingredient(
+        self, name: str, session: AsyncSession = None
+    ) -> Ingredient:
+        """
+        Retrieves an ingredient by name or creates one if none exist.
+        """
+        return await self._run_sync(
+            session, self._service.get_or_create_ingredient, name
+        )
+
+    @with_upper_scope_async_session
+    async def get_or_create_ingredients(
+        self, names: List[str], session: AsyncSession = None
+    ) -> Dict[str, Ingredient]:
+        """
+        Retrieves or creates ingredients for a whole batch of names, see
+        IngredientService.get_or_create_ingredients.
+        """
+        return await self._run_sync(
+            session, self._service.get_or_create_ingredients, names
+        )
@@ -0,0 +1,108 @@
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cache.entity_cache import (
+    cache_named_entity,
+    get_cached_named_row,
+    to_detached_entity,
+)
+from src.database.async_db_service import AsyncPGDatabaseService
+from src.database.async_session_decorator import with_upper_scope_async_session
+from src.models.tag import Tag
+from src.models.services.tag_service import TagService
+
+
+class AsyncTagService(AsyncPGDatabaseService):
+    """
+    Asyncio version of TagService. Reads run natively on the AsyncSession;
+    writes reuse the synchronous implementation through AsyncSession.run_sync.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._service = TagService()
+
+    @with_upper_scope_async_session
+    async def fetch_tags(
+        self, id: Optional[int], name: Optional[str], session: AsyncSession = None
+    ) -> List[Tag]:
+        """
+        Fetches tags from the database based on optional filters: id and name.
+        If no filters are provided, all tags are returned.
+        """
+        query = select(Tag).where(
+            *self._service._get_filter_conditions(id=id, name=name)
+        )
+        return list((await session.execute(query)).scalars().all())
+
+    @with_upper_scope_async_session
+    async def fetch_tags_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = 50,
+        session: AsyncSession = None,
+    ) -> List[Tuple[int, str]]:
+        """
+        Returns up to `limit` (id, name) rows of the tags following
+        `after_id`, in id order (keyset pagination over the primary key).
+        """
+        query = select(Tag.id, Tag.name)
+        if after_id is not None:
+            query = query.where(Tag.id > after_id)
+        rows = await session.execute(query.order_by(Tag.id).limit(limit))
+        return [(id, name) for id, name in rows]
+
+    @with_upper_scope_async_session
+    async def fetch_tag_by_id(
+        self, id: int, session: AsyncSession = None
+    ) -> Optional[Tag]:
+        """
+        Fetches a single tag by its ID, from the entity cache when possible.
+        A cached tag, like a queried one, carries every column but not its
+        cocktail associations, which can't be loaded once its session closes.
+        """
+        row = get_cached_named_row(Tag, "id", id)
+        if row is not None:
+            return await session.merge(to_detached_entity(Tag, row), load=False)
+        tag = (
+            await session.execute(select(Tag).where(Tag.id == id))
+        ).scalar_one_or_none()
+        cache_named_entity(session.sync_session, Tag, tag)
+        return tag
+
+    @with_upper_scope_async_session
+    async def fetch_tag_by_name(
+        self, name: str, session: AsyncSession = None
+    ) -> Optional[Tag]:
+        """
+        Fetches a single tag by its name, from the entity cache when possible.
+        A cached tag, like a queried one, carries every column but not its
+        cocktail associations, which can't be loaded once its session closes.
+        """
+        row = get_cached_named_row(Tag, "name", name)
+        if row is not None:
+            return await session.merge(to_detached_entity(Tag, row), load=False)
+        tag = (
+            await session.execute(select(Tag).where(Tag.name == name))
+        ).scalar_one_or_none()
+        cache_named_entity(session.sync_session, Tag, tag)
+        return tag
+
+    @with_upper_scope_async_session
+    async def get_or_create_tag(self, name: str, session: AsyncSession = None) -> Tag:
+        """
+        Retrieves a tag by name or creates one if none exist.
+        """
+        return await self._run_sync(session, self._service.get_or_create_tag, name)
+
+    @with_upper_scope_async_session
+    async def get_or_create_tags(
+        self, names: List[str], session: AsyncSession = None
+    ) -> Dict[str, Tag]:
+        """
+        Retrieves or creates tags for a whole batch of names, see
+        TagService.get_or_create_tags.
+        """
+        return await self._run_sync(session, self._service.get_or_create_tags, names)
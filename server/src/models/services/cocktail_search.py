@@ -0,0 +1,158 @@
+from typing import List, Optional
+
+from sqlalchemy import Select, and_, func, literal, select
+
+from src.models.cocktail import Cocktail
+from src.models.cocktail_tag_association import CocktailTagAssociation
+from src.models.constants import CocktailGlassware, CocktailSearchOrder, MatchMode
+from src.models.ingredient import Ingredient
+from src.models.step import Step
+from src.models.tag import Tag
+
+
+class CocktailSearch:
+    """
+    Builder for cocktail searches combining id, name, glassware, tag and ingredient
+    filters. Tags and ingredients match in ANY or ALL mode.
+    Everything compiles to a single statement: matching step and tag association
+    rows are joined in, grouped per cocktail, and ALL mode is enforced with
+    HAVING COUNT(DISTINCT ...), instead of one EXISTS subquery per value.
+    """
+
+    def __init__(self) -> None:
+        self.id: Optional[int] = None
+        self.name: Optional[str] = None
+        self.glassware: List[CocktailGlassware] = []
+        self.tag_ids: List[int] = []
+        self.tag_match_mode = MatchMode.ANY
+        self.ingredient_ids: List[int] = []
+        self.ingredient_match_mode = MatchMode.ALL
+        self.order = CocktailSearchOrder.ID
+        self.descending = False
+        self.limit: Optional[int] = None
+        self.offset: Optional[int] = None
+
+    def with_id(self, id: Optional[int]) -> "CocktailSearch":
+        self.id = id
+        return self
+
+    def with_name(self, name: Optional[str]) -> "CocktailSearch":
+        self.name = name
+        return self
+
+    def with_glassware(
+        self, glassware: Optional[List[CocktailGlassware]]
+    ) -> "CocktailSearch":
+        """
+        Matches cocktails served in any of the given glasses.
+        """
+        self.glassware = list(glassware or [])
+        return self
+
+    def with_tags(
+        self, tags: Optional[List[Tag]], mode: MatchMode = MatchMode.ANY
+    ) -> "CocktailSearch":
+        self.tag_ids = sorted({tag.id for tag in tags or []})
+        self.tag_match_mode = mode
+        return self
+
+    def with_ingredients(
+        self, ingredients: Optional[List[Ingredient]], mode: MatchMode = MatchMode.ALL
+    ) -> "CocktailSearch":
+        self.ingredient_ids = sorted(
+            {ingredient.id for ingredient in ingredients or []}
+        )
+        self.ingredient_match_mode = mode
+        return self
+
+    def order_by(
+        self, order: CocktailSearchOrder, descending: bool = False
+    ) -> "CocktailSearch":
+        self.order = order
+        self.descending = descending
+        return self
+
+    def paginate(
+        self, limit: Optional[int], offset: Optional[int] = None
+    ) -> "CocktailSearch":
+        self.limit = limit
+        self.offset = offset
+        return self
+
+    def build(self) -> Select:
+        """
+        Compiles the search into a SELECT of Cocktail entities.
+        """
+        query = select(Cocktail)
+        if self.id:
+            query = query.where(Cocktail.id == self.id)
+        if self.name:
+            query = query.where(Cocktail.name == self.name)
+        if self.glassware:
+            query = query.where(Cocktail.glassware.in_(self.glassware))
+
+        match_counts = []
+        query = self._join_matches(
+            query,
+            Step.cocktail_id,
+            Step.ingredient_id,
+            self.ingredient_ids,
+            self.ingredient_match_mode,
+            match_counts,
+        )
+        query = self._join_matches(
+            query,
+            CocktailTagAssociation.cocktail_id,
+            CocktailTagAssociation.tag_id,
+            self.tag_ids,
+            self.tag_match_mode,
+            match_counts,
+        )
+        # Joined rows are only the matching ones, so the inner joins already enforce
+        # ANY mode; grouping folds them back into one row per cocktail.
+        if match_counts:
+            query = query.group_by(Cocktail.id)
+
+        query = query.order_by(*self._get_order_clauses(match_counts))
+        if self.limit is not None:
+            query = query.limit(self.limit)
+        if self.offset:
+            query = query.offset(self.offset)
+        return query
+
+    def _join_matches(
+        self,
+        query: Select,
+        cocktail_column,
+        value_column,
+        ids: List[int],
+        mode: MatchMode,
+        match_counts: List,
+    ) -> Select:
+        """
+        Joins the rows of a cocktail relation whose value is among `ids`. In ALL
+        mode, a HAVING COUNT(DISTINCT value) clause requires every id to match.
+        """
+        if not ids:
+            return query
+        query = query.join(
+            value_column.class_,
+            and_(cocktail_column == Cocktail.id, value_column.in_(ids)),
+        )
+        matched_count = func.count(value_column.distinct())
+        match_counts.append(matched_count)
+        if mode == MatchMode.ALL:
+            query = query.having(matched_count == len(ids))
+        return query
+
+    def _get_order_clauses(self, match_counts: List) -> List:
+        if self.order == CocktailSearchOrder.RELEVANCE:
+            relevance = sum(match_counts, literal(0))
+            return [relevance.desc(), Cocktail.name.asc(), Cocktail.id.asc()]
+        column = (
+            Cocktail.name if self.order == CocktailSearchOrder.NAME else Cocktail.id
+        )
+        clauses = [column.desc() if self.descending else column.asc()]
+        if column is not Cocktail.id:
+            clauses.append(Cocktail.id.asc())
+        return clauses
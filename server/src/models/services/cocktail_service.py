@@ -1,14 +1,55 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+from sqlalchemy import (
+    Boolean,
+    Integer,
+    Numeric,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    inspect,
+    literal,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from src.cache.cocktail_cache import invalidate_cocktail_payloads
+from src.database.cocktail_changes import (
+    on_cocktail_changes_committed,
+    on_cocktail_changes_committing,
+    track_cocktail_changes,
+)
 from src.database.db_service import PGDatabaseService
 from src.database.session_decorator import with_upper_scope_session
-from src.models.constants import MeasuringUnit, StepAction
+from src.dtos.cocktail_dtos import (
+    CocktailDTO,
+    DeletedCocktailsDTO,
+    IngredientDTO,
+    StepDTO,
+    TagDTO,
+)
+from src.dtos.shopping_list_dtos import ShoppingList
+from src.models.constants import (
+    COCKTAIL_DELETE_BATCH_SIZE,
+    RECIPE_DOCUMENT_BATCH_SIZE,
+    STEP_POSITION_GAP,
+    MatchMode,
+    MeasuringUnit,
+    StepAction,
+)
 from src.models.cocktail import Cocktail
 from src.models.cocktail_tag_association import CocktailTagAssociation
 from src.models.ingredient import Ingredient
+from src.models.services.cocktail_search import CocktailSearch
 from src.models.step import Step
 from src.models.tag import Tag
+from src.settings import RECIPE_DOCUMENTS_ENABLED
 
 
 class CocktailService(PGDatabaseService):
@@ -23,58 +64,805 @@ class CocktailService(PGDatabaseService):
         """
         Validates if that the recipe linked list is well-formed and has a unique head
         """
-        Step.validate_first_step_uniqueness(session, cocktail.id)
-        Step.validate_linked_list_integrity(session, cocktail.id)
+        Step.validate_recipe_integrity(session, cocktail.id)
 
-    def _get_filter_conditions(
+    def _after_cocktail_mutation(self, session: Session, cocktail_ids: List[int]):
+        """
+        Hook run by every method that changes cocktails, their recipes or their tags.
+        Bumps the revision of the cocktails in the current transaction. Their recipe
+        documents are rebuilt once, right before it commits, and their ids are
+        reported to the in-process indexes once it has committed.
+        """
+        cocktail_ids = [cocktail_id for cocktail_id in cocktail_ids if cocktail_id]
+        if not cocktail_ids:
+            return
+        session.execute(
+            update(Cocktail)
+            .where(Cocktail.id.in_(cocktail_ids))
+            .values(revision=Cocktail.revision + 1)
+            .execution_options(synchronize_session=False)
+        )
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, Cocktail) and obj.id in cocktail_ids:
+                session.expire(obj, ["revision"])
+        track_cocktail_changes(session, cocktail_ids)
+
+    def _get_recipe_load_options(self):
+        """
+        Loader options that fetch a cocktail's tags along with the cocktail rows.
+        """
+        return [
+            selectinload(Cocktail.cocktail_tag_associations).joinedload(
+                CocktailTagAssociation.tag
+            )
+        ]
+
+    def _get_ordered_steps_query(self, cocktail_ids: List[int]):
+        """
+        Query of the steps (with their ingredients) of the given cocktails, ordered
+        by cocktail and recipe position.
+        """
+        recipe_order = Step.get_recipe_order_cte(cocktail_ids)
+        return (
+            select(Step)
+            .join(recipe_order, Step.id == recipe_order.c.id)
+            .options(joinedload(Step.ingredient))
+            .order_by(recipe_order.c.cocktail_id, recipe_order.c.position)
+        )
+
+    def _link_ordered_steps(self, cocktails: List[Cocktail], steps: List[Step]):
+        """
+        Caches the ordered steps on each cocktail. The next_step and cocktail
+        references of each step are populated too, so walking them is free.
+        """
+        steps_by_cocktail_id = defaultdict(list)
+        for step in steps:
+            steps_by_cocktail_id[step.cocktail_id].append(step)
+
+        for cocktail in cocktails:
+            ordered_steps = steps_by_cocktail_id.get(cocktail.id, [])
+            for i, step in enumerate(ordered_steps):
+                following = ordered_steps[i + 1] if i + 1 < len(ordered_steps) else None
+                set_committed_value(step, "next_step", following)
+                set_committed_value(step, "cocktail", cocktail)
+            cocktail.set_ordered_steps(ordered_steps)
+
+    def _attach_ordered_steps(self, session: Session, cocktails: List[Cocktail]):
+        """
+        Loads the ordered steps (and their ingredients) of all given cocktails in a
+        single query and caches them on each cocktail.
+        """
+        if not cocktails:
+            return
+        steps = (
+            session.execute(
+                self._get_ordered_steps_query([cocktail.id for cocktail in cocktails])
+            )
+            .scalars()
+            .all()
+        )
+        self._link_ordered_steps(cocktails, list(steps))
+
+    def _get_recipe_head(
+        self, session: Session, cocktail_id: int, exclude: Optional[Step] = None
+    ) -> Optional[Step]:
+        query = select(Step).where(
+            Step.cocktail_id == cocktail_id, Step.is_recipe_first_step.is_(True)
+        )
+        if exclude is not None and exclude.id is not None:
+            query = query.where(Step.id != exclude.id)
+        return session.execute(query.limit(1)).scalars().first()
+
+    def _get_recipe_tail(
+        self, session: Session, cocktail_id: int, exclude: Optional[Step] = None
+    ) -> Optional[Step]:
+        query = select(Step).where(
+            Step.cocktail_id == cocktail_id, Step.next_step_id.is_(None)
+        )
+        if exclude is not None and exclude.id is not None:
+            query = query.where(Step.id != exclude.id)
+        return session.execute(query.limit(1)).scalars().first()
+
+    def _get_steps_from_position(
         self,
-        id: Optional[int] = None,
-        name: Optional[str] = None,
-        tags: Optional[List[Tag]] = None,
-        ingredients: Optional[List[Ingredient]] = None,
-    ):
-        filter_conditions = []
-        if id:
-            filter_conditions.append(Cocktail.id == id)
-        if name:
-            filter_conditions.append(Cocktail.name == name)
-        if tags:
-            filter_conditions.append(
-                Cocktail.cocktail_tag_associations.any(
-                    CocktailTagAssociation.tag_id.in_([tag.id for tag in tags])
+        session: Session,
+        cocktail_id: int,
+        recipe_step_order: int,
+        limit: int = 1,
+        exclude: Optional[Step] = None,
+    ) -> List[Step]:
+        """
+        Returns up to `limit` steps starting at the given 1-based recipe position,
+        read through the (cocktail_id, position) index.
+        """
+        query = select(Step).where(Step.cocktail_id == cocktail_id)
+        if exclude is not None and exclude.id is not None:
+            query = query.where(Step.id != exclude.id)
+        query = (
+            query.order_by(Step.position.asc().nulls_last())
+            .offset(recipe_step_order - 1)
+            .limit(limit)
+        )
+        return list(session.execute(query).scalars().all())
+
+    def _rebalance_step_positions(self, session: Session, cocktail_id: int) -> None:
+        """
+        Renumbers the positions of a recipe to evenly spaced gaps, following the
+        linked list order, in a single UPDATE.
+        """
+        session.flush()
+        recipe_order = Step.get_recipe_order_cte([cocktail_id])
+        session.execute(
+            update(Step)
+            .where(Step.id == recipe_order.c.id)
+            .values(position=recipe_order.c.position * STEP_POSITION_GAP)
+            .execution_options(synchronize_session=False)
+        )
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, Step):
+                session.expire(obj, ["position"])
+
+    def _get_position_between(
+        self,
+        session: Session,
+        cocktail_id: int,
+        prev: Optional[Step],
+        following: Optional[Step],
+    ) -> int:
+        """
+        Returns a free position between two neighbouring steps (either may be None),
+        renumbering the recipe first if they have no position or no gap left.
+        """
+        neighbours = [s for s in (prev, following) if s is not None]
+        if any(s.position is None for s in neighbours) or (
+            prev is not None
+            and following is not None
+            and following.position - prev.position < 2
+        ):
+            self._rebalance_step_positions(session, cocktail_id)
+
+        if prev is None and following is None:
+            return STEP_POSITION_GAP
+        if prev is None:
+            return following.position - STEP_POSITION_GAP
+        if following is None:
+            return prev.position + STEP_POSITION_GAP
+        return (prev.position + following.position) // 2
+
+    def _insert_step_at_position(
+        self,
+        session: Session,
+        cocktail: Cocktail,
+        step: Step,
+        recipe_step_order: Optional[int],
+    ) -> None:
+        """
+        Links a step that is not part of the recipe list at a 1-based position.
+        None or a position past the end appends, and anything below 2 prepends.
+        """
+        session.add(step)
+        if cocktail.id is None:
+            session.flush()
+        with session.no_autoflush:
+            if recipe_step_order is not None and recipe_step_order <= 1:
+                prev = None
+                following = self._get_recipe_head(session, cocktail.id, exclude=step)
+            else:
+                neighbours = (
+                    self._get_steps_from_position(
+                        session,
+                        cocktail.id,
+                        recipe_step_order - 1,
+                        limit=2,
+                        exclude=step,
+                    )
+                    if recipe_step_order is not None
+                    else []
                 )
+                if neighbours:
+                    prev = neighbours[0]
+                    following = neighbours[1] if len(neighbours) > 1 else None
+                else:
+                    prev = self._get_recipe_tail(session, cocktail.id, exclude=step)
+                    following = None
+
+        step.position = self._get_position_between(
+            session, cocktail.id, prev, following
+        )
+        step.next_step = following
+        step.is_recipe_first_step = prev is None
+        if prev is not None:
+            prev.next_step = step
+        elif following is not None:
+            following.is_recipe_first_step = False
+        cocktail.reset_steps_cache()
+
+    def _unlink_step(self, session: Session, step: Step) -> None:
+        """
+        Takes a step out of its recipe list, pointing its predecessor (or the head
+        flag) to the step that followed it. The step itself is left unlinked.
+        """
+        following = step.next_step
+        with session.no_autoflush:
+            prev = (
+                session.execute(select(Step).where(Step.next_step_id == step.id))
+                .scalars()
+                .first()
+            )
+        step.next_step = None
+        if step.is_recipe_first_step:
+            # Demote the old head before promoting the next one
+            step.is_recipe_first_step = False
+            session.flush()
+            if following is not None:
+                following.is_recipe_first_step = True
+        elif prev is not None:
+            prev.next_step = following
+
+    def _get_recipe_links(
+        self, session: Session, cocktail_id: int
+    ) -> Dict[int, Tuple[Optional[int], bool, Optional[int]]]:
+        """
+        Returns {step_id: (next_step_id, is_recipe_first_step, position)} for every
+        step of a recipe, in a single query.
+        """
+        return {
+            id: (next_step_id, is_first_step, position)
+            for id, next_step_id, is_first_step, position in session.execute(
+                select(
+                    Step.id, Step.next_step_id, Step.is_recipe_first_step, Step.position
+                ).where(Step.cocktail_id == cocktail_id)
+            )
+        }
+
+    def _walk_recipe_links(
+        self,
+        cocktail_id: int,
+        links: Dict[int, Tuple[Optional[int], bool, Optional[int]]],
+    ) -> List[int]:
+        """
+        Returns the step ids of a recipe in order, walking links read with
+        _get_recipe_links. Raises ValueError if they don't form a single list.
+        """
+        heads = [id for id, (_, is_first_step, _) in links.items() if is_first_step]
+        order, step_id = [], heads[0] if len(heads) == 1 else None
+        while step_id in links and len(order) < len(links):
+            order.append(step_id)
+            step_id = links[step_id][0]
+        if len(heads) > 1 or len(set(order)) != len(links):
+            raise ValueError(
+                f"Steps of cocktail {cocktail_id} don't form a single recipe list."
+            )
+        return order
+
+    def _relink_recipe(
+        self,
+        session: Session,
+        cocktail: Cocktail,
+        links: Dict[int, Tuple[Optional[int], bool, Optional[int]]],
+        ordered_step_ids: List[int],
+    ) -> bool:
+        """
+        Rewrites the links and positions of a recipe to follow ordered_step_ids with
+        a single UPDATE ... FROM (VALUES ...), covering only the steps whose values
+        change. The head and next-step constraints are deferred, so the rows can be
+        updated in any order. Returns False if nothing had to change.
+        """
+        new_links = [
+            (id, next_step_id, i == 0, (i + 1) * STEP_POSITION_GAP)
+            for i, (id, next_step_id) in enumerate(
+                zip(ordered_step_ids, ordered_step_ids[1:] + [None])
             )
-        if ingredients:
-            for ingredient in ingredients:
-                filter_conditions.append(
-                    Cocktail.all_steps.any(Step.ingredient_id == ingredient.id)
+        ]
+        changed_links = [link for link in new_links if links[link[0]] != link[1:]]
+        if not changed_links:
+            return False
+        rows = (
+            values(
+                column("id", Integer),
+                column("next_step_id", Integer),
+                column("is_recipe_first_step", Boolean),
+                column("position", Integer),
+                name="new_links",
+            )
+            .data(changed_links)
+            .cte("new_links")
+        )
+        session.execute(
+            update(Step)
+            .where(Step.id == rows.c.id)
+            .values(
+                # A lone NULL would make the VALUES column untyped
+                next_step_id=cast(rows.c.next_step_id, Integer),
+                is_recipe_first_step=rows.c.is_recipe_first_step,
+                position=rows.c.position,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, Step) and obj.id in links:
+                session.expire(
+                    obj,
+                    ["next_step_id", "next_step", "is_recipe_first_step", "position"],
                 )
-        return filter_conditions
+        cocktail.reset_steps_cache()
+        return True
 
-    @with_upper_scope_session
+    @with_upper_scope_session(read_only=True)
     def fetch_cocktails(
         self,
         id: Optional[int],
         name: Optional[str],
         tags: Optional[List[Tag]] = [],
         with_ingredients: Optional[List[Ingredient]] = None,
+        with_recipes: Optional[bool] = False,
+        tag_match_mode: Optional[MatchMode] = MatchMode.ANY,
+        ingredient_match_mode: Optional[MatchMode] = MatchMode.ALL,
         session: Session = None,
     ) -> List[Cocktail]:
         """
         Fetches cocktails from the database based on optional id, name, and tags.
         If no filters are provided, all cocktails are returned.
+        By default any of the tags and all of the ingredients must match.
+        If with_recipes is set, tags and ordered steps are loaded in bulk as well
+        (see load_recipes), instead of lazily per cocktail.
+        """
+        search = (
+            CocktailSearch()
+            .with_id(id)
+            .with_name(name)
+            .with_tags(tags, mode=tag_match_mode)
+            .with_ingredients(with_ingredients, mode=ingredient_match_mode)
+        )
+        return self.search_cocktails(search, with_recipes=with_recipes, session=session)
+
+    @with_upper_scope_session(read_only=True)
+    def search_cocktails(
+        self,
+        search: CocktailSearch,
+        with_recipes: Optional[bool] = False,
+        session: Session = None,
+    ) -> List[Cocktail]:
+        """
+        Runs a CocktailSearch as a single query. If with_recipes is set, tags and
+        ordered steps are loaded in bulk as well (see load_recipes).
+        """
+        query = search.build()
+        if with_recipes:
+            query = query.options(*self._get_recipe_load_options())
+        cocktails = list(session.execute(query).scalars().all())
+        if with_recipes:
+            self._attach_ordered_steps(session, cocktails)
+        return cocktails
+
+    @with_upper_scope_session(read_only=True)
+    def load_recipes(
+        self, cocktail_ids: List[int], session: Session = None
+    ) -> List[Cocktail]:
+        """
+        Loads cocktails with their tags, ingredients and ordered steps in a fixed
+        number of queries, regardless of how many cocktails or steps are involved:
+        one for the cocktails, one for their tags and one for all of their steps.
+        Cocktails are returned ordered by id.
         """
+        if not cocktail_ids:
+            return []
         cocktails = (
-            session.query(Cocktail)
-            .filter_by(
-                *self._get_filter_conditions(
-                    id=id, name=name, tags=tags, ingredients=with_ingredients
-                )
+            session.execute(
+                select(Cocktail)
+                .where(Cocktail.id.in_(cocktail_ids))
+                .options(*self._get_recipe_load_options())
+                .order_by(Cocktail.id)
             )
+            .scalars()
             .all()
         )
+        self._attach_ordered_steps(session, list(cocktails))
         return list(cocktails)
 
+    @with_upper_scope_session(read_only=True)
+    def load_recipe_dtos(
+        self, cocktail_ids: List[int], session: Session = None
+    ) -> List[CocktailDTO]:
+        """
+        Loads cocktails with their tags and ordered steps as read-only DTOs, ordered
+        by id. Same three queries as load_recipes, but they select plain columns and
+        build slotted DTOs from the rows, without hydrating ORM identities.
+        """
+        if not cocktail_ids:
+            return []
+        tags_by_cocktail_id = defaultdict(list)
+        for cocktail_id, tag_id, tag_name in session.execute(
+            select(CocktailTagAssociation.cocktail_id, Tag.id, Tag.name)
+            .join(Tag, Tag.id == CocktailTagAssociation.tag_id)
+            .where(CocktailTagAssociation.cocktail_id.in_(cocktail_ids))
+            .order_by(CocktailTagAssociation.cocktail_id, Tag.id)
+        ):
+            tags_by_cocktail_id[cocktail_id].append(TagDTO(tag_id, tag_name))
+
+        recipe_order = Step.get_recipe_order_cte(cocktail_ids)
+        steps_by_cocktail_id = defaultdict(list)
+        ingredients = {}
+        for (
+            cocktail_id,
+            action,
+            ingredient_id,
+            ingredient_name,
+            *step_values,
+        ) in session.execute(
+            select(
+                recipe_order.c.cocktail_id,
+                Step.action,
+                Ingredient.id,
+                Ingredient.name,
+                Step.measuring_unit,
+                Step.quantity,
+                Step.mixology_tool,
+            )
+            .join(Step, Step.id == recipe_order.c.id)
+            .outerjoin(Ingredient, Ingredient.id == Step.ingredient_id)
+            .order_by(recipe_order.c.cocktail_id, recipe_order.c.position)
+        ):
+            ingredient = None
+            if ingredient_id is not None:
+                ingredient = ingredients.get(ingredient_id)
+                if ingredient is None:
+                    ingredient = IngredientDTO(ingredient_id, ingredient_name)
+                    ingredients[ingredient_id] = ingredient
+            steps_by_cocktail_id[cocktail_id].append(
+                StepDTO(action, ingredient, *step_values)
+            )
+
+        return [
+            CocktailDTO(
+                id,
+                name,
+                description,
+                glassware,
+                revision,
+                tuple(tags_by_cocktail_id.get(id, ())),
+                tuple(steps_by_cocktail_id.get(id, ())),
+            )
+            for id, name, description, glassware, revision in session.execute(
+                select(
+                    Cocktail.id,
+                    Cocktail.name,
+                    Cocktail.description,
+                    Cocktail.glassware,
+                    Cocktail.revision,
+                )
+                .where(Cocktail.id.in_(cocktail_ids))
+                .order_by(Cocktail.id)
+            )
+        ]
+
+    @with_upper_scope_session(read_only=True)
+    def load_recipe_payloads(
+        self, cocktail_ids: List[int], session: Session = None
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Returns the (revision, payload) of the given cocktails, ordered by id, with
+        payloads in the shape of CocktailDTO.to_payload. They are read from the
+        recipe documents with a single primary key lookup. Cocktails whose document
+        is missing or behind their revision are loaded with load_recipe_dtos.
+        """
+        if not cocktail_ids:
+            return []
+        payloads = {}
+        stale_ids = list(cocktail_ids)
+        if RECIPE_DOCUMENTS_ENABLED:
+            stale_ids = []
+            for id, revision, document in session.execute(
+                select(Cocktail.id, Cocktail.revision, Cocktail.recipe_document).where(
+                    Cocktail.id.in_(cocktail_ids)
+                )
+            ):
+                if document is not None and document.get("revision") == revision:
+                    payloads[id] = (revision, document)
+                else:
+                    stale_ids.append(id)
+        for cocktail in self.load_recipe_dtos(stale_ids, session=session):
+            payloads[cocktail.id] = (cocktail.revision, cocktail.to_payload())
+        return [payloads[id] for id in sorted(payloads)]
+
+    @with_upper_scope_session
+    def rebuild_recipe_documents(
+        self, cocktail_ids: List[int], session: Session = None
+    ) -> int:
+        """
+        Rebuilds the recipe documents of the given cocktails from their current
+        rows, RECIPE_DOCUMENT_BATCH_SIZE cocktails at a time: their recipes are
+        loaded with load_recipe_dtos and written back with one executemany UPDATE
+        by primary key. Returns the number of documents written.
+        """
+        written = 0
+        for start in range(0, len(cocktail_ids), RECIPE_DOCUMENT_BATCH_SIZE):
+            cocktails = self.load_recipe_dtos(
+                cocktail_ids[start : start + RECIPE_DOCUMENT_BATCH_SIZE],
+                session=session,
+            )
+            if cocktails:
+                session.execute(
+                    update(Cocktail),
+                    [
+                        {"id": cocktail.id, "recipe_document": cocktail.to_payload()}
+                        for cocktail in cocktails
+                    ],
+                )
+            written += len(cocktails)
+        return written
+
+    def rebuild_all_recipe_documents(
+        self, batch_size: int = RECIPE_DOCUMENT_BATCH_SIZE, verbose: bool = False
+    ) -> int:
+        """
+        Rebuilds the recipe document of every cocktail, in id order, committing
+        every `batch_size` cocktails. Used to backfill the documents, e.g. after
+        enabling them or changing the payload shape.
+        Returns the number of documents written.
+        """
+        written, after_id = 0, None
+        while True:
+            revisions = self.fetch_cocktail_revisions_page(after_id, batch_size)
+            if not revisions:
+                return written
+            after_id = revisions[-1][0]
+            written += self.rebuild_recipe_documents([id for id, _ in revisions])
+            if verbose:
+                print(f"{written} recipe documents rebuilt (last id {after_id})")
+
+    @with_upper_scope_session(read_only=True)
+    def scale_recipes(
+        self,
+        cocktail_ids: List[int],
+        servings: Optional[float] = None,
+        target_volume_ml: Optional[float] = None,
+        session: Session = None,
+    ) -> List[CocktailDTO]:
+        """
+        Returns the recipes of the given cocktails scaled to a number of servings,
+        or to a total liquid volume, see unit_conversion.scale_recipes.
+        Nothing is written.
+        """
+        from src.helpers.unit_conversion import scale_recipes
+
+        return scale_recipes(
+            self.load_recipe_dtos(cocktail_ids, session=session),
+            servings=servings,
+            target_volume_ml=target_volume_ml,
+        )
+
+    @with_upper_scope_session(read_only=True)
+    def load_normalized_recipe_dtos(
+        self, cocktail_ids: List[int], session: Session = None
+    ) -> List[CocktailDTO]:
+        """
+        Returns the recipes of the given cocktails with volumes in ml and masses in
+        grams. Nothing is written.
+        """
+        from src.helpers.unit_conversion import normalize_recipes
+
+        return normalize_recipes(self.load_recipe_dtos(cocktail_ids, session=session))
+
+    @with_upper_scope_session
+    def normalize_recipe_units(self, session: Session = None) -> List[int]:
+        """
+        Rewrites every step measured in a volume or mass unit in ml or grams, for
+        all recipes at once, with a single UPDATE driven by the conversion factor
+        table. Count units are left untouched.
+        Returns the ids of the cocktails that changed.
+        """
+        from src.helpers.unit_conversion import (
+            BASE_UNITS,
+            QUANTITY_DECIMALS,
+            UNIT_DIMENSIONS,
+            UNIT_FACTORS,
+        )
+
+        unit_type = Step.__table__.c.measuring_unit.type
+        units = [
+            unit
+            for unit, dimension in UNIT_DIMENSIONS.items()
+            if dimension in BASE_UNITS and unit != BASE_UNITS[dimension]
+        ]
+        factor = case(
+            *[(Step.measuring_unit == unit, UNIT_FACTORS[unit]) for unit in units]
+        )
+        base_unit = case(
+            *[
+                (
+                    Step.measuring_unit == unit,
+                    literal(BASE_UNITS[UNIT_DIMENSIONS[unit]], unit_type),
+                )
+                for unit in units
+            ]
+        )
+        cocktail_ids = sorted(
+            set(
+                session.execute(
+                    update(Step)
+                    .where(Step.measuring_unit.in_(units))
+                    .values(
+                        quantity=func.round(
+                            cast(Step.quantity * factor, Numeric), QUANTITY_DECIMALS
+                        ),
+                        measuring_unit=base_unit,
+                    )
+                    .returning(Step.cocktail_id)
+                    .execution_options(synchronize_session="fetch")
+                ).scalars()
+            )
+        )
+        self._after_cocktail_mutation(session, cocktail_ids)
+        return cocktail_ids
+
+    @with_upper_scope_session(read_only=True)
+    def plan_shopping_list(
+        self,
+        servings_by_cocktail_id: Mapping[int, float],
+        bottle_sizes: Optional[Dict[int, float]] = None,
+        session: Session = None,
+    ) -> ShoppingList:
+        """
+        Builds the consolidated purchase list for serving each cocktail the given
+        number of times. The ADD_INGREDIENT steps of all the cocktails are read in
+        one query and totalled per ingredient and canonical unit with grouped
+        reductions, see shopping_list_planner.plan_shopping_list.
+        bottle_sizes ({ingredient_id: ml}) overrides the stored bottle sizes.
+        """
+        from src.helpers.shopping_list_planner import (
+            build_ingredient_frame,
+            plan_shopping_list,
+        )
+
+        if not servings_by_cocktail_id:
+            return ShoppingList(())
+        rows = session.execute(
+            select(
+                Cocktail.id,
+                Ingredient.id,
+                Ingredient.name,
+                Step.measuring_unit,
+                Step.quantity,
+                Ingredient.bottle_size_ml,
+            )
+            .select_from(Cocktail)
+            .outerjoin(
+                Step,
+                and_(
+                    Step.cocktail_id == Cocktail.id,
+                    Step.action == StepAction.ADD_INGREDIENT,
+                    Step.ingredient_id.is_not(None),
+                ),
+            )
+            .outerjoin(Ingredient, Ingredient.id == Step.ingredient_id)
+            .where(Cocktail.id.in_(list(servings_by_cocktail_id)))
+        ).all()
+        return plan_shopping_list(
+            build_ingredient_frame(rows), servings_by_cocktail_id, bottle_sizes
+        )
+
+    def iter_recipe_batches(self, batch_size: int = 500) -> Iterator[List[Cocktail]]:
+        """
+        Streams every cocktail, loaded with its recipe, in id order and in batches of
+        `batch_size`. Ids are read through a server-side cursor (yield_per) and the
+        recipes of each batch are loaded with load_recipes, so memory stays flat
+        however large the catalog is: a batch is expunged from the session as soon
+        as the consumer asks for the next one.
+        Not session-decorated: the generator owns its session, which stays open
+        until the generator is exhausted or closed.
+        """
+        with self.get_session() as session:
+            cocktail_ids = session.execute(
+                select(Cocktail.id)
+                .order_by(Cocktail.id)
+                .execution_options(yield_per=batch_size)
+            ).scalars()
+            for batch_ids in cocktail_ids.partitions():
+                yield self.load_recipes(list(batch_ids), session=session)
+                session.expunge_all()
+
+    @with_upper_scope_session(read_only=True)
+    def fetch_cocktail_revisions_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = 50,
+        session: Session = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Returns up to `limit` (id, revision) pairs of the cocktails following
+        `after_id`, in id order (keyset pagination over the primary key).
+        Cheap enough to compute a page ETag before loading any recipe.
+        """
+        query = select(Cocktail.id, Cocktail.revision)
+        if after_id is not None:
+            query = query.where(Cocktail.id > after_id)
+        rows = session.execute(query.order_by(Cocktail.id).limit(limit)).all()
+        return [(id, revision) for id, revision in rows]
+
+    @with_upper_scope_session(read_only=True)
+    def fetch_cocktail_revision(
+        self, cocktail_id: int, session: Session = None
+    ) -> Optional[int]:
+        """
+        Returns the current revision of a cocktail, or None if it does not exist.
+        """
+        return session.execute(
+            select(Cocktail.revision).where(Cocktail.id == cocktail_id)
+        ).scalar_one_or_none()
+
+    @with_upper_scope_session(read_only=True)
+    def render_instructions_for_cocktails(
+        self, cocktail_ids: List[int], session: Session = None
+    ) -> Dict[int, str]:
+        """
+        Renders the human-readable instructions of many cocktails at once. All their
+        ordered step rows are read in one query into a columnar frame and rendered
+        with grouped operations, instead of walking each cocktail through the ORM.
+        Returns {cocktail_id: instructions} for the cocktails found.
+        """
+        from src.helpers.batch_instruction_renderer import (
+            build_step_frame,
+            render_instructions_frame,
+        )
+
+        if not cocktail_ids:
+            return {}
+        recipe_order = Step.get_recipe_order_cte(cocktail_ids)
+        rows = session.execute(
+            select(
+                Cocktail.id,
+                recipe_order.c.position,
+                Step.action,
+                Ingredient.name,
+                Step.measuring_unit,
+                Step.quantity,
+                Step.mixology_tool,
+                Cocktail.glassware,
+            )
+            .select_from(Cocktail)
+            .outerjoin(recipe_order, recipe_order.c.cocktail_id == Cocktail.id)
+            .outerjoin(Step, Step.id == recipe_order.c.id)
+            .outerjoin(Ingredient, Ingredient.id == Step.ingredient_id)
+            .where(Cocktail.id.in_(cocktail_ids))
+        ).all()
+        return render_instructions_frame(build_step_frame(rows))
+
+    @with_upper_scope_session(read_only=True)
+    def find_makeable_cocktail_ids(
+        self,
+        ingredients: List[Ingredient],
+        max_missing: Optional[int] = 0,
+        session: Session = None,
+    ) -> Dict[int, int]:
+        """
+        Answers "what can I make with my bar": returns {cocktail_id: missing count}
+        for the cocktails needing at most `max_missing` ingredients besides the given
+        ones, fewest missing first. Served by the in-process ingredient index, which
+        only reflects committed recipes.
+        """
+        from src.indexes.ingredient_index import get_ingredient_index
+
+        index = get_ingredient_index()
+        index.sync(self.get_session)
+        return index.find_missing_at_most(
+            [ingredient.id for ingredient in ingredients], max_missing
+        )
+
+    @with_upper_scope_session(read_only=True)
+    def find_cocktail_ids_with_all_ingredients(
+        self, ingredients: List[Ingredient], session: Session = None
+    ) -> List[int]:
+        """
+        Returns the ids of the cocktails that use every given ingredient, served by
+        the in-process ingredient index.
+        """
+        from src.indexes.ingredient_index import get_ingredient_index
+
+        index = get_ingredient_index()
+        index.sync(self.get_session)
+        return index.find_containing_all([ingredient.id for ingredient in ingredients])
+
     @with_upper_scope_session
     def update_or_create(
         self,
@@ -93,11 +881,9 @@ class CocktailService(PGDatabaseService):
         existing_cocktail = session.query(Cocktail).filter_by(name=name).first()
         if existing_cocktail:
             existing_cocktail.description = description
-            # Remove old steps by deleting the head (cascades to all steps)
-            old_head = existing_cocktail.first_step
-            if old_head:
-                session.delete(old_head)
-                session.flush()
+            # Remove old steps before linking the new ones
+            if existing_cocktail.all_steps:
+                self.clear_all_recipe_steps(existing_cocktail, session=session)
                 existing_cocktail.all_steps.clear()
             self.create_step_linked_list(
                 session=session,
@@ -108,12 +894,15 @@ class CocktailService(PGDatabaseService):
             existing_cocktail = self.associate_tags_with_cocktail(
                 existing_cocktail, tags or [], session=session
             )
+            self._after_cocktail_mutation(session, [existing_cocktail.id])
             return existing_cocktail
         new_cocktail = Cocktail(name=name, description=description)
         session.add(new_cocktail)
         self.create_step_linked_list(
             session=session, steps=steps, cocktail=new_cocktail, validate=validate
         )
+        session.flush()
+        self._after_cocktail_mutation(session, [new_cocktail.id])
         return new_cocktail
 
     @with_upper_scope_session
@@ -122,19 +911,74 @@ class CocktailService(PGDatabaseService):
         Safely deletes a cocktail and all its steps and tag associations.
         Returns True if deleted, False if not found.
         """
-        cocktail = session.query(Cocktail).filter_by(id=cocktail_id).first()
-        if not cocktail:
-            return False
+        return self.delete_cocktails([cocktail_id], session=session).cocktails > 0
 
-        for step in list(cocktail.all_steps):
-            session.delete(step)
-
-        for assoc in list(cocktail.cocktail_tag_associations):
-            session.delete(assoc)
+    @with_upper_scope_session
+    def delete_cocktails(
+        self,
+        cocktail_ids: Iterable[int],
+        batch_size: int = COCKTAIL_DELETE_BATCH_SIZE,
+        session: Session = None,
+    ) -> DeletedCocktailsDTO:
+        """
+        Deletes the given cocktails with their steps and tag associations, without
+        loading them: three set-based DELETEs per `batch_size` cocktails. Children
+        are deleted explicitly so they can be counted; their ON DELETE CASCADE
+        foreign keys cover any inserted concurrently. Unknown ids are ignored.
+        Returns the number of rows deleted from each table.
+        """
+        cocktail_ids = sorted(set(cocktail_ids))
+        deleted_ids: Set[int] = set()
+        steps = tag_associations = 0
+        for start in range(0, len(cocktail_ids), batch_size):
+            batch = cocktail_ids[start : start + batch_size]
+            steps += session.execute(
+                delete(Step)
+                .where(Step.cocktail_id.in_(batch))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            tag_associations += session.execute(
+                delete(CocktailTagAssociation)
+                .where(CocktailTagAssociation.cocktail_id.in_(batch))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            deleted_ids.update(
+                session.execute(
+                    delete(Cocktail)
+                    .where(Cocktail.id.in_(batch))
+                    .returning(Cocktail.id)
+                    .execution_options(synchronize_session=False)
+                ).scalars()
+            )
+        if deleted_ids:
+            self._forget_deleted_cocktails(session, deleted_ids)
+            # No revision to bump, but caches and indexes must drop the cocktails
+            track_cocktail_changes(session, deleted_ids)
+        return DeletedCocktailsDTO(
+            cocktails=len(deleted_ids),
+            steps=steps,
+            tag_associations=tag_associations,
+        )
 
-        session.delete(cocktail)
-        session.flush()
-        return True
+    def _forget_deleted_cocktails(self, session: Session, cocktail_ids: Set[int]):
+        """
+        Evicts the rows of the given deleted cocktails from the session, so it
+        doesn't try to flush or refresh them.
+        """
+        for obj in list(session.identity_map.values()):
+            state = inspect(obj)
+            # Read without loading, the rows are gone: cocktails and tag
+            # associations lead their identity with the cocktail id, and an
+            # expired step has no cocktail_id left to check
+            if isinstance(obj, (Cocktail, CocktailTagAssociation)):
+                cocktail_id = state.identity[0]
+            elif isinstance(obj, Step):
+                cocktail_id = state.dict.get("cocktail_id")
+            else:
+                continue
+            # Expunging a cocktail also expunges the children it had loaded
+            if cocktail_id in cocktail_ids and obj in session:
+                session.expunge(obj)
 
     @with_upper_scope_session
     def remove_step_from_recipe(
@@ -148,34 +992,18 @@ class CocktailService(PGDatabaseService):
         Removes a step from a cocktail's recipe linked list, relinking adjacent nodes
         as needed. Returns True if removed, False if not found.
         """
-        steps = cocktail.steps
-        if not steps:
-            return False
-        step_to_remove = next((s for s in steps if s.id == step_id), None)
-        if not step_to_remove:
+        step_to_remove = session.get(Step, step_id)
+        if not step_to_remove or step_to_remove.cocktail_id != cocktail.id:
             return False
 
-        if step_to_remove.is_recipe_first_step:
-            next_step = step_to_remove.next_step
-            if next_step:
-                next_step.is_recipe_first_step = True
-            session.delete(step_to_remove)
-            if validate:
-                self._validate_recipe_integrity(session, cocktail)
-            session.flush()
-            return True
-
-        prev = None
-        for s in steps:
-            if s.next_step and s.next_step.id == step_id:
-                prev = s
-                break
-        if prev:
-            prev.next_step = step_to_remove.next_step
+        self._unlink_step(session, step_to_remove)
         session.delete(step_to_remove)
+        session.expire(cocktail, ["all_steps"])
+        cocktail.reset_steps_cache()
         if validate:
             self._validate_recipe_integrity(session, cocktail)
         session.flush()
+        self._after_cocktail_mutation(session, [cocktail.id])
         return True
 
     @with_upper_scope_session
@@ -187,7 +1015,9 @@ class CocktailService(PGDatabaseService):
         """
         for step in list(cocktail.all_steps):
             session.delete(step)
+        cocktail.reset_steps_cache()
         session.flush()
+        self._after_cocktail_mutation(session, [cocktail.id])
 
     @with_upper_scope_session
     def create_step(
@@ -207,13 +1037,13 @@ class CocktailService(PGDatabaseService):
             ingredient=ingredient,
             measuring_unit=measuring_unit,
             quantity=quantity,
-            cocktail=cocktail,
         )
+        step.cocktail = cocktail
 
-        # Commits after mutation and refreshes the new step.
+        # Committed by the caller's scope, like every other mutation
         session.add(step)
-        session.commit()
-        session.refresh(step)
+        session.flush()
+        self._after_cocktail_mutation(session, [cocktail.id])
         return step
 
     @with_upper_scope_session
@@ -239,11 +1069,14 @@ class CocktailService(PGDatabaseService):
             step.cocktail = cocktail
             step.next_step = next_step
             step.is_recipe_first_step = i == 0
+            step.position = (i + 1) * STEP_POSITION_GAP
             session.add(step)
             next_step = step
+        cocktail.reset_steps_cache()
         if validate:
             self._validate_recipe_integrity(session, cocktail)
         session.flush()
+        self._after_cocktail_mutation(session, [cocktail.id])
         return cocktail
 
     @with_upper_scope_session
@@ -258,35 +1091,17 @@ class CocktailService(PGDatabaseService):
         Insert a new step at a specific position in a cocktail's recipe (1-based).
         - 1 means insert as the new first step.
         - If no steps or index < 1, inserts at head.
-        - If index > length, appends at tail.
+        - If index > length or not given, appends at tail.
         - Otherwise, shifts current and later steps right.
+        Only the neighbouring steps are read, located through their positions.
         """
         cocktail = new_step.cocktail
-        session.refresh(cocktail)
-        steps = cocktail.steps
-
-        list_index = (
-            recipe_step_order - 1
-            if recipe_step_order and recipe_step_order > 0
-            else None
-        )
-
-        if not steps or (list_index and list_index < 1):
-            return self.insert_step_to_recipe_head(new_step, session)
-
-        if list_index is None or list_index > len(steps):
-            return self.append_step_to_end_of_recipe(new_step, session)
-
-        prev = steps[list_index - 1] if list_index > 0 else None
-        current = steps[list_index]
-        new_step.next_step = current
-        new_step.is_recipe_first_step = False
-        if prev:
-            prev.next_step = new_step
+        self._insert_step_at_position(session, cocktail, new_step, recipe_step_order)
         if validate:
             self._validate_recipe_integrity(session, cocktail)
         session.add_all([new_step, cocktail])
         session.flush()
+        self._after_cocktail_mutation(session, [cocktail.id])
         return cocktail
 
     @with_upper_scope_session
@@ -297,21 +1112,9 @@ class CocktailService(PGDatabaseService):
         Append a new step to the end (tail) of a cocktail's recipe. If no steps, sets
         as head.
         """
-        cocktail = new_step.cocktail
-        session.refresh(cocktail)
-        steps = cocktail.steps
-        if not steps:
-            new_step.is_recipe_first_step = True
-            new_step.next_step = None
-        else:
-            last = steps[-1]
-            last.next_step = new_step
-            new_step.next_step = None
-        if validate:
-            self._validate_recipe_integrity(session, cocktail)
-        session.add_all([new_step, cocktail])
-        session.flush()
-        return cocktail
+        return self.add_step_to_specific_recipe_position(
+            new_step, recipe_step_order=None, validate=validate, session=session
+        )
 
     @with_upper_scope_session
     def insert_step_to_recipe_head(
@@ -321,22 +1124,112 @@ class CocktailService(PGDatabaseService):
         Insert a new step at the start (head) of a cocktail's recipe.
         - New step becomes head, points to previous head if any.
         """
-        cocktail = new_step.cocktail
-        session.refresh(cocktail)
-        steps = cocktail.steps
-        if steps:
-            old_head = steps[0]
-            old_head.is_recipe_first_step = False
-            new_step.next_step = old_head
-        else:
-            new_step.next_step = None
-        new_step.is_recipe_first_step = True
-        if validate:
-            self._validate_recipe_integrity(session, cocktail)
-        session.add_all([new_step, cocktail])
-        session.flush()
+        return self.add_step_to_specific_recipe_position(
+            new_step, recipe_step_order=1, validate=validate, session=session
+        )
+
+    @with_upper_scope_session
+    def reorder_recipe(
+        self,
+        cocktail: Cocktail,
+        ordered_step_ids: List[int],
+        validate: Optional[bool] = True,
+        session: Session = None,
+    ) -> Cocktail:
+        """
+        Puts the steps of a recipe in the given order, which must list every step of
+        the cocktail exactly once. All the links and positions are rewritten in one
+        UPDATE, and the recipe is validated once at the end. Since the current order
+        is never walked, this also repairs a broken recipe list.
+        Raises ValueError if the ids are not the steps of the recipe.
+        """
+        links = self._get_recipe_links(session, cocktail.id)
+        if len(ordered_step_ids) != len(links) or set(ordered_step_ids) != set(links):
+            raise ValueError(
+                f"Steps {ordered_step_ids} are not the steps of cocktail {cocktail.id}."
+            )
+        if self._relink_recipe(session, cocktail, links, list(ordered_step_ids)):
+            if validate:
+                self._validate_recipe_integrity(session, cocktail)
+            self._after_cocktail_mutation(session, [cocktail.id])
         return cocktail
 
+    @with_upper_scope_session
+    def move_step_to_recipe_position(
+        self,
+        cocktail: Cocktail,
+        step_id: int,
+        recipe_step_order: Optional[int] = None,
+        validate: Optional[bool] = True,
+        session: Session = None,
+    ) -> bool:
+        """
+        Moves an existing step to a specific position in the recipe (1-based), with
+        the same position semantics as add_step_to_specific_recipe_position.
+        The recipe is read once and relinked with a single UPDATE, see reorder_recipe.
+        Returns True if moved, False if the step is not part of the recipe.
+        """
+        links = self._get_recipe_links(session, cocktail.id)
+        if step_id not in links:
+            return False
+
+        order = self._walk_recipe_links(cocktail.id, links)
+        order.remove(step_id)
+        if recipe_step_order is None:
+            index = len(order)
+        else:
+            index = min(max(recipe_step_order - 1, 0), len(order))
+        order.insert(index, step_id)
+        if self._relink_recipe(session, cocktail, links, order):
+            if validate:
+                self._validate_recipe_integrity(session, cocktail)
+            self._after_cocktail_mutation(session, [cocktail.id])
+        return True
+
+    @with_upper_scope_session
+    def swap_recipe_steps(
+        self,
+        cocktail: Cocktail,
+        step_id: int,
+        other_step_id: int,
+        validate: Optional[bool] = True,
+        session: Session = None,
+    ) -> bool:
+        """
+        Swaps the positions of two steps of a recipe, relinking it with a single
+        UPDATE, see reorder_recipe.
+        Returns True if swapped, False if either step is not part of the recipe.
+        """
+        links = self._get_recipe_links(session, cocktail.id)
+        if step_id not in links or other_step_id not in links:
+            return False
+
+        order = self._walk_recipe_links(cocktail.id, links)
+        i, j = order.index(step_id), order.index(other_step_id)
+        order[i], order[j] = order[j], order[i]
+        if self._relink_recipe(session, cocktail, links, order):
+            if validate:
+                self._validate_recipe_integrity(session, cocktail)
+            self._after_cocktail_mutation(session, [cocktail.id])
+        return True
+
+    @with_upper_scope_session
+    def get_step_at_position(
+        self, cocktail: Cocktail, recipe_step_order: int, session: Session = None
+    ) -> Optional[Step]:
+        """
+        Returns the step at a given position of the recipe (1-based), or None.
+        """
+        if recipe_step_order < 1:
+            return None
+        steps = self._get_steps_from_position(session, cocktail.id, recipe_step_order)
+        if steps and steps[0].position is None:
+            self._rebalance_step_positions(session, cocktail.id)
+            steps = self._get_steps_from_position(
+                session, cocktail.id, recipe_step_order
+            )
+        return steps[0] if steps else None
+
     @with_upper_scope_session
     def associate_tag_with_cocktail(
         self, cocktail: Cocktail, tag: Tag, session: Session = None
@@ -344,9 +1237,13 @@ class CocktailService(PGDatabaseService):
         """
         Associates a single tag with a cocktail.
         """
-        cocktail_tag_association = CocktailTagAssociation(cocktail=cocktail, tag=tag)
+        cocktail_tag_association = CocktailTagAssociation(
+            cocktail_id=cocktail.id, tag_id=tag.id
+        )
         session.add(cocktail_tag_association)
         cocktail.cocktail_tag_associations.append(cocktail_tag_association)
+        session.flush()
+        self._after_cocktail_mutation(session, [cocktail.id])
         return cocktail
 
     @with_upper_scope_session
@@ -367,6 +1264,8 @@ class CocktailService(PGDatabaseService):
         if association:
             cocktail.cocktail_tag_associations.remove(association)
             session.delete(association)
+            session.flush()
+            self._after_cocktail_mutation(session, [cocktail.id])
         return cocktail
 
     @with_upper_scope_session
@@ -385,6 +1284,8 @@ class CocktailService(PGDatabaseService):
                 )
                 session.add(cocktail_tag_association)
                 cocktail.cocktail_tag_associations.append(cocktail_tag_association)
+        session.flush()
+        self._after_cocktail_mutation(session, [cocktail.id])
         return cocktail
 
     @with_upper_scope_session
@@ -406,6 +1307,8 @@ class CocktailService(PGDatabaseService):
             if association:
                 cocktail.cocktail_tag_associations.remove(association)
                 session.delete(association)
+        session.flush()
+        self._after_cocktail_mutation(session, [cocktail.id])
         return cocktail
 
     @with_upper_scope_session
@@ -418,4 +1321,19 @@ class CocktailService(PGDatabaseService):
         for association in cocktail.cocktail_tag_associations:
             session.delete(association)
         cocktail.cocktail_tag_associations = []
+        session.flush()
+        self._after_cocktail_mutation(session, [cocktail.id])
         return cocktail
+
+
+# Committed cocktail changes drop exactly the cached payloads of those cocktails
+on_cocktail_changes_committed(invalidate_cocktail_payloads)
+
+
+@on_cocktail_changes_committing
+def _rebuild_changed_recipe_documents(session: Session, cocktail_ids: Set[int]):
+    # In the committing transaction, once however many changes it made
+    if RECIPE_DOCUMENTS_ENABLED:
+        CocktailService().rebuild_recipe_documents(
+            sorted(cocktail_ids), session=session
+        )
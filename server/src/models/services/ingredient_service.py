@@ -1,6 +1,9 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.cache.entity_cache import cache_named_entity, get_cached_named_entity
+from src.database.bulk_get_or_create import get_or_create_by_name
 from src.database.db_service import PGDatabaseService
 from src.database.session_decorator import with_upper_scope_session
 from src.models.ingredient import Ingredient
@@ -22,7 +25,7 @@ class IngredientService(PGDatabaseService):
         filter_conditions.append(Ingredient.name == name) if name else None
         return filter_conditions
 
-    @with_upper_scope_session
+    @with_upper_scope_session(read_only=True)
     def fetch_ingredients(
         self, id: Optional[int], name: Optional[str], session: Session = None
     ) -> List[Ingredient]:
@@ -38,23 +41,52 @@ class IngredientService(PGDatabaseService):
             .all()
         )
 
-    @with_upper_scope_session
+    @with_upper_scope_session(read_only=True)
+    def fetch_ingredients_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = 50,
+        session: Session = None,
+    ) -> List[Tuple[int, str]]:
+        """
+        Returns up to `limit` (id, name) rows of the ingredients following
+        `after_id`, in id order (keyset pagination over the primary key).
+        """
+        query = select(Ingredient.id, Ingredient.name)
+        if after_id is not None:
+            query = query.where(Ingredient.id > after_id)
+        rows = session.execute(query.order_by(Ingredient.id).limit(limit)).all()
+        return [(id, name) for id, name in rows]
+
+    @with_upper_scope_session(read_only=True)
     def fetch_ingredient_by_id(
         self, id: int, session: Session = None
     ) -> Optional[Ingredient]:
         """
-        Fetches a single ingredient by its ID.
+        Fetches a single ingredient by its ID, from the entity cache when possible.
+        A cached ingredient carries every column, bottle_size_ml included.
         """
-        return session.query(Ingredient).filter(Ingredient.id == id).first()
+        cached = get_cached_named_entity(session, Ingredient, "id", id)
+        if cached is not None:
+            return cached
+        ingredient = session.query(Ingredient).filter(Ingredient.id == id).first()
+        cache_named_entity(session, Ingredient, ingredient)
+        return ingredient
 
-    @with_upper_scope_session
+    @with_upper_scope_session(read_only=True)
     def fetch_ingredient_by_name(
         self, name: str, session: Session = None
     ) -> Optional[Ingredient]:
         """
-        Fetches a single ingredient by its name.
+        Fetches a single ingredient by its name, from the entity cache when possible.
+        A cached ingredient carries every column, bottle_size_ml included.
         """
-        return session.query(Ingredient).filter(Ingredient.name == name).first()
+        cached = get_cached_named_entity(session, Ingredient, "name", name)
+        if cached is not None:
+            return cached
+        ingredient = session.query(Ingredient).filter(Ingredient.name == name).first()
+        cache_named_entity(session, Ingredient, ingredient)
+        return ingredient
 
     @with_upper_scope_session
     def get_or_create_ingredient(
@@ -64,24 +96,15 @@ class IngredientService(PGDatabaseService):
         Retrieves an ingredient by name or creates one if none exist.
         Handles race conditions and normalizes the name.
         """
-        normalized_name = name.strip().lower()
-        old_ingredient = self.fetch_ingredient_by_name(
-            name=normalized_name, session=session
-        )
-        if old_ingredient:
-            return old_ingredient
-        new_ingredient = Ingredient(name=normalized_name)
-        session.add(new_ingredient)
-        try:
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            # Try to fetch again in case of race condition
-            old_ingredient = self.fetch_ingredient_by_name(
-                name=normalized_name, session=session
-            )
-            if old_ingredient:
-                return old_ingredient
-            raise e
-        session.refresh(new_ingredient)
-        return new_ingredient
+        return self.get_or_create_ingredients([name], session=session)[name]
+
+    @with_upper_scope_session
+    def get_or_create_ingredients(
+        self, names: List[str], session: Session = None
+    ) -> Dict[str, Ingredient]:
+        """
+        Retrieves or creates ingredients for a whole batch of names with one upsert and
+        one lookup, without committing an upper scope session.
+        Returns a mapping from each given name to its Ingredient.
+        """
+        return get_or_create_by_name(session, Ingredient, names)
@@ -0,0 +1,80 @@
+from typing import Iterable, List, Optional
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from src.database.db_service import PGDatabaseService
+from src.database.session_decorator import with_upper_scope_session
+from src.helpers.text_helper import fold_text
+from src.indexes.name_index import MODEL_BY_KIND, NameMatch, get_name_index
+from src.models.constants import NameSearchKind
+
+
+class NameSearchService(PGDatabaseService):
+    """
+    Service for free text search over cocktail, ingredient and tag names.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+    @with_upper_scope_session(read_only=True)
+    def suggest_names(
+        self,
+        query: str,
+        kinds: Optional[Iterable[NameSearchKind]] = None,
+        limit: Optional[int] = 10,
+        session: Session = None,
+    ) -> List[NameMatch]:
+        """
+        Autocompletes a name prefix from the in-memory name index, see
+        NameIndex.search. The database is only read to load the index or to pick
+        up committed cocktail changes.
+        """
+        name_index = get_name_index()
+        if name_index.needs_sync:
+            name_index.sync(self.get_session)
+        return name_index.search(query, kinds=kinds, limit=limit)
+
+    @with_upper_scope_session(read_only=True)
+    def search_names(
+        self,
+        query: str,
+        kinds: Optional[Iterable[NameSearchKind]] = None,
+        limit: Optional[int] = 10,
+        session: Session = None,
+    ) -> List[NameMatch]:
+        """
+        Ranked search of names containing the query anywhere, or similar to it,
+        accent and case insensitively. Runs on the trigram indexes over
+        f_unaccent(lower(name)); matches are ranked by trigram similarity, as
+        NameMatch ranks from 0 (identical) to 100.
+        """
+        folded_query = fold_text(query)
+        if not folded_query or limit <= 0:
+            return []
+        matches = []
+        for kind in kinds or list(NameSearchKind):
+            model = MODEL_BY_KIND[kind]
+            folded_name = func.f_unaccent(func.lower(model.name))
+            similarity = func.similarity(folded_name, folded_query)
+            rows = session.execute(
+                select(model.id, model.name, similarity)
+                .where(
+                    or_(
+                        folded_name.contains(folded_query, autoescape=True),
+                        # Similar above pg_trgm.similarity_threshold (0.3)
+                        folded_name.op("%")(folded_query),
+                    )
+                )
+                .order_by(similarity.desc(), model.name)
+                .limit(limit)
+            )
+            matches.extend(
+                (-score, name, kind.value, id) for id, name, score in rows.tuples()
+            )
+        matches.sort()
+        return [
+            NameMatch(NameSearchKind(kind), id, name, round(100 * (1 + score)))
+            for score, name, kind, id in matches[:limit]
+        ]
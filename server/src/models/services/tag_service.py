@@ -1,6 +1,9 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.cache.entity_cache import cache_named_entity, get_cached_named_entity
+from src.database.bulk_get_or_create import get_or_create_by_name
 from src.database.db_service import PGDatabaseService
 from src.database.session_decorator import with_upper_scope_session
 from src.models.tag import Tag
@@ -22,7 +25,7 @@ class TagService(PGDatabaseService):
         filter_conditions.append(Tag.name == name) if name else None
         return filter_conditions
 
-    @with_upper_scope_session
+    @with_upper_scope_session(read_only=True)
     def fetch_tags(
         self, id: Optional[int], name: Optional[str], session: Session = None
     ) -> List[Tag]:
@@ -39,19 +42,50 @@ class TagService(PGDatabaseService):
         )
         return tags
 
-    @with_upper_scope_session
+    @with_upper_scope_session(read_only=True)
+    def fetch_tags_page(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = 50,
+        session: Session = None,
+    ) -> List[Tuple[int, str]]:
+        """
+        Returns up to `limit` (id, name) rows of the tags following `after_id`, in
+        id order (keyset pagination over the primary key).
+        """
+        query = select(Tag.id, Tag.name)
+        if after_id is not None:
+            query = query.where(Tag.id > after_id)
+        rows = session.execute(query.order_by(Tag.id).limit(limit)).all()
+        return [(id, name) for id, name in rows]
+
+    @with_upper_scope_session(read_only=True)
     def fetch_tag_by_id(self, id: int, session: Session = None) -> Optional[Tag]:
         """
-        Fetches a single tag by its ID.
+        Fetches a single tag by its ID, from the entity cache when possible.
+        A cached tag, like a queried one, carries every column but not its
+        cocktail associations, which can't be loaded once its session closes.
         """
-        return session.query(Tag).filter(Tag.id == id).first()
+        cached = get_cached_named_entity(session, Tag, "id", id)
+        if cached is not None:
+            return cached
+        tag = session.query(Tag).filter(Tag.id == id).first()
+        cache_named_entity(session, Tag, tag)
+        return tag
 
-    @with_upper_scope_session
+    @with_upper_scope_session(read_only=True)
     def fetch_tag_by_name(self, name: str, session: Session = None) -> Optional[Tag]:
         """
-        Fetches a single tag by its name.
+        Fetches a single tag by its name, from the entity cache when possible.
+        A cached tag, like a queried one, carries every column but not its
+        cocktail associations, which can't be loaded once its session closes.
         """
-        return session.query(Tag).filter(Tag.name == name).first()
+        cached = get_cached_named_entity(session, Tag, "name", name)
+        if cached is not None:
+            return cached
+        tag = session.query(Tag).filter(Tag.name == name).first()
+        cache_named_entity(session, Tag, tag)
+        return tag
 
     @with_upper_scope_session
     def get_or_create_tag(self, name: str, session: Session = None) -> Tag:
@@ -59,20 +93,15 @@ class TagService(PGDatabaseService):
         Retrieves an existing tag by name or creates a new one if it doesn't exist.
         Handles race conditions and normalizes the name.
         """
-        normalized_name = name.strip().lower()
-        old_tag = self.fetch_tag_by_name(name=normalized_name, session=session)
-        if old_tag:
-            return old_tag
-        new_tag = Tag(name=normalized_name)
-        session.add(new_tag)
-        try:
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            # Try to fetch again in case of race condition
-            old_tag = self.fetch_tag_by_name(name=normalized_name, session=session)
-            if old_tag:
-                return old_tag
-            raise e
-        session.refresh(new_tag)
-        return new_tag
+        return self.get_or_create_tags([name], session=session)[name]
+
+    @with_upper_scope_session
+    def get_or_create_tags(
+        self, names: List[str], session: Session = None
+    ) -> Dict[str, Tag]:
+        """
+        Retrieves or creates tags for a whole batch of names with one upsert and
+        one lookup, without committing an upper scope session.
+        Returns a mapping from each given name to its Tag.
+        """
+        return get_or_create_by_name(session, Tag, names)
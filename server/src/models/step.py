@@ -1,13 +1,30 @@
-import re
-
-from typing import Optional
-from sqlalchemy import Integer, Float, Enum, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from typing import List, Optional, Tuple
+from sqlalchemy import (
+    CTE,
+    Integer,
+    Float,
+    Enum,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    distinct,
+    func,
+    literal_column,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.orm import Mapped, aliased, mapped_column, relationship
 
+from src.helpers.instruction_renderer import (
+    render_step,
+    step_needs_glassware,
+    step_needs_ingredient,
+)
 from src.helpers.number_helper import measured_ingredient_to_pluralized_string
 from src.models.base_model import BaseModel
 from src.models.constants import (
-    ActionToHumanReadableMapper,
+    MAX_RECIPE_STEPS,
     CocktailGlassware,
     MeasuringUnit,
     MixologyTool,
@@ -18,11 +35,32 @@ from src.models.ingredient import Ingredient
 
 class Step(BaseModel):
     __tablename__ = "steps"
+    __table_args__ = (
+        Index("ix_steps_cocktail_id_position", "cocktail_id", "position"),
+        # One head per recipe. Deferred to the end of the transaction like the next
+        # step uniqueness below, so a single UPDATE can move the head.
+        ExcludeConstraint(
+            ("cocktail_id", "="),
+            name="ex_steps_cocktail_id_first_step",
+            using="btree",
+            where=text("is_recipe_first_step"),
+            deferrable=True,
+            initially="DEFERRED",
+        ),
+        # A step is the next step of at most one step. Deferred to the end of the
+        # transaction, so relinking can go through transient duplicates.
+        UniqueConstraint(
+            "next_step_id",
+            name="uq_steps_next_step_id",
+            deferrable=True,
+            initially="DEFERRED",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     action: Mapped[StepAction] = mapped_column(Enum(StepAction), nullable=False)
     ingredient_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("ingredients.id"), nullable=True
+        Integer, ForeignKey("ingredients.id"), nullable=True, index=True
     )
     measuring_unit: Mapped[Optional[MeasuringUnit]] = mapped_column(
         Enum(MeasuringUnit), nullable=True
@@ -32,12 +70,13 @@ class Step(BaseModel):
         Enum(MixologyTool), nullable=True
     )
     next_step_id: Mapped[Optional[int]] = mapped_column(
-        Integer, ForeignKey("steps.id", ondelete="CASCADE"), nullable=True
-    )
-    next_step: Mapped[Optional["Step"]] = relationship(
-        "Step", remote_side=[id], cascade="all, delete-orphan", single_parent=True
+        Integer, ForeignKey("steps.id", ondelete="SET NULL"), nullable=True
     )
+    next_step: Mapped[Optional["Step"]] = relationship("Step", remote_side=[id])
     is_recipe_first_step: Mapped[bool] = mapped_column(default=False, nullable=False)
+    # Sparse ordinal kept alongside the linked list (see STEP_POSITION_GAP), so
+    # positional reads and inserts don't need to walk the recipe.
+    position: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     cocktail_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("cocktails.id", ondelete="CASCADE"), nullable=True
@@ -70,53 +109,144 @@ class Step(BaseModel):
         )
         return f"<Step(id={id}, action={action}, next_step={next_step_id})>"
 
+    @staticmethod
+    def get_recipe_order_cte(cocktail_ids: Optional[List[int]] = None) -> CTE:
+        """
+        Builds a recursive CTE that walks each recipe from its head through
+        next_step_id, so a whole recipe can be ordered in a single query.
+        Rows are (id, cocktail_id, next_step_id, position), position being 1-based.
+        If cocktail_ids is given, only those recipes are walked.
+        """
+        head = select(
+            Step.id,
+            Step.cocktail_id,
+            Step.next_step_id,
+            literal_column("1", Integer).label("position"),
+        ).where(Step.is_recipe_first_step.is_(True))
+        if cocktail_ids is not None:
+            head = head.where(Step.cocktail_id.in_(cocktail_ids))
+        recipe_order = head.cte("recipe_order", recursive=True)
+
+        next_step = aliased(Step)
+        return recipe_order.union_all(
+            select(
+                next_step.id,
+                next_step.cocktail_id,
+                next_step.next_step_id,
+                recipe_order.c.position + 1,
+            )
+            .join(recipe_order, next_step.id == recipe_order.c.next_step_id)
+            .where(recipe_order.c.position < MAX_RECIPE_STEPS)
+        )
+
+    @staticmethod
+    def get_recipe_integrity_report(session, cocktail_id):
+        """
+        Computes, in a single query, the figures needed to validate a recipe:
+        total steps, number of heads, steps walked from the head(s), distinct
+        steps reached, and walks cut off at MAX_RECIPE_STEPS with steps left.
+        Walking more rows than distinct steps means a cycle, a cut off walk
+        without one a recipe too long to walk, and reaching fewer steps than
+        exist otherwise means orphans.
+        """
+        recipe_order = Step.get_recipe_order_cte([cocktail_id])
+        return session.execute(
+            select(
+                select(func.count(Step.id))
+                .where(Step.cocktail_id == cocktail_id)
+                .scalar_subquery()
+                .label("total"),
+                select(func.count(Step.id))
+                .where(
+                    Step.cocktail_id == cocktail_id,
+                    Step.is_recipe_first_step.is_(True),
+                )
+                .scalar_subquery()
+                .label("heads"),
+                select(func.count(recipe_order.c.id)).scalar_subquery().label("walked"),
+                select(func.count(distinct(recipe_order.c.id)))
+                .scalar_subquery()
+                .label("reached"),
+                select(func.count(recipe_order.c.id))
+                .where(
+                    recipe_order.c.position >= MAX_RECIPE_STEPS,
+                    recipe_order.c.next_step_id.is_not(None),
+                )
+                .scalar_subquery()
+                .label("truncated"),
+            )
+        ).one()
+
+    @staticmethod
+    def count_recipe_heads(session, cocktail_id) -> int:
+        """
+        Counts the steps of a cocktail flagged as the head of its recipe.
+        """
+        return session.execute(
+            select(func.count()).where(
+                Step.cocktail_id == cocktail_id,
+                Step.is_recipe_first_step.is_(True),
+            )
+        ).scalar_one()
+
+    @staticmethod
+    def validate_recipe_integrity(session, cocktail_id):
+        """
+        Validates both the unique recipe head and the linked list integrity with a
+        single database round trip, however long the recipe is.
+        Raises ValueError on multiple heads, cycles, overlong recipes or orphan
+        steps.
+        """
+        report = Step.get_recipe_integrity_report(session, cocktail_id)
+        Step._raise_for_multiple_heads(report, cocktail_id)
+        Step._raise_for_broken_linked_list(session, report, cocktail_id)
+
     @staticmethod
     def validate_first_step_uniqueness(session, cocktail_id):
         """
         Validates that only one step per cocktail has is_recipe_first_step=True.
         Raises ValueError if more than one is found.
         """
-        from sqlalchemy import select
-        from src.models.step import Step
-
-        q = select(Step).where(
-            Step.cocktail_id == cocktail_id, Step.is_recipe_first_step is True
-        )
-        results = session.execute(q).scalars().all()
-        if len(results) > 1:
+        if Step.count_recipe_heads(session, cocktail_id) > 1:
             raise ValueError(f"Cocktail {cocktail_id} has multiple first steps.")
 
     @staticmethod
     def validate_linked_list_integrity(session, cocktail_id):
         """
         Validates that the recipe steps form a valid linked list.
-        A valid linked list has no cycles, and all nodes are reachable.
-        Raises ValueError if a cycle or orphan is detected.
+        A valid linked list has no cycles, at most MAX_RECIPE_STEPS nodes, and all
+        nodes are reachable.
+        Raises ValueError if a cycle, an overlong recipe or an orphan is detected.
         """
-        from sqlalchemy import select
-        from src.models.step import Step
+        report = Step.get_recipe_integrity_report(session, cocktail_id)
+        Step._raise_for_broken_linked_list(session, report, cocktail_id)
 
-        steps = (
-            session.execute(select(Step).where(Step.cocktail_id == cocktail_id))
-            .scalars()
-            .all()
-        )
-        seen = set()
-        first_steps = [s for s in steps if s.is_recipe_first_step]
-        if not first_steps:
-            return  # No steps, nothing to check
-        current = first_steps[0]
-        while current:
-            if current.id in seen:
-                raise ValueError(f"Cycle detected in steps for cocktail {cocktail_id}.")
-            seen.add(current.id)
-            current = current.next_step
-        all_ids = set(s.id for s in steps)
-        orphan_ids = all_ids - seen
-        if orphan_ids:
-            print(
-                f"{len(orphan_ids)} orphan steps for cocktail_id=({cocktail_id}):",
-                orphan_ids,
+    @staticmethod
+    def _raise_for_multiple_heads(report, cocktail_id):
+        if report.heads > 1:
+            raise ValueError(f"Cocktail {cocktail_id} has multiple first steps.")
+
+    @staticmethod
+    def _raise_for_broken_linked_list(session, report, cocktail_id):
+        if report.walked > report.reached:
+            raise ValueError(f"Cycle detected in steps for cocktail {cocktail_id}.")
+        if report.truncated:
+            raise ValueError(
+                f"Recipe of cocktail {cocktail_id} is longer than "
+                f"{MAX_RECIPE_STEPS} steps."
+            )
+        if report.reached < report.total:
+            # Only the failure path pays for listing the orphans
+            recipe_order = Step.get_recipe_order_cte([cocktail_id])
+            orphan_ids = set(
+                session.execute(
+                    select(Step.id).where(
+                        Step.cocktail_id == cocktail_id,
+                        Step.id.not_in(select(recipe_order.c.id)),
+                    )
+                )
+                .scalars()
+                .all()
             )
             raise ValueError(
                 f"Orphan steps detected for cocktail {cocktail_id}: {orphan_ids}"
@@ -152,20 +282,28 @@ class Step(BaseModel):
             - :object -> replaced with mixology tool (e.g. "shaker")
             - :glassware -> replaced with cocktail glassware (e.g. "martini glass")
         """
-        explanation = ActionToHumanReadableMapper.get(self.action, self.action.value)
-        if ":ingredient" in explanation:
-            human_readable_ingredient = self.get_human_readable_measured_ingredient()
-            explanation = explanation.replace(":ingredient", human_readable_ingredient)
-        if ":object" in explanation:
-            object_name = self.mixology_tool.value if self.mixology_tool else "object"
-            explanation = explanation.replace(":object", object_name)
-        if ":glassware" in explanation:
-            glassware_name = (
-                self.cocktail.glassware.value
-                if self.cocktail and self.cocktail.glassware
-                else CocktailGlassware.LOWBALL
-            )
-            explanation = explanation.replace(":glassware", glassware_name)
+        return render_step(*self.get_render_values(), glassware=self._get_glassware())
+
+    def get_render_values(self) -> Tuple:
+        """
+        Returns the (action, ingredient_name, measuring_unit, quantity,
+        mixology_tool) tuple used by the instruction renderer.
+        """
+        ingredient_name = (
+            self.ingredient.name
+            if step_needs_ingredient(self.action) and self.ingredient
+            else None
+        )
+        return (
+            self.action,
+            ingredient_name,
+            self.measuring_unit,
+            self.quantity,
+            self.mixology_tool,
+        )
 
-        explanation = re.sub(" +", " ", explanation.replace("_", " ").lower()).strip()
-        return explanation.capitalize()
+    def _get_glassware(self) -> Optional[CocktailGlassware]:
+        # Only load the cocktail when the action actually mentions the glass
+        if not step_needs_glassware(self.action) or not self.cocktail:
+            return None
+        return self.cocktail.glassware
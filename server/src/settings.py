@@ -1,10 +1,43 @@
 from dotenv import load_dotenv
 import os
 
-load_dotenv(dotenv_path=".env.development")
+# Production start: trust Alembic for the schema (one revision check instead of
+# creating tables and probing that the database exists). The deployment sets the
+# environment, so the development .env file is not read either.
+FAST_STARTUP = os.getenv("FAST_STARTUP", "false").lower() == "true"
+
+if not FAST_STARTUP:
+    load_dotenv(dotenv_path=".env.development")
 
 PG_USER = os.getenv("PG_USER")
 PG_PASSWORD = os.getenv("PG_PASSWORD")
 PG_DB_NAME = os.getenv("PG_DB_NAME")
 PG_HOST = os.getenv("PG_HOST")
 PG_PORT = os.getenv("PG_PORT")
+
+# Connection pool configuration shared by every service engine
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# In-process cache of rendered cocktails and ingredient/tag lookups. Setting
+# CACHE_MAX_ENTRIES to 0 disables it.
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "300"))
+
+# Load the autocomplete name index when the app starts instead of on the first
+# search
+NAME_INDEX_WARM_ON_STARTUP = (
+    os.getenv("NAME_INDEX_WARM_ON_STARTUP", "true").lower() == "true"
+)
+
+# Per service method call counts, SQL statements and latencies, served at /metrics
+SERVICE_METRICS_ENABLED = os.getenv("SERVICE_METRICS_ENABLED", "true").lower() == "true"
+
+# Keep a precomputed recipe document per cocktail, so reads are one primary key
+# lookup. Rebuild them with src.commands.rebuild_recipe_documents after enabling.
+RECIPE_DOCUMENTS_ENABLED = (
+    os.getenv("RECIPE_DOCUMENTS_ENABLED", "true").lower() == "true"
+)